@@ -4,16 +4,28 @@ from __future__ import annotations
 
 import logging
 
-from pyubersolar import UberSmart, close_stale_connections
-
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, CONF_NAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-
-from .const import CONF_RETRY_COUNT, DEFAULT_RETRY_COUNT, DOMAIN
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+
+from .cache import UbersolarStatusCache
+from .const import (
+    CONF_HOURLY_STATISTICS,
+    CONF_PUSH_LOG,
+    CONF_PUSH_LOG_DAYS,
+    CONF_RETRY_COUNT,
+    DATA_CONNECTION_SCHEDULER,
+    DEFAULT_CONNECTION_SLOTS,
+    DEFAULT_PUSH_LOG_DAYS,
+    DEFAULT_RETRY_COUNT,
+    DOMAIN,
+)
 from .coordinator import UbersolarDataUpdateCoordinator
+from .scheduler import UbersolarConnectionScheduler
 
 PLATFORMS: list[Platform] = [
     Platform.DATETIME,
@@ -24,11 +36,31 @@ PLATFORMS: list[Platform] = [
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the UberSolar services and websocket commands."""
+    # Deferred so importing the integration doesn't load its service schemas.
+    from .services import async_setup_services  # noqa: PLC0415
+    from .websocket_api import async_setup_websocket_api  # noqa: PLC0415
+
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up UberSolar from a config entry."""
+    # Deferred so loading the integration and its config flow stays cheap.
+    from pyubersolar import UberSmart  # noqa: PLC0415
+
     assert entry.unique_id is not None
     hass.data.setdefault(DOMAIN, {})
+    scheduler: UbersolarConnectionScheduler = hass.data.setdefault(
+        DATA_CONNECTION_SCHEDULER,
+        UbersolarConnectionScheduler(DEFAULT_CONNECTION_SLOTS),
+    )
 
     if not entry.options:
         hass.config_entries.async_update_entry(
@@ -43,20 +75,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             f"Could not find UberSolar device with address {address}"
         )
 
-    await close_stale_connections(ble_device)
-
     device = UberSmart(device=ble_device, retry_count=entry.options[CONF_RETRY_COUNT])
 
     coordinator = hass.data[DOMAIN][entry.entry_id] = UbersolarDataUpdateCoordinator(
         hass=hass,
         ble_device=ble_device,
         device=device,
+        scheduler=scheduler,
         base_unique_id=entry.unique_id,
         device_name=entry.data.get(CONF_NAME, entry.title),
+        cache=UbersolarStatusCache(hass, entry.entry_id),
     )
+    await coordinator.async_restore()
+    entry.async_on_unload(coordinator.async_start_tracking())
+    if entry.options.get(CONF_HOURLY_STATISTICS):
+        # Pulls in the recorder, so only imported when the option is on.
+        from .statistics import UbersolarStatisticsImporter  # noqa: PLC0415
+
+        entry.async_on_unload(
+            UbersolarStatisticsImporter(hass, coordinator).async_start()
+        )
+    if entry.options.get(CONF_PUSH_LOG):
+        from .push_log import UbersolarPushLog  # noqa: PLC0415
+
+        coordinator.push_log = UbersolarPushLog(
+            hass,
+            coordinator,
+            entry.options.get(CONF_PUSH_LOG_DAYS, DEFAULT_PUSH_LOG_DAYS),
+        )
+        await coordinator.push_log.async_start()
+        entry.async_on_unload(coordinator.push_log.async_stop)
 
-    await coordinator.async_config_entry_first_refresh()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Connecting can take seconds per device; don't hold up startup for it.
+    entry.async_create_background_task(
+        hass, coordinator.async_start(), f"{DOMAIN} {address} first refresh"
+    )
 
     return True
 
@@ -73,7 +127,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if coordinator:
             await coordinator.async_shutdown()
         hass.data[DOMAIN].pop(entry.entry_id)
-        if not hass.config_entries.async_entries(DOMAIN):
+        if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN)
+            hass.data.pop(DATA_CONNECTION_SCHEDULER, None)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the cached status and push log of a removed config entry."""
+    from .push_log import push_log_path, remove_push_log  # noqa: PLC0415
+
+    await UbersolarStatusCache(hass, entry.entry_id).async_remove()
+    if entry.unique_id:
+        await hass.async_add_executor_job(
+            remove_push_log, push_log_path(hass, entry.unique_id)
+        )
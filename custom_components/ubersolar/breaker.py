@@ -0,0 +1,82 @@
+"""Retry backoff and circuit breaker for UberSolar connections."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from .const import (
+    BACKOFF_BASE,
+    BACKOFF_MAX,
+    BREAKER_CLOSED,
+    BREAKER_COOLDOWN,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+)
+
+
+class UbersolarCircuitBreaker:
+    """Back off after failed polls and stop polling a device that is gone.
+
+    Each consecutive failure doubles the wait before the next poll, with
+    jitter so units that failed together don't retry together. After
+    ``BREAKER_FAILURE_THRESHOLD`` failures the breaker opens: no polls for
+    ``BREAKER_COOLDOWN`` seconds, and after that only once the device
+    advertises again, which lets a single probe through.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a closed breaker."""
+        self.state = BREAKER_CLOSED
+        self.consecutive_failures = 0
+        self.failures = 0
+        self.trips = 0
+        self.retry_at = 0.0
+        self.last_error: str | None = None
+
+    def allow(self, now: float) -> bool:
+        """Return if the device may be polled now."""
+        return self.state != BREAKER_OPEN and now >= self.retry_at
+
+    def record_success(self) -> None:
+        """Close the breaker after the device answered."""
+        self.state = BREAKER_CLOSED
+        self.consecutive_failures = 0
+        self.retry_at = 0.0
+
+    def record_failure(self, now: float, error: str) -> None:
+        """Back off, or open the breaker after too many failures in a row."""
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = error
+        if (
+            self.state == BREAKER_HALF_OPEN
+            or self.consecutive_failures >= BREAKER_FAILURE_THRESHOLD
+        ):
+            self.state = BREAKER_OPEN
+            self.trips += 1
+            self.retry_at = now + BREAKER_COOLDOWN
+            return
+
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self.consecutive_failures - 1))
+        self.retry_at = now + random.uniform(delay / 2, delay)
+
+    def probe(self, now: float) -> bool:
+        """Let one poll through after the cool-down; return if it may run."""
+        if self.state != BREAKER_OPEN or now < self.retry_at:
+            return False
+        self.state = BREAKER_HALF_OPEN
+        self.retry_at = 0.0
+        return True
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failures": self.failures,
+            "trips": self.trips,
+            "retry_in": round(max(0.0, self.retry_at - now), 1),
+            "last_error": self.last_error,
+        }
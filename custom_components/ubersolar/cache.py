@@ -0,0 +1,90 @@
+"""Last known UberSolar status, persisted across restarts."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import CACHE_MAX_AGE, CACHE_SAVE_DELAY, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+class UbersolarStatusCache:
+    """Write-behind store of the last status payload of one device.
+
+    Saves are batched: the first change after a save starts a timer, and the
+    payload current when the timer fires is written. A steady stream of pushes
+    therefore costs at most one write per ``CACHE_SAVE_DELAY`` seconds.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._status: Mapping[str, Any] = {}
+        self._updated_at = dt_util.utcnow()
+        self._save_pending = False
+
+    async def async_load(self) -> tuple[dict[str, Any], datetime] | None:
+        """Return the cached status and when it was received, unless it is too old."""
+        stored = await self._store.async_load()
+        if not stored:
+            return None
+
+        saved_at = dt_util.parse_datetime(stored.get("saved_at", ""))
+        if saved_at is None or dt_util.utcnow() - saved_at > timedelta(
+            seconds=CACHE_MAX_AGE
+        ):
+            _LOGGER.debug("Ignoring cached status saved at %s", saved_at)
+            return None
+
+        binary: list[str] = stored.get("binary", [])
+        status = {
+            key: bytes.fromhex(value) if key in binary else value
+            for key, value in stored.get("status", {}).items()
+        }
+        return status, saved_at
+
+    @callback
+    def async_schedule_save(self, status: Mapping[str, Any]) -> None:
+        """Remember the status and save it when the write-behind timer fires."""
+        self._status = status
+        self._updated_at = dt_util.utcnow()
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Save a pending status right away."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the cache file."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the payload to write."""
+        self._save_pending = False
+        return {
+            "saved_at": self._updated_at.isoformat(),
+            "binary": [
+                key for key, value in self._status.items() if isinstance(value, bytes)
+            ],
+            "status": {
+                key: value.hex() if isinstance(value, bytes) else value
+                for key, value in self._status.items()
+            },
+        }
@@ -0,0 +1,154 @@
+"""Serialized, coalescing command queue for UberSolar devices."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import COMMAND_COALESCE_DELAY, SWITCH_FIELDS
+
+if TYPE_CHECKING:
+    from .coordinator import UbersolarDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UbersolarCommandQueue:
+    """Queue writes to one device and apply them in as few BLE operations as possible.
+
+    Switch and solenoid writes are merged into the full switch state and sent
+    with a single ``toggle_switches_all`` command, so a later write to the same
+    field supersedes an earlier one that has not been sent yet. Clock writes
+    go out in the same device session.
+    Batches never run concurrently with each other or with a coordinator poll.
+    """
+
+    def __init__(self, coordinator: UbersolarDataUpdateCoordinator) -> None:
+        """Initialize the command queue."""
+        self._coordinator = coordinator
+        self._pending_switches: dict[str, int] = {}
+        self._pending_time: datetime | None = None
+        self._batch: asyncio.Future[None] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    @property
+    def busy(self) -> bool:
+        """Return if commands are pending or being sent."""
+        return self._worker is not None and not self._worker.done()
+
+    async def async_set_switches(self, values: dict[str, int]) -> None:
+        """Queue switch writes and wait until they reached the device."""
+        await self.async_apply(values, None)
+
+    async def async_set_time(self, value: datetime) -> None:
+        """Queue a clock write and wait until it reached the device."""
+        await self.async_apply({}, value)
+
+    async def async_apply(
+        self, switches: dict[str, int], time_value: datetime | None
+    ) -> None:
+        """Queue switch and clock writes together so they share one batch."""
+        pending = self._pending_switches
+        for field, value in switches.items():
+            pending[field] = value
+            # Element and pump can't both be on; the device enforces the same.
+            if value and field == "bElementOn":
+                pending["bPumpOn"] = 0
+            elif value and field == "bPumpOn":
+                pending["bElementOn"] = 0
+        if time_value is not None:
+            self._pending_time = time_value
+        # Callers share the batch; one of them giving up must not cancel it.
+        await asyncio.shield(self._async_schedule())
+
+    async def async_drain(self) -> None:
+        """Wait until every queued command has been sent."""
+        while self._worker is not None and not self._worker.done():
+            await asyncio.shield(self._worker)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the worker and fail any waiting callers."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        if self._batch is not None and not self._batch.done():
+            self._batch.cancel()
+        self._batch = None
+        self._pending_switches = {}
+        self._pending_time = None
+
+    @callback
+    def _async_schedule(self) -> asyncio.Future[None]:
+        """Return the future of the batch that includes the latest writes."""
+        if self._batch is None:
+            self._batch = self._coordinator.hass.loop.create_future()
+            self._batch.add_done_callback(_retrieve_exception)
+        if self._worker is None or self._worker.done():
+            self._worker = self._coordinator.hass.async_create_background_task(
+                self._async_run(),
+                f"{self._coordinator.device_name} command queue",
+            )
+        return self._batch
+
+    async def _async_run(self) -> None:
+        """Send queued batches until nothing is left."""
+        # Give automations that change several fields at once time to queue up.
+        await asyncio.sleep(COMMAND_COALESCE_DELAY)
+        while self._batch is not None:
+            batch, self._batch = self._batch, None
+            switches, self._pending_switches = self._pending_switches, {}
+            time_value, self._pending_time = self._pending_time, None
+            try:
+                await self._async_send(switches, time_value)
+            except Exception as err:
+                if not batch.done():
+                    batch.set_exception(err)
+            else:
+                if not batch.done():
+                    batch.set_result(None)
+
+    async def _async_send(
+        self, switches: dict[str, int], time_value: datetime | None
+    ) -> None:
+        """Send one batch of writes to the device."""
+        coordinator = self._coordinator
+        device = coordinator.device
+        async with coordinator.async_device_session(urgent=True):
+            if time_value is not None:
+                _LOGGER.debug(
+                    "%s: Sending time %s", device.name, time_value.isoformat()
+                )
+                # Goes first, so its read-back fills in any unknown switch fields.
+                await device.set_time(time_value)
+            if switches:
+                current = coordinator.data
+                if any(
+                    field not in switches and field not in current
+                    for field in SWITCH_FIELDS
+                ):
+                    # The full switch state is sent, so unknown fields must be read first.
+                    await device.update()
+                    current = coordinator.data
+                values = bytes(
+                    int(switches.get(field, current.get(field, 0)))
+                    for field in SWITCH_FIELDS
+                )
+                _LOGGER.debug(
+                    "%s: Sending switch state %s (requested %s)",
+                    device.name,
+                    values.hex(),
+                    switches,
+                )
+                await device.toggle_switches_all(values.hex())
+        coordinator.async_note_command()
+
+
+def _retrieve_exception(batch: asyncio.Future[None]) -> None:
+    """Mark a failed batch as seen when every caller stopped waiting for it."""
+    if not batch.cancelled():
+        batch.exception()
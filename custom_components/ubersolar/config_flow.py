@@ -5,7 +5,6 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from pyubersolar import UberSolarAdvertisement
 import voluptuous as vol
 
 from homeassistant.components.bluetooth import (
@@ -22,7 +21,31 @@ from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import AbortFlow
 
-from .const import CONF_RETRY_COUNT, DEFAULT_NAME, DEFAULT_RETRY_COUNT, DOMAIN
+from .const import (
+    CONF_CHIP_TEMPERATURE_DEADBAND,
+    CONF_HOURLY_STATISTICS,
+    CONF_LUX_DEADBAND,
+    CONF_PANEL_VOLTAGE_DEADBAND,
+    CONF_PUSH_LOG,
+    CONF_PUSH_LOG_DAYS,
+    CONF_RETRY_COUNT,
+    CONF_RSSI_DEADBAND,
+    CONF_SENSOR_MAX_INTERVAL,
+    CONF_SENSOR_MIN_INTERVAL,
+    DEFAULT_CHIP_TEMPERATURE_DEADBAND,
+    DEFAULT_HOURLY_STATISTICS,
+    DEFAULT_LUX_DEADBAND,
+    DEFAULT_NAME,
+    DEFAULT_PANEL_VOLTAGE_DEADBAND,
+    DEFAULT_PUSH_LOG,
+    DEFAULT_PUSH_LOG_DAYS,
+    DEFAULT_RETRY_COUNT,
+    DEFAULT_RSSI_DEADBAND,
+    DEFAULT_SENSOR_MAX_INTERVAL,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    DOMAIN,
+    LOCAL_NAME_PREFIX,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +61,17 @@ def short_address(address: str) -> str:
     return f"{results[-2].upper()}{results[-1].upper()}"[-4:]
 
 
+def device_name(discovery_info: BluetoothServiceInfoBleak) -> str:
+    """Return the advertised name of a UberSolar."""
+    return discovery_info.name or discovery_info.device.name or DEFAULT_NAME
+
+
+def is_ubersmart(discovery_info: BluetoothServiceInfoBleak) -> bool:
+    """Return if an advertisement comes from an UberSmart controller."""
+    name = discovery_info.name or discovery_info.device.name
+    return name is not None and name.startswith(LOCAL_NAME_PREFIX)
+
+
 class UbersolarConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     """Handle a config flow for UberSolar."""
 
@@ -53,27 +87,20 @@ class UbersolarConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
 
     def __init__(self) -> None:
         """Initialize the config flow."""
-        self._discovered_adv: UberSolarAdvertisement | None = None
-        self._discovered_advs: dict[str, UberSolarAdvertisement] = {}
+        self._discovered_adv: BluetoothServiceInfoBleak | None = None
+        self._discovered_advs: dict[str, BluetoothServiceInfoBleak] = {}
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
     ) -> ConfigFlowResult:
         """Handle the bluetooth discovery step."""
         _LOGGER.debug("Discovered bluetooth device: %s", discovery_info.as_dict())
-        device_name = discovery_info.name or discovery_info.device.name or DEFAULT_NAME
         await self.async_set_unique_id(format_unique_id(discovery_info.address))
         self._abort_if_unique_id_configured()
-        self._discovered_adv = UberSolarAdvertisement(
-            discovery_info.device.address,
-            device_name,
-            discovery_info.device,
-            discovery_info.advertisement.rssi,
-            True,
-        )
+        self._discovered_adv = discovery_info
         self.context["title_placeholders"] = {
-            "name": self._discovered_adv.name,
-            "address": short_address(self._discovered_adv.address),
+            "name": device_name(discovery_info),
+            "address": short_address(discovery_info.address),
         }
         return await self.async_step_confirm()
 
@@ -84,7 +111,7 @@ class UbersolarConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
         assert self._discovered_adv is not None
 
         return self.async_create_entry(
-            title=self._discovered_adv.name,
+            title=device_name(self._discovered_adv),
             data={
                 **user_input,
                 CONF_ADDRESS: self._discovered_adv.address,
@@ -103,37 +130,25 @@ class UbersolarConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
         return self.async_show_form(
             step_id="confirm",
             data_schema=vol.Schema({}),
-            description_placeholders={"name": self._discovered_adv.name},
+            description_placeholders={"name": device_name(self._discovered_adv)},
         )
 
     @callback
     def _async_discover_devices(self) -> None:
         current_addresses = self._async_current_ids()
-        for discovery_info in async_discovered_service_info(self.hass, True):
-            address = discovery_info.address
-            if (
-                format_unique_id(address) in current_addresses
-                or address in self._discovered_advs
-            ):
-                continue
-            device_name = (
-                discovery_info.name or discovery_info.device.name or DEFAULT_NAME
-            )
-            parsed = UberSolarAdvertisement(
-                discovery_info.device.address,
-                device_name,
-                discovery_info.device,
-                discovery_info.advertisement.rssi,
-                True,
-            )
-            if not parsed:
-                continue
-            self._discovered_advs[address] = parsed
+        # The name prefix check is cheap enough to run on every advertisement,
+        # so unrelated devices are dropped before anything else is done.
+        self._discovered_advs = {
+            discovery_info.address: discovery_info
+            for discovery_info in async_discovered_service_info(self.hass, True)
+            if is_ubersmart(discovery_info)
+            and format_unique_id(discovery_info.address) not in current_addresses
+        }
 
         if not self._discovered_advs:
             raise AbortFlow("no_unconfigured_devices")
 
-    async def _async_set_device(self, discovery: UberSolarAdvertisement) -> None:
+    async def _async_set_device(self, discovery: BluetoothServiceInfoBleak) -> None:
         """Set the device to work with."""
         self._discovered_adv = discovery
         address = discovery.address
@@ -147,7 +162,7 @@ class UbersolarConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     ) -> ConfigFlowResult:
         """Handle the user step to pick discovered device."""
         errors: dict[str, str] = {}
-        device_adv: UberSolarAdvertisement | None = None
+        device_adv: BluetoothServiceInfoBleak | None = None
         if user_input is not None:
             device_adv = self._discovered_advs[user_input[CONF_ADDRESS]]
             await self._async_set_device(device_adv)
@@ -167,7 +182,7 @@ class UbersolarConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                 {
                     vol.Required(CONF_ADDRESS): vol.In(
                         {
-                            address: parsed.address
+                            address: f"{device_name(parsed)} ({address})"
                             for address, parsed in self._discovered_advs.items()
                         }
                     ),
@@ -188,11 +203,39 @@ class UbersolarOptionsFlowHandler(OptionsFlowWithReload):
             # Update common entity options for all other entities.
             return self.async_create_entry(title="", data=user_input)
 
-        base_schema = vol.Schema({vol.Required(CONF_RETRY_COUNT): int})
+        defaults: dict[str, Any] = {
+            CONF_RETRY_COUNT: DEFAULT_RETRY_COUNT,
+            CONF_LUX_DEADBAND: DEFAULT_LUX_DEADBAND,
+            CONF_PANEL_VOLTAGE_DEADBAND: DEFAULT_PANEL_VOLTAGE_DEADBAND,
+            CONF_CHIP_TEMPERATURE_DEADBAND: DEFAULT_CHIP_TEMPERATURE_DEADBAND,
+            CONF_RSSI_DEADBAND: DEFAULT_RSSI_DEADBAND,
+            CONF_SENSOR_MIN_INTERVAL: DEFAULT_SENSOR_MIN_INTERVAL,
+            CONF_SENSOR_MAX_INTERVAL: DEFAULT_SENSOR_MAX_INTERVAL,
+            CONF_HOURLY_STATISTICS: DEFAULT_HOURLY_STATISTICS,
+            CONF_PUSH_LOG: DEFAULT_PUSH_LOG,
+            CONF_PUSH_LOG_DAYS: DEFAULT_PUSH_LOG_DAYS,
+        }
+        deadband = vol.All(vol.Coerce(float), vol.Range(min=0))
+        interval = vol.All(vol.Coerce(int), vol.Range(min=0))
+        base_schema = vol.Schema(
+            {
+                vol.Required(CONF_RETRY_COUNT): int,
+                vol.Required(CONF_LUX_DEADBAND): deadband,
+                vol.Required(CONF_PANEL_VOLTAGE_DEADBAND): deadband,
+                vol.Required(CONF_CHIP_TEMPERATURE_DEADBAND): deadband,
+                vol.Required(CONF_RSSI_DEADBAND): deadband,
+                vol.Required(CONF_SENSOR_MIN_INTERVAL): interval,
+                vol.Required(CONF_SENSOR_MAX_INTERVAL): interval,
+                vol.Required(CONF_HOURLY_STATISTICS): bool,
+                vol.Required(CONF_PUSH_LOG): bool,
+                vol.Required(CONF_PUSH_LOG_DAYS): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+            }
+        )
         suggested_values = {
-            CONF_RETRY_COUNT: self.config_entry.options.get(
-                CONF_RETRY_COUNT, DEFAULT_RETRY_COUNT
-            )
+            key: self.config_entry.options.get(key, default)
+            for key, default in defaults.items()
         }
 
         return self.async_show_form(
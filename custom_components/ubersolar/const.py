@@ -3,16 +3,149 @@ DOMAIN = "ubersolar"
 MANUFACTURER = "ubersolar"
 MODEL = "UberSmart"
 
+# Shared BLE connection scheduler
+DATA_CONNECTION_SCHEDULER = f"{DOMAIN}_connection_scheduler"
+DEFAULT_CONNECTION_SLOTS = 3
+# Seconds between checks whether a device's idle link was closed, which frees
+# its slot
+SLOT_RELEASE_CHECK_INTERVAL = 1.0
+UNKNOWN_SOURCE = "unknown"
+
 # Config Attributes
 DEFAULT_NAME = "Ubersolar"
+# Advertised local name prefix, as matched in manifest.json
+LOCAL_NAME_PREFIX = "UberSmart_"
 
 # Config Defaults
 DEFAULT_RETRY_COUNT = 3
+DEFAULT_LUX_DEADBAND = 50.0
+DEFAULT_PANEL_VOLTAGE_DEADBAND = 0.5
+DEFAULT_CHIP_TEMPERATURE_DEADBAND = 0.5
+DEFAULT_RSSI_DEADBAND = 3.0
+DEFAULT_SENSOR_MIN_INTERVAL = 30
+DEFAULT_SENSOR_MAX_INTERVAL = 900
+DEFAULT_HOURLY_STATISTICS = False
+DEFAULT_PUSH_LOG = False
+DEFAULT_PUSH_LOG_DAYS = 14
 
 # Config Options
 CONF_RETRY_COUNT = "retry_count"
+CONF_LUX_DEADBAND = "lux_deadband"
+CONF_PANEL_VOLTAGE_DEADBAND = "panel_voltage_deadband"
+CONF_CHIP_TEMPERATURE_DEADBAND = "chip_temperature_deadband"
+CONF_RSSI_DEADBAND = "rssi_deadband"
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+CONF_SENSOR_MAX_INTERVAL = "sensor_max_interval"
+CONF_HOURLY_STATISTICS = "hourly_statistics"
+CONF_PUSH_LOG = "push_log"
+CONF_PUSH_LOG_DAYS = "push_log_days"
+
+# Fields imported as hourly statistics when CONF_HOURLY_STATISTICS is set
+STATISTICS_FIELDS = ("fWaterTemperature", "fStoredWater", "wLux", "fPanelVoltage")
+
+# Adaptive polling, in seconds
+DEFAULT_POLL_INTERVAL = 60
+FAST_POLL_INTERVAL = 30
+PUSH_HEALTHY_POLL_INTERVAL = 180
+NIGHT_POLL_INTERVAL = 600
+COMMAND_FAST_POLL_WINDOW = 120
+PUSH_HEALTHY_WINDOW = 90
+NIGHT_CONFIRM_POLLS = 2
+NIGHT_LUX_THRESHOLD = 5
+NIGHT_PANEL_VOLTAGE_THRESHOLD = 1.0
+
+# Push-gap watchdog: the push cadence is learned as a moving average of the
+# gaps between pushes while the link is held. Once enough gaps were seen,
+# healthy pushes replace polling for as long as the link stays open, and a gap
+# of PUSH_GAP_FACTOR times the cadence (in seconds, within
+# PUSH_GAP_MIN_THRESHOLD and PUSH_HEALTHY_WINDOW) on an open link triggers a
+# poll right away.
+PUSH_CADENCE_SMOOTHING = 0.2
+PUSH_CADENCE_MIN_SAMPLES = 5
+PUSH_GAP_FACTOR = 3.0
+PUSH_GAP_MIN_THRESHOLD = 10
+
+# Retry backoff and circuit breaker, in seconds
+BACKOFF_BASE = 15
+BACKOFF_MAX = 300
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN = 600
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Command queue
+COMMAND_COALESCE_DELAY = 0.2
+# Solenoid modes in the order of their device values
+SOLENOID_MODES = ["off", "on", "auto"]
+# Switch state fields in the order the device expects them
+SWITCH_FIELDS = ("bElementOn", "bPumpOn", "bHolidayMode", "eSolenoidMode")
+
+# Raw push history and the aggregate sensors built from it. Only changes are
+# recorded, so each ring covers the window at up to about 3.4 changes per second
+# of its field.
+HISTORY_FIELDS = ("fWaterTemperature", "fManifoldTemperature", "wLux", "fPanelVoltage")
+HISTORY_CAPACITY = 1024
+AGGREGATE_WINDOW = 300
+AGGREGATE_UPDATE_INTERVAL = 60
+
+# Advertisement RSSI: weight of each new reading in the moving average, and the
+# key its listeners are notified under.
+RSSI_SMOOTHING = 0.3
+RSSI_KEY = "rssi"
+
+# Setup progress reported in diagnostics.
+SETUP_STATE_INITIALIZING = "initializing"
+SETUP_STATE_RESTORED = "restored"
+SETUP_STATE_READY = "ready"
+
+# Last known status cache, in seconds.
+CACHE_SAVE_DELAY = 300
+CACHE_MAX_AGE = 86400
+
+# On-disk push log: bytes per file and seconds between writes of the buffered
+# records. The files kept per device hold CONF_PUSH_LOG_DAYS of pushes at
+# PUSH_LOG_PUSH_RATE pushes per second and PUSH_LOG_BYTES_PER_PUSH bytes each,
+# measured with the clock and one other field changing on every push.
+PUSH_LOG_FILE_SIZE = 1 << 20
+PUSH_LOG_PUSH_RATE = 1.0
+PUSH_LOG_BYTES_PER_PUSH = 64
+PUSH_LOG_FLUSH_INTERVAL = 60
+
+# Refresh of the diagnostic counter and latency sensors, in seconds.
+COORDINATOR_SENSOR_UPDATE_INTERVAL = 60
+
+POLL_REASON_DEFAULT = "default"
+POLL_REASON_COMMAND = "command"
+POLL_REASON_PUSH_GAP = "push_gap"
+POLL_REASON_PUSH_HEALTHY = "push_healthy"
+POLL_REASON_PUSH_ONLY = "push_only"
+POLL_REASON_NIGHT = "night"
 
 # Deprecated config Entry Options to be removed in 2023.4
 CONF_TIME_BETWEEN_UPDATE_COMMAND = "update_time"
 CONF_RETRY_TIMEOUT = "retry_timeout"
 CONF_SCAN_TIMEOUT = "scan_timeout"
+
+# Services
+SERVICE_APPLY_SETTINGS = "apply_settings"
+SERVICE_FLEET_REFRESH = "fleet_refresh"
+SERVICE_FLEET_SET = "fleet_set"
+ATTR_ELEMENT = "element"
+ATTR_PUMP = "pump"
+ATTR_HOLIDAY_MODE = "holiday_mode"
+ATTR_SOLENOID_MODE = "solenoid_mode"
+ATTR_TIME = "time"
+ATTR_MAX_PARALLEL = "max_parallel"
+ATTR_TIMEOUT = "timeout"
+# Seconds to wait for a push that confirms a write before polling for it
+CONFIRM_TIMEOUT = 10
+# Seconds a reported clock may differ from the one written and still confirm it
+CLOCK_CONFIRM_TOLERANCE = 5
+# Fleet services: devices handled at once and seconds allowed per device
+DEFAULT_FLEET_PARALLEL = 4
+DEFAULT_FLEET_TIMEOUT = 60
+
+# Websocket push stream: messages per second per subscription
+DEFAULT_STREAM_RATE = 5.0
+MAX_STREAM_RATE = 50.0
@@ -3,44 +3,126 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
-from datetime import timedelta
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
 import logging
 import time
+from typing import TYPE_CHECKING, Any
 
-from bleak.backends.device import BLEDevice
-from pyubersolar import UberSmart
-from pyubersolar.models import UberSmartStatus
+from homeassistant.components import bluetooth
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from .breaker import UbersolarCircuitBreaker
+from .cache import UbersolarStatusCache
+from .commands import UbersolarCommandQueue
+from .const import (
+    BREAKER_OPEN,
+    COMMAND_FAST_POLL_WINDOW,
+    DEFAULT_POLL_INTERVAL,
+    DOMAIN,
+    FAST_POLL_INTERVAL,
+    HISTORY_CAPACITY,
+    HISTORY_FIELDS,
+    NIGHT_CONFIRM_POLLS,
+    NIGHT_LUX_THRESHOLD,
+    NIGHT_PANEL_VOLTAGE_THRESHOLD,
+    NIGHT_POLL_INTERVAL,
+    POLL_REASON_COMMAND,
+    POLL_REASON_DEFAULT,
+    POLL_REASON_NIGHT,
+    POLL_REASON_PUSH_GAP,
+    POLL_REASON_PUSH_HEALTHY,
+    POLL_REASON_PUSH_ONLY,
+    PUSH_CADENCE_MIN_SAMPLES,
+    PUSH_CADENCE_SMOOTHING,
+    PUSH_GAP_FACTOR,
+    PUSH_GAP_MIN_THRESHOLD,
+    PUSH_HEALTHY_POLL_INTERVAL,
+    PUSH_HEALTHY_WINDOW,
+    RSSI_KEY,
+    RSSI_SMOOTHING,
+    SETUP_STATE_INITIALIZING,
+    SETUP_STATE_READY,
+    SETUP_STATE_RESTORED,
+    SLOT_RELEASE_CHECK_INTERVAL,
+    UNKNOWN_SOURCE,
+)
+from .history import UbersolarHistory
+from .models import StatusSnapshot
+from .scheduler import SlotLease, UbersolarConnectionScheduler
+from .stats import CoordinatorStats
 
-from .const import DOMAIN
+if TYPE_CHECKING:
+    from bleak.backends.device import BLEDevice
+    from pyubersolar import UberSmart
+
+    from .push_log import UbersolarPushLog
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class UbersolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, UberSmartStatus]]):
+class UbersolarDataUpdateCoordinator(DataUpdateCoordinator[StatusSnapshot]):
     """Class to manage fetching ubersolar data."""
 
+    last_update_success: bool
+    update_interval: timedelta | None
+
     def __init__(
         self,
         hass: HomeAssistant,
         ble_device: BLEDevice,
         device: UberSmart,
+        scheduler: UbersolarConnectionScheduler,
         base_unique_id: str,
         device_name: str,
+        cache: UbersolarStatusCache | None = None,
     ) -> None:
         """Initialize global ubersolar data updater."""
 
         self.ble_device = ble_device
+        self._applied_ble_device = ble_device
         self.device: UberSmart = device
+        self.scheduler = scheduler
         self.device_name = device_name
         self.address = device.get_address()
         self.base_unique_id = base_unique_id
+        self.cache = cache
+        self.push_log: UbersolarPushLog | None = None
+        self.restored_at: datetime | None = None
         self._last_poll_monotonic: float | None = None
-        self._last_push_state: dict[str, UberSmartStatus] = {}
+        self._last_unsolicited_push_monotonic: float | None = None
+        self._link_closed_monotonic: float | None = None
+        self._last_command_monotonic: float | None = None
+        self._dark_polls = 0
+        self.push_cadence: float | None = None
+        self._push_cadence_samples = 0
+        self._cancel_push_watchdog: CALLBACK_TYPE | None = None
+        self.poll_interval_reason = POLL_REASON_DEFAULT
         self._initial_push_event: asyncio.Event = asyncio.Event()
+        self._key_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        # Snapshot a running poll started from; its pushes are notified at the end.
+        self._poll_base: StatusSnapshot | None = None
+        # None outside a refresh; True once its poll woke the changed keys itself.
+        self._refresh_keys_notified: bool | None = None
+        self._delta_listeners: list[Callable[[float, dict[str, Any]], None]] = []
+        self.device_lock = asyncio.Lock()
+        self.stats = CoordinatorStats()
+        self.breaker = UbersolarCircuitBreaker()
+        self._session_started: float | None = None
+        self._slot: SlotLease | None = None
+        self._slot_wait_source: str | None = None
+        self._cancel_slot_check: CALLBACK_TYPE | None = None
+        self.session_source: str | None = None
+        self.rssi: int | None = None
+        self.rssi_smoothed: float | None = None
+        self.advertisement_source: str | None = None
+        self.present = True
+        self.commands = UbersolarCommandQueue(self)
+        self.history = UbersolarHistory(HISTORY_FIELDS, HISTORY_CAPACITY)
         self._unsubscribe_device: Callable[[], None] | None = self.device.subscribe(
             self._handle_device_push
         )
@@ -48,78 +130,588 @@ class UbersolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, UberSmartSt
             hass=hass,
             logger=_LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=60),
+            update_interval=timedelta(seconds=DEFAULT_POLL_INTERVAL),
             update_method=self._async_update_data,
+            always_update=False,
+        )
+        self.data = StatusSnapshot()
+
+    @callback
+    def async_add_key_listener(
+        self, keys: Iterable[str], update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for pushes that change any of the given status keys."""
+        subscribed = tuple(dict.fromkeys(keys))
+        for key in subscribed:
+            self._key_listeners.setdefault(key, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the key listener."""
+            for key in subscribed:
+                listeners = self._key_listeners.get(key)
+                if listeners and update_callback in listeners:
+                    listeners.remove(update_callback)
+                    if not listeners:
+                        del self._key_listeners[key]
+
+        return remove_listener
+
+    @callback
+    def async_add_delta_listener(
+        self, delta_callback: Callable[[float, dict[str, Any]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for the fields each push changed, with its monotonic time."""
+        self._delta_listeners.append(delta_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the delta listener."""
+            if delta_callback in self._delta_listeners:
+                self._delta_listeners.remove(delta_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_set_pushed_data(
+        self, data: StatusSnapshot, changed_keys: Iterable[str]
+    ) -> None:
+        """Store pushed data and wake only the listeners of changed keys."""
+        previous_update_success = self.last_update_success
+        self.data = data
+        self.last_update_success = True
+
+        if not previous_update_success:
+            # Entities were marked unavailable; every one of them must refresh.
+            self.async_update_listeners()
+            if self._poll_base is not None:
+                self._poll_base = data
+            return
+
+        if self._poll_base is not None:
+            # A poll delivers several pushes; notify once when it is done.
+            return
+        self._async_notify_keys(changed_keys)
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh, letting a poll that notified its keys skip the full fan-out."""
+        self._refresh_keys_notified = False
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            self._refresh_keys_notified = None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Wake every listener, unless the refresh's poll already woke its keys."""
+        if self._refresh_keys_notified:
+            self._refresh_keys_notified = False
+            return
+        super().async_update_listeners()
+
+    @callback
+    def _async_notify_keys(self, changed_keys: Iterable[str]) -> None:
+        """Call each listener of the changed keys once."""
+        pending: dict[CALLBACK_TYPE, None] = {}
+        for key in changed_keys:
+            for update_callback in self._key_listeners.get(key, ()):
+                pending[update_callback] = None
+
+        for update_callback in pending:
+            update_callback()
+
+    @property
+    def setup_state(self) -> str:
+        """Return if the coordinator is still waiting for its first data."""
+        if not self.data.version:
+            return SETUP_STATE_INITIALIZING
+        return SETUP_STATE_RESTORED if self.restored_at else SETUP_STATE_READY
+
+    async def async_restore(self) -> None:
+        """Seed the data with the last status cached before a restart.
+
+        The cached status counts as the last poll, so the device is only
+        polled again once it would have been had Home Assistant kept running.
+        """
+        if self.cache is None or (cached := await self.cache.async_load()) is None:
+            return
+
+        status, self.restored_at = cached
+        self.data = self.data.evolve(status)
+        age = (dt_util.utcnow() - self.restored_at).total_seconds()
+        self._last_poll_monotonic = time.monotonic() - age
+        _LOGGER.debug(
+            "%s: Restored cached status from %.0fs ago", self.device.name, age
         )
 
+    async def async_start(self) -> None:
+        """Clean up stale connections and fetch the first data.
+
+        Runs in the background after setup so Home Assistant doesn't wait for
+        every device to connect before it finishes starting.
+        """
+        from pyubersolar import close_stale_connections  # noqa: PLC0415
+
+        async with self.async_device_session():
+            await close_stale_connections(self.ble_device)
+        if self.restored_at is not None:
+            # Entities already show the cached status; poll on the normal schedule.
+            return
+        await self.async_refresh()
+        if not self.last_update_success:
+            _LOGGER.debug(
+                "%s: First refresh failed; retrying on the poll schedule",
+                self.device.name,
+            )
+
+    @callback
+    def async_start_tracking(self) -> CALLBACK_TYPE:
+        """Follow the advertisements and presence of the device.
+
+        Returns a callback that stops tracking.
+        """
+        self.present = bluetooth.async_address_present(self.hass, self.address, True)
+        if service_info := bluetooth.async_last_service_info(
+            self.hass, self.address, False
+        ):
+            self._async_handle_advertisement(
+                service_info, bluetooth.BluetoothChange.ADVERTISEMENT
+            )
+        unsubscribers = (
+            bluetooth.async_register_callback(
+                self.hass,
+                self._async_handle_advertisement,
+                bluetooth.BluetoothCallbackMatcher(
+                    address=self.address, connectable=False
+                ),
+                bluetooth.BluetoothScanningMode.PASSIVE,
+            ),
+            bluetooth.async_track_unavailable(
+                self.hass, self._async_handle_unavailable, self.address, True
+            ),
+        )
+
+        @callback
+        def stop_tracking() -> None:
+            """Stop following the device."""
+            for unsubscribe in unsubscribers:
+                unsubscribe()
+
+        return stop_tracking
+
+    @callback
+    def _async_set_present(self, present: bool) -> None:
+        """Update presence and refresh every entity when it flips."""
+        if present == self.present:
+            return
+        _LOGGER.debug(
+            "%s: Device is %s",
+            self.device.name,
+            "reachable again" if present else "no longer reachable",
+        )
+        self.present = present
+        self.async_update_listeners()
+
+    @callback
+    def _async_handle_unavailable(
+        self, service_info: bluetooth.BluetoothServiceInfoBleak
+    ) -> None:
+        """Mark the device absent when no connectable scanner hears it anymore."""
+        self._async_set_present(False)
+
+    @callback
+    def _async_handle_advertisement(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Cache the signal strength and source of an advertisement."""
+        rssi = service_info.rssi
+        self.rssi = rssi
+        if service_info.connectable:
+            # The manager hands us the best connectable path it knows of.
+            self.ble_device = service_info.device
+            self.advertisement_source = service_info.source
+            self._async_set_present(True)
+            if self.breaker.state == BREAKER_OPEN and self.breaker.probe(
+                time.monotonic()
+            ):
+                _LOGGER.debug(
+                    "%s: Device advertises again; probing it", self.device.name
+                )
+                self.hass.async_create_background_task(
+                    self.async_request_refresh(), f"{DOMAIN} {self.address} probe"
+                )
+        previous = self.rssi_smoothed
+        if previous is None:
+            self.rssi_smoothed = float(rssi)
+        else:
+            self.rssi_smoothed = previous + RSSI_SMOOTHING * (rssi - previous)
+        if previous is None or round(previous) != round(self.rssi_smoothed):
+            self._async_notify_keys((RSSI_KEY,))
+
+    @property
+    def connection_source(self) -> str:
+        """Return the connectable adapter or proxy that last heard the device."""
+        return self.advertisement_source or UNKNOWN_SOURCE
+
+    @callback
+    def _async_apply_ble_device(self) -> None:
+        """Make the next connection go through the adapter that hears us best."""
+        if self.ble_device is self._applied_ble_device:
+            return
+        _LOGGER.debug(
+            "%s: Connecting through %s from now on",
+            self.device.name,
+            self.connection_source,
+        )
+        # pyubersolar 0.1.5 has no setter for the BLE device; it reads the
+        # private _device attribute on every connect. This is the only place
+        # that writes it, and tests/test_coordinator.py fails if it goes away.
+        self.device._device = self.ble_device
+        self._applied_ble_device = self.ble_device
+
+    @asynccontextmanager
+    async def async_device_session(self, urgent: bool = False) -> AsyncIterator[None]:
+        """Hold the device and a connection slot for a series of operations.
+
+        The slot stays taken after the session for as long as the library keeps
+        the link open, and the next session reuses it.
+        """
+        if urgent and self._slot_wait_source is not None:
+            # A poll holding the device is still queued for a slot; move it up
+            # so this command can follow it over the same link.
+            self.scheduler.async_expedite(self._slot_wait_source, self.device.name)
+        async with self.device_lock:
+            self._async_apply_ble_device()
+            source = self.connection_source
+            self._async_cancel_slot_check()
+            if self._slot is not None and self._slot.source != source:
+                self._async_release_slot()
+            if self._slot is None:
+                self._slot_wait_source = source
+                try:
+                    self._slot = await self.scheduler.async_acquire(
+                        source, self.device.name, urgent=urgent
+                    )
+                finally:
+                    self._slot_wait_source = None
+            self.session_source = source
+            self._session_started = time.monotonic()
+            try:
+                yield
+            finally:
+                self._session_started = None
+                self._async_hold_slot()
+
+    @property
+    def link_open(self) -> bool:
+        """Return if the library still holds a connection to the device."""
+        client = getattr(self.device, "_client", None)
+        return client is not None and client.is_connected
+
+    @callback
+    def _async_hold_slot(self) -> None:
+        """Keep the slot while the link is open; give it back once it closed."""
+        if self._slot is None:
+            return
+        if not self.link_open:
+            self._async_release_slot()
+            self._async_note_link_closed()
+            return
+        self._cancel_slot_check = async_call_later(
+            self.hass, SLOT_RELEASE_CHECK_INTERVAL, self._async_check_slot
+        )
+
+    @callback
+    def _async_check_slot(self, _now: datetime) -> None:
+        """Check whether the idle link was closed."""
+        self._cancel_slot_check = None
+        if not self.device_lock.locked():
+            # A running session checks again when it ends.
+            self._async_hold_slot()
+
+    @callback
+    def _async_cancel_slot_check(self) -> None:
+        """Stop checking the link."""
+        if self._cancel_slot_check is not None:
+            self._cancel_slot_check()
+            self._cancel_slot_check = None
+
+    @callback
+    def _async_release_slot(self) -> None:
+        """Give the connection slot back."""
+        self._async_cancel_slot_check()
+        if self._slot is not None:
+            self._slot.release()
+            self._slot = None
+
+    @callback
+    def _async_note_link_closed(self) -> None:
+        """Stop relying on pushes once the library dropped the link.
+
+        The device only pushes while a connection is held, so the silence
+        that follows is expected and leaves push-only mode.
+        """
+        self._link_closed_monotonic = time.monotonic()
+        self._async_update_poll_interval(reschedule=True)
+
+    @callback
+    def async_note_command(self) -> None:
+        """Tighten polling after a command was sent to the device."""
+        self._last_command_monotonic = time.monotonic()
+        self.breaker.record_success()
+        self._async_update_poll_interval(reschedule=True)
+
+    def _is_dark(self) -> bool:
+        """Return if the panel reports no meaningful sunlight."""
+        lux = self.data.get("wLux")
+        voltage = self.data.get("fPanelVoltage")
+        return (
+            lux is not None
+            and voltage is not None
+            and lux <= NIGHT_LUX_THRESHOLD
+            and voltage <= NIGHT_PANEL_VOLTAGE_THRESHOLD
+        )
+
+    @property
+    def push_gap_threshold(self) -> float:
+        """Return how long pushes may pause before the device must be polled."""
+        if self.push_cadence is None or (
+            self._push_cadence_samples < PUSH_CADENCE_MIN_SAMPLES
+        ):
+            return PUSH_HEALTHY_WINDOW
+        return min(
+            max(PUSH_GAP_FACTOR * self.push_cadence, PUSH_GAP_MIN_THRESHOLD),
+            PUSH_HEALTHY_WINDOW,
+        )
+
+    @callback
+    def _async_learn_push_cadence(self, now: float) -> None:
+        """Fold the gap since the previous unsolicited push into the cadence."""
+        previous = self._last_unsolicited_push_monotonic
+        self._last_unsolicited_push_monotonic = now
+        closed = self._link_closed_monotonic
+        if (
+            previous is None
+            or (closed is not None and previous <= closed)
+            or (gap := now - previous) > PUSH_HEALTHY_WINDOW
+        ):
+            # Pushes resumed on a new link or after an outage; that gap says
+            # nothing about cadence.
+            return
+        cadence = self.push_cadence
+        self.push_cadence = (
+            gap if cadence is None else cadence + PUSH_CADENCE_SMOOTHING * (gap - cadence)
+        )
+        self._push_cadence_samples += 1
+        if self._cancel_push_watchdog is None:
+            self._async_arm_push_watchdog(self.push_gap_threshold)
+
+    @callback
+    def _async_arm_push_watchdog(self, delay: float) -> None:
+        """Check for a push gap after the given delay."""
+        self._cancel_push_watchdog = async_call_later(
+            self.hass, delay, self._async_check_push_gap
+        )
+
+    @callback
+    def _async_check_push_gap(self, _now: datetime) -> None:
+        """Poll right away when pushes stopped for longer than usual.
+
+        The watchdog is not moved on every push; when it fires early it simply
+        waits for the remainder of the current gap allowance.
+        """
+        self._cancel_push_watchdog = None
+        last_push = self._last_unsolicited_push_monotonic
+        if last_push is None:
+            return
+        if not self.link_open:
+            # The library closed the idle link; no pushes are due until the
+            # next connection.
+            self._async_note_link_closed()
+            return
+        remaining = last_push + self.push_gap_threshold - time.monotonic()
+        if remaining > 0:
+            self._async_arm_push_watchdog(remaining)
+            return
+
+        self.stats.push_gaps += 1
+        _LOGGER.debug(
+            "%s: No push for %.1fs (cadence %.1fs); polling now",
+            self.device.name,
+            time.monotonic() - last_push,
+            self.push_cadence or 0.0,
+        )
+        self._async_update_poll_interval()
+        self.hass.async_create_background_task(
+            self.async_request_refresh(), f"{DOMAIN} {self.address} push gap refresh"
+        )
+
+    def _compute_poll_interval(self, now: float) -> tuple[int | None, str]:
+        """Return the poll interval in seconds and the reason for it.
+
+        ``None`` means pushes are healthy enough that no periodic poll is needed.
+        """
+        if (
+            self._last_command_monotonic is not None
+            and now - self._last_command_monotonic < COMMAND_FAST_POLL_WINDOW
+        ):
+            return FAST_POLL_INTERVAL, POLL_REASON_COMMAND
+
+        last_push = self._last_unsolicited_push_monotonic
+        threshold = self.push_gap_threshold
+        push_healthy = last_push is not None and now - last_push <= threshold
+        # Pushes only arrive while a connection is held, so a gap after the
+        # link closed is expected and only an open link can replace polling.
+        link_open = self.link_open
+        if (
+            link_open
+            and last_push is not None
+            and not push_healthy
+            and (
+                self._last_poll_monotonic is None
+                or self._last_poll_monotonic < last_push + threshold
+            )
+        ):
+            # Pushes stopped and nothing has been polled since they did.
+            return FAST_POLL_INTERVAL, POLL_REASON_PUSH_GAP
+
+        if self._dark_polls >= NIGHT_CONFIRM_POLLS:
+            return NIGHT_POLL_INTERVAL, POLL_REASON_NIGHT
+
+        if push_healthy:
+            if link_open and self._push_cadence_samples >= PUSH_CADENCE_MIN_SAMPLES:
+                # The watchdog polls as soon as pushes stop.
+                return None, POLL_REASON_PUSH_ONLY
+            return PUSH_HEALTHY_POLL_INTERVAL, POLL_REASON_PUSH_HEALTHY
+
+        return DEFAULT_POLL_INTERVAL, POLL_REASON_DEFAULT
+
+    @callback
+    def _async_update_poll_interval(self, reschedule: bool = False) -> None:
+        """Apply the adaptive poll interval."""
+        seconds, reason = self._compute_poll_interval(time.monotonic())
+        interval = None if seconds is None else timedelta(seconds=seconds)
+        if interval == self.update_interval and reason == self.poll_interval_reason:
+            return
+
+        _LOGGER.debug(
+            "%s: Poll interval set to %ss (%s)", self.device.name, seconds, reason
+        )
+        self.update_interval = interval
+        self.poll_interval_reason = reason
+        if interval is None:
+            self._async_unsub_refresh()
+        elif reschedule and self._listeners:
+            self._schedule_refresh()
+
     def _handle_device_push(self) -> None:
         """Handle push updates from the device while connected."""
 
-        snapshot = self._status_snapshot()
-        current_state = snapshot.get(self.address, {})
-        previous_state = self._last_push_state.get(self.address, {})
+        now = time.monotonic()
+        self.stats.pushes_received += 1
+        if self._session_started is not None:
+            # The first push of a session is the earliest sign of a connection.
+            self.stats.observe_connect(
+                self.session_source or UNKNOWN_SOURCE, now - self._session_started
+            )
+            self._session_started = None
+        if not self.device_lock.locked() and self.link_open:
+            # Pushes during our own polls and commands don't prove push health;
+            # the cadence is only learned while the idle link is still held.
+            self._async_learn_push_cadence(now)
+        self.restored_at = None
 
-        changed_keys = sorted(
-            key
-            for key, value in current_state.items()
-            if previous_state.get(key) != value
-        )
+        previous = self.data
+        status = self.device.status_data.get(self.address, {})
+        changed_keys = previous.changed_keys(status)
 
-        if changed_keys:
+        if not changed_keys and previous.version:
+            self.stats.pushes_skipped += 1
             _LOGGER.debug(
-                "%s: Received push update; changed fields: %s",
+                "%s: Received identical push payload; skipping coordinator update",
                 self.device.name,
-                ", ".join(changed_keys),
             )
-            self._last_push_state = {
-                addr: state.copy() for addr, state in snapshot.items()
-            }
-            if not self._initial_push_event.is_set():
-                self._initial_push_event.set()
-            self.async_set_updated_data(snapshot)
             return
 
-        if not self._last_push_state:
+        snapshot = previous.evolve(status)
+        delta = {key: snapshot[key] for key in changed_keys}
+        self.history.record(delta, now)
+        if self.cache is not None:
+            self.cache.async_schedule_save(snapshot)
+        if not self._initial_push_event.is_set():
+            self._initial_push_event.set()
+        if self._delta_listeners:
+            for delta_callback in list(self._delta_listeners):
+                delta_callback(now, delta)
+
+        if not previous.version:
             _LOGGER.debug(
                 "%s: Received initial push payload; forwarding to coordinator",
                 self.device.name,
             )
-            self._last_push_state = {
-                addr: state.copy() for addr, state in snapshot.items()
-            }
-            if not self._initial_push_event.is_set():
-                self._initial_push_event.set()
             self.async_set_updated_data(snapshot)
             return
 
         _LOGGER.debug(
-            "%s: Received identical push payload; skipping coordinator update",
+            "%s: Received push update (version %d); changed fields: %s",
             self.device.name,
+            snapshot.version,
+            ", ".join(changed_keys),
         )
+        self._async_set_pushed_data(snapshot, changed_keys)
+        self._async_update_poll_interval(reschedule=True)
 
     async def async_shutdown(self) -> None:
         """Clean up coordinator resources."""
+        self.commands.async_cancel()
+        if self._cancel_push_watchdog:
+            self._cancel_push_watchdog()
+            self._cancel_push_watchdog = None
         if self._unsubscribe_device:
             self._unsubscribe_device()
             self._unsubscribe_device = None
         await self.device.async_disconnect()
+        self._async_release_slot()
+        if self.cache is not None:
+            await self.cache.async_flush()
         await super().async_shutdown()
 
-    async def _async_update_data(self) -> dict[str, UberSmartStatus]:
+    async def _async_update_data(self) -> StatusSnapshot:
         """Fetch data from the device, polling only when needed."""
         seconds_since_last_poll: float | None = None
         if self._last_poll_monotonic is not None:
             seconds_since_last_poll = time.monotonic() - self._last_poll_monotonic
 
-        if not self.device.poll_needed(seconds_since_last_poll):
+        if self.commands.busy:
+            _LOGGER.debug(
+                "%s: Sending queued commands instead of polling", self.device.name
+            )
+            await self.commands.async_drain()
+            return self.data
+
+        self._async_update_poll_interval()
+        force_poll = self.poll_interval_reason == POLL_REASON_PUSH_GAP
+        if not force_poll and not self.device.poll_needed(seconds_since_last_poll):
+            self.stats.polls_skipped += 1
             _LOGGER.debug(
                 "%s: Skipping poll; using push data (last poll %.1fs ago)",
                 self.device.name,
                 seconds_since_last_poll or -1.0,
             )
-            return self._status_snapshot()
+            return self.data
 
-        if not self._last_push_state:
+        now = time.monotonic()
+        if not self.breaker.allow(now):
+            self.stats.polls_blocked += 1
+            raise UpdateFailed(
+                f"{self.device.name}: Not polling after "
+                f"{self.breaker.consecutive_failures} failed attempts "
+                f"(retry in {max(0.0, self.breaker.retry_at - now):.0f}s)"
+            )
+
+        if not self.data.version:
             _LOGGER.debug(
                 "%s: Awaiting initial push payload before polling",
                 self.device.name,
@@ -127,8 +719,9 @@ class UbersolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, UberSmartSt
             try:
                 await asyncio.wait_for(self._initial_push_event.wait(), timeout=5)
                 self._initial_push_event.clear()
-                return self._status_snapshot()
+                return self.data
             except TimeoutError:
+                self.stats.initial_push_timeouts += 1
                 _LOGGER.debug(
                     "%s: Initial push timeout expired; falling back to poll",
                     self.device.name,
@@ -139,12 +732,45 @@ class UbersolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, UberSmartSt
             self.device.name,
             seconds_since_last_poll or -1.0,
         )
-        await self.device.update()
-        self._last_poll_monotonic = time.monotonic()
-        return self._status_snapshot()
+        await self._async_poll()
+        self._async_update_poll_interval()
+        return self.data
+
+    async def async_poll_now(self) -> None:
+        """Poll the device right away, whatever the push data or breaker say."""
+        await self._async_poll()
+        self._async_update_poll_interval(reschedule=True)
 
-    def _status_snapshot(self) -> dict[str, UberSmartStatus]:
-        """Return a snapshot of the latest device status."""
-        return {
-            address: data.copy() for address, data in self.device.status_data.items()
-        }
+    @callback
+    def _async_notify_poll_changes(self) -> None:
+        """Wake the listeners of every field the pushes of a poll changed."""
+        base, self._poll_base = self._poll_base, None
+        if base is None or base is self.data:
+            return
+        if changed_keys := base.changed_keys(self.data):
+            self._async_notify_keys(changed_keys)
+
+    async def _async_poll(self) -> None:
+        """Read the full status from the device; pushes deliver the result."""
+        self.stats.polls += 1
+        self._poll_base = self.data
+        try:
+            async with self.async_device_session():
+                started = time.monotonic()
+                try:
+                    await self.device.update()
+                except Exception as err:
+                    self.stats.poll_failures += 1
+                    self.breaker.record_failure(time.monotonic(), repr(err))
+                    raise UpdateFailed(
+                        f"{self.device.name}: Poll failed: {err}"
+                    ) from err
+        finally:
+            self._async_notify_poll_changes()
+        if self._refresh_keys_notified is not None and self.last_update_success:
+            # The refresh sees new data, but its listeners were already woken.
+            self._refresh_keys_notified = True
+        self.breaker.record_success()
+        self._last_poll_monotonic = time.monotonic()
+        self.stats.poll_latency.observe(self._last_poll_monotonic - started)
+        self._dark_polls = self._dark_polls + 1 if self._is_dark() else 0
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from datetime import datetime, tzinfo
 import logging
-from typing import cast
 
 from homeassistant.components.datetime import DateTimeEntity, DateTimeEntityDescription
 from homeassistant.config_entries import ConfigEntry
@@ -16,6 +15,7 @@ from homeassistant.util import dt as dt_util
 from .const import DOMAIN
 from .coordinator import UbersolarDataUpdateCoordinator
 from .entity import UbersolarEntity
+from .models import parse_device_time
 
 # Initialize the logger
 _LOGGER = logging.getLogger(__name__)
@@ -46,22 +46,16 @@ class UbersmartDateTime(UbersolarEntity, DateTimeEntity):
         """Initialize the UberSmart device."""
         super().__init__(coordinator)
         self.entity_description = DATETIME_TYPE
+        self._status_keys = (DATETIME_TYPE.key,)
         self._attr_unique_id = f"{coordinator.base_unique_id}-{DATETIME_TYPE.key}"
 
     @property
     def native_value(self) -> datetime | None:
         """Return the value reported by the datetime."""
-        raw_value = self.data.get(DATETIME_TYPE.key)
-        if raw_value is None:
-            return None
-
-        parsed = dt_util.parse_datetime(cast(str, raw_value))
+        parsed = parse_device_time(self.data.get(DATETIME_TYPE.key))
         if parsed is None:
             return None
 
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=dt_util.UTC)
-
         return dt_util.as_local(parsed)
 
     async def async_set_value(self, value: datetime) -> None:
@@ -74,4 +68,4 @@ class UbersmartDateTime(UbersolarEntity, DateTimeEntity):
                     tzinfo_value = hass_tz
             value = value.replace(tzinfo=tzinfo_value)
 
-        await self._device.set_time(value.astimezone(dt_util.UTC))
+        await self.coordinator.commands.async_set_time(value.astimezone(dt_util.UTC))
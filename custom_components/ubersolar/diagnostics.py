@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS
@@ -10,7 +11,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import format_mac
 
 from .const import DOMAIN
-from .coordinator import UbersolarDataUpdateCoordinator
+
+if TYPE_CHECKING:
+    from .coordinator import UbersolarDataUpdateCoordinator
 
 
 async def async_get_config_entry_diagnostics(
@@ -20,18 +23,52 @@ async def async_get_config_entry_diagnostics(
     coordinator: UbersolarDataUpdateCoordinator = hass.data[DOMAIN][
         config_entry.entry_id
     ]
-    status = coordinator.data or coordinator.device.status_data
+    status = coordinator.data
 
     return {
         "entry": {
             "title": config_entry.title,
             "address": format_mac(config_entry.data.get(CONF_ADDRESS, "")),
         },
+        "state": coordinator.setup_state,
+        "restored_at": (
+            coordinator.restored_at.isoformat() if coordinator.restored_at else None
+        ),
         "status": {
-            address: {
+            coordinator.address: {
                 key: value.hex() if isinstance(value, (bytes, bytearray)) else value
-                for key, value in device_status.items()
+                for key, value in status.items()
             }
-            for address, device_status in status.items()
         },
+        "status_version": status.version,
+        "polling": {
+            "interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "reason": coordinator.poll_interval_reason,
+            "push_cadence": (
+                None
+                if coordinator.push_cadence is None
+                else round(coordinator.push_cadence, 2)
+            ),
+            "push_gap_threshold": round(coordinator.push_gap_threshold, 2),
+        },
+        "connection_source": coordinator.connection_source,
+        "last_session_source": coordinator.session_source,
+        "advertisement": {
+            "present": coordinator.present,
+            "rssi": coordinator.rssi,
+            "rssi_smoothed": (
+                None
+                if coordinator.rssi_smoothed is None
+                else round(coordinator.rssi_smoothed, 1)
+            ),
+        },
+        "connection_scheduler": coordinator.scheduler.as_dict(),
+        "history": coordinator.history.as_dict(),
+        "stats": coordinator.stats.as_dict(),
+        "breaker": coordinator.breaker.as_dict(time.monotonic()),
+        "push_log": coordinator.push_log.as_dict() if coordinator.push_log else None,
     }
@@ -3,12 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import cast
+from typing import TYPE_CHECKING
 
-from pyubersolar import UberSmart
-from pyubersolar.models import UberSmartStatus
-
-from homeassistant.components import bluetooth
+from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
@@ -16,6 +13,10 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import MANUFACTURER, MODEL
 from .coordinator import UbersolarDataUpdateCoordinator
+from .models import StatusSnapshot
+
+if TYPE_CHECKING:
+    from pyubersolar import UberSmart
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,12 +27,14 @@ class UbersolarEntity(CoordinatorEntity[UbersolarDataUpdateCoordinator], Entity)
     coordinator: UbersolarDataUpdateCoordinator
     _device: UberSmart
     _attr_has_entity_name = True
+    _status_keys: tuple[str, ...] = ()
 
     def __init__(self, coordinator: UbersolarDataUpdateCoordinator) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
         self._device = coordinator.device
         self._address = coordinator.address
+        self._snapshot: StatusSnapshot = coordinator.data
         self._attr_unique_id = coordinator.base_unique_id
         connections: set[tuple[str, str]] = {(dr.CONNECTION_BLUETOOTH, self._address)}
         if ":" in self._address:
@@ -53,20 +56,33 @@ class UbersolarEntity(CoordinatorEntity[UbersolarDataUpdateCoordinator], Entity)
             name=coordinator.device_name,
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to pushes that change the status keys this entity reads."""
+        await super().async_added_to_hass()
+        if self._status_keys:
+            self.async_on_remove(
+                self.coordinator.async_add_key_listener(
+                    self._status_keys, self._handle_coordinator_update
+                )
+            )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._snapshot = self.coordinator.data
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update entity attributes from the current snapshot."""
+
     @property
-    def data(self) -> UberSmartStatus:
-        """Return coordinator data for this entity."""
-        coordinator_data = cast(
-            object,
-            getattr(self.coordinator, "data", None),
-        )
-        if isinstance(coordinator_data, dict) and self._address in coordinator_data:
-            return cast(UberSmartStatus, coordinator_data[self._address])
-        return cast(UberSmartStatus, self.coordinator.device.status_data[self._address])
+    def data(self) -> StatusSnapshot:
+        """Return the status snapshot this entity last received."""
+        return self._snapshot
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return super().available and bluetooth.async_address_present(
-            self.hass, self._address, True
-        )
+        return super().available and self.coordinator.present
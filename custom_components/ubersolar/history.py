@@ -0,0 +1,130 @@
+"""Bounded in-memory history of raw UberSolar push samples."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class SampleSummary:
+    """Aggregate of the samples in a time window.
+
+    ``count`` is the number of changes within the window; ``mean`` is weighted
+    by how long each value was held.
+    """
+
+    count: int
+    minimum: float
+    maximum: float
+    mean: float
+
+
+class SampleRing:
+    """Fixed-capacity ring of timestamped samples backed by ``array('d')``.
+
+    Once full, each new sample overwrites the oldest one, so memory use is
+    fixed at creation time no matter how fast the device pushes.
+    """
+
+    __slots__ = ("_count", "_next", "_times", "_values", "capacity")
+
+    def __init__(self, capacity: int) -> None:
+        """Allocate the ring."""
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored samples."""
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the sample arrays."""
+        return (len(self._times) + len(self._values)) * self._values.itemsize
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Store a sample, overwriting the oldest one when full."""
+        index = self._next
+        self._times[index] = timestamp
+        self._values[index] = value
+        self._next = (index + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def newest_first(self) -> Iterator[tuple[float, float]]:
+        """Yield the stored ``(timestamp, value)`` pairs, newest first."""
+        times = self._times
+        values = self._values
+        index = self._next
+        for _ in range(self._count):
+            index = (index - 1) % self.capacity
+            yield times[index], values[index]
+
+    def summary(self, since: float, until: float) -> SampleSummary | None:
+        """Return the time-weighted aggregate of the window ``since`` to ``until``.
+
+        Only changes are recorded, so each value counts for as long as it was
+        held: until the next sample, or until ``until`` for the newest one. The
+        value already held at ``since`` counts from there but isn't a sample of
+        the window. Once the ring has wrapped within the window, the summary
+        covers the span the retained samples reach back to.
+        """
+        if not self._count:
+            return None
+        count = 0
+        area = 0.0
+        duration = 0.0
+        minimum = float("inf")
+        maximum = float("-inf")
+        end = until
+        for timestamp, value in self.newest_first():
+            start = max(timestamp, since)
+            if end > start:
+                area += value * (end - start)
+                duration += end - start
+            minimum = min(minimum, value)
+            maximum = max(maximum, value)
+            if timestamp < since:
+                break
+            count += 1
+            end = timestamp
+        latest = self._values[(self._next - 1) % self.capacity]
+        return SampleSummary(
+            count, minimum, maximum, area / duration if duration else latest
+        )
+
+
+class UbersolarHistory:
+    """Keep a sample ring for each tracked numeric status field."""
+
+    def __init__(self, fields: Iterable[str], capacity: int) -> None:
+        """Allocate one ring per field."""
+        self._rings: dict[str, SampleRing] = {
+            field: SampleRing(capacity) for field in fields
+        }
+
+    def record(self, changes: Mapping[str, Any], timestamp: float) -> None:
+        """Record the tracked fields a push changed."""
+        for field, value in changes.items():
+            if (ring := self._rings.get(field)) is not None and isinstance(
+                value, (int, float)
+            ):
+                ring.append(timestamp, float(value))
+
+    def summary(self, field: str, since: float, until: float) -> SampleSummary | None:
+        """Return the aggregate of a field between two monotonic times."""
+        return self._rings[field].summary(since, until)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the sample counts and memory use for diagnostics."""
+        return {
+            "capacity": {field: ring.capacity for field, ring in self._rings.items()},
+            "samples": {field: len(ring) for field, ring in self._rings.items()},
+            "memory_bytes": sum(ring.nbytes for ring in self._rings.values()),
+        }
@@ -0,0 +1,93 @@
+"""Data models for the UberSolar integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from datetime import datetime
+from typing import Any
+
+
+def parse_device_time(value: Any) -> datetime | None:
+    """Return the device clock of a status payload as an aware datetime.
+
+    pyubersolar 0.1.5 formats ``lluTime`` with ``datetime.fromtimestamp``, so a
+    value without an offset is in the local time of the host, not UTC.
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    # A naive datetime is converted as local time.
+    return parsed if parsed.tzinfo is not None else parsed.astimezone()
+
+
+class StatusSnapshot(Mapping[str, Any]):
+    """Immutable, versioned view of a device status payload.
+
+    A snapshot is never mutated after it is created, so the coordinator and its
+    entities can share one instance instead of copying the status per reader.
+    Each snapshot built from a previous one carries the next version number.
+    """
+
+    __slots__ = ("_data", "version")
+
+    def __init__(self, data: dict[str, Any] | None = None, version: int = 0) -> None:
+        """Wrap a status dict that nothing else holds a reference to."""
+        self._data: dict[str, Any] = data if data is not None else {}
+        self.version = version
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of a status field."""
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the status field names."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of status fields."""
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        """Return if the status field is present."""
+        return key in self._data
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the status fields, ignoring the version."""
+        if isinstance(other, StatusSnapshot):
+            return other is self or self._data == other._data
+        if isinstance(other, Mapping):
+            return self._data == dict(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return the representation of the snapshot."""
+        return f"StatusSnapshot(version={self.version}, data={self._data!r})"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of a status field or a default."""
+        return self._data.get(key, default)
+
+    def changed_keys(self, status: Mapping[str, Any]) -> list[str]:
+        """Return the fields of a live status payload that differ from this snapshot."""
+        data = self._data
+        missing = object()
+        return [key for key, value in status.items() if data.get(key, missing) != value]
+
+    def evolve(self, status: Mapping[str, Any]) -> StatusSnapshot:
+        """Return the next version built from a live status payload.
+
+        The payload is copied exactly once; mutable byte buffers are frozen so
+        later in-place edits by the device library cannot leak into the snapshot.
+        """
+        return StatusSnapshot(
+            {
+                key: bytes(value) if isinstance(value, bytearray) else value
+                for key, value in status.items()
+            },
+            self.version + 1,
+        )
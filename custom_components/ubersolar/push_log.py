@@ -0,0 +1,421 @@
+"""Compact on-disk log of raw UberSolar pushes.
+
+Every push is stored as the fields it changed, in fixed-width 16 byte
+records::
+
+    kind (u8) | field id (u8) | length (u16) | ms since previous record (u32) | payload (8 bytes)
+
+Field names are written once per file as definition records and referred to by
+id afterwards. Text and byte values longer than the payload follow their record
+in 16 byte blocks. The first record of a push has ``PUSH_START`` set in its
+kind. Each file starts with a header holding the wall clock and monotonic time
+it was opened at, so files can be read on their own and old ones deleted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Iterator
+import csv
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import logging
+import math
+import mmap
+from pathlib import Path
+import shutil
+import struct
+import time
+from typing import TYPE_CHECKING, Any, TextIO
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DEFAULT_PUSH_LOG_DAYS,
+    DOMAIN,
+    PUSH_LOG_BYTES_PER_PUSH,
+    PUSH_LOG_FILE_SIZE,
+    PUSH_LOG_FLUSH_INTERVAL,
+    PUSH_LOG_PUSH_RATE,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import UbersolarDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"UBPL"
+VERSION = 1
+HEADER = struct.Struct("<4sB3xdd8x")
+RECORD = struct.Struct("<BBHI8s")
+BLOCK = RECORD.size
+FLOAT = struct.Struct("<d")
+INT = struct.Struct("<q")
+
+KIND_FIELD = 1
+KIND_FLOAT = 2
+KIND_INT = 3
+KIND_BYTES = 4
+KIND_TEXT = 5
+KIND_NONE = 6
+KIND_SYNC = 7
+PUSH_START = 0x80
+
+MAX_FIELDS = 256
+MAX_LENGTH = 0xFFFF
+MAX_DELTA_MS = 0xFFFFFFFF
+FILE_SUFFIX = ".bin"
+
+
+def push_log_path(hass: HomeAssistant, base_unique_id: str) -> Path:
+    """Return the push log directory of a device."""
+    return Path(hass.config.path(DOMAIN, "push_log", base_unique_id))
+
+
+def _log_files(directory: Path) -> list[Path]:
+    """Return the log files of a directory, oldest first."""
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob(f"*{FILE_SUFFIX}"))
+
+
+def _pack(kind: int, field_id: int, delta_ms: int, data: bytes) -> bytes:
+    """Return a record, with the data inline or in the blocks after it."""
+    data = data[:MAX_LENGTH]
+    if len(data) <= INT.size:
+        return RECORD.pack(kind, field_id, len(data), delta_ms, data)
+    padding = -len(data) % BLOCK
+    return (
+        RECORD.pack(kind, field_id, len(data), delta_ms, b"")
+        + data
+        + bytes(padding)
+    )
+
+
+def _encode_value(value: Any) -> tuple[int, bytes]:
+    """Return the kind and payload of a status value."""
+    if value is None:
+        return KIND_NONE, b""
+    if isinstance(value, int) and -(1 << 63) <= value < 1 << 63:
+        return KIND_INT, INT.pack(value)
+    if isinstance(value, float):
+        return KIND_FLOAT, FLOAT.pack(value)
+    if isinstance(value, (bytes, bytearray)):
+        return KIND_BYTES, bytes(value)
+    return KIND_TEXT, str(value).encode()
+
+
+class PushLogWriter:
+    """Encode pushes into the records of size-capped, numbered log files.
+
+    Only encodes; the encoded chunks are taken with ``take_pending`` and
+    written by ``write_chunks`` outside the event loop.
+    """
+
+    def __init__(self, first_index: int, file_size: int = PUSH_LOG_FILE_SIZE) -> None:
+        """Initialize the writer; the first push opens file ``first_index``."""
+        self._file_size = file_size
+        self._index = first_index - 1
+        self._size = file_size
+        self._fields: dict[str, int] = {}
+        self._start = 0.0
+        self._last_ms = 0
+        self._pending: list[tuple[int, bytearray]] = []
+        self.pushes = 0
+        self.bytes = 0
+        self.dropped_fields = 0
+
+    def _open_file(self, timestamp: float, wall_time: float) -> bytes:
+        """Start the next file and return its header."""
+        self._index += 1
+        self._size = 0
+        self._fields = {}
+        self._start = timestamp
+        self._last_ms = 0
+        return HEADER.pack(MAGIC, VERSION, wall_time, timestamp)
+
+    def _encode_push(self, timestamp: float, delta: dict[str, Any]) -> bytearray:
+        """Return the records of a push in the current file."""
+        records = bytearray()
+        time_ms = max(self._last_ms, round((timestamp - self._start) * 1000))
+        delta_ms = time_ms - self._last_ms
+        if delta_ms > MAX_DELTA_MS:
+            records += RECORD.pack(KIND_SYNC, 0, INT.size, 0, INT.pack(time_ms))
+            delta_ms = 0
+        self._last_ms = time_ms
+
+        flags = PUSH_START
+        for key, value in delta.items():
+            if (field_id := self._fields.get(key)) is None:
+                if len(self._fields) == MAX_FIELDS:
+                    self.dropped_fields += 1
+                    continue
+                field_id = self._fields[key] = len(self._fields)
+                records += _pack(KIND_FIELD, field_id, 0, key.encode())
+            kind, data = _encode_value(value)
+            records += _pack(kind | flags, field_id, delta_ms, data)
+            flags = delta_ms = 0
+        return records
+
+    def encode(self, timestamp: float, wall_time: float, delta: dict[str, Any]) -> None:
+        """Queue the changed fields of a push, starting a new file when full."""
+        header = b""
+        if self._size >= self._file_size:
+            header = self._open_file(timestamp, wall_time)
+        fields = len(self._fields)
+        last_ms = self._last_ms
+        records = self._encode_push(timestamp, delta)
+
+        if not header and self._size + len(records) > self._file_size:
+            # Roll back the field definitions and restart in a fresh file.
+            for key in list(self._fields)[fields:]:
+                del self._fields[key]
+            self._last_ms = last_ms
+            header = self._open_file(timestamp, wall_time)
+            records = self._encode_push(timestamp, delta)
+
+        chunk = header + records
+        self._size += len(chunk)
+        self.bytes += len(chunk)
+        self.pushes += 1
+        if self._pending and self._pending[-1][0] == self._index:
+            self._pending[-1][1].extend(chunk)
+        else:
+            self._pending.append((self._index, bytearray(chunk)))
+
+    def take_pending(self) -> list[tuple[int, bytearray]]:
+        """Return the chunks not written yet, keyed by file index."""
+        pending, self._pending = self._pending, []
+        return pending
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the writer state for diagnostics."""
+        return {
+            "file_index": self._index,
+            "file_size": self._size,
+            "pushes": self.pushes,
+            "bytes": self.bytes,
+            "bytes_per_push": round(self.bytes / self.pushes, 1) if self.pushes else None,
+            "dropped_fields": self.dropped_fields,
+        }
+
+
+def retained_files(days: float) -> int:
+    """Return how many files to keep so they hold ``days`` of pushes.
+
+    Sized for ``PUSH_LOG_PUSH_RATE`` pushes per second of
+    ``PUSH_LOG_BYTES_PER_PUSH`` bytes; one more file is kept for the file
+    being written.
+    """
+    size = days * 86400 * PUSH_LOG_PUSH_RATE * PUSH_LOG_BYTES_PER_PUSH
+    return math.ceil(size / PUSH_LOG_FILE_SIZE) + 1
+
+
+def next_file_index(directory: Path) -> int:
+    """Return the index of the file a new writer should start with."""
+    files = _log_files(directory)
+    return int(files[-1].stem) + 1 if files else 0
+
+
+def write_chunks(
+    directory: Path,
+    chunks: Iterable[tuple[int, bytes | bytearray]],
+    max_files: int,
+) -> None:
+    """Append encoded chunks to their files and delete the oldest files."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for index, data in chunks:
+        with (directory / f"{index:08d}{FILE_SUFFIX}").open("ab") as file:
+            file.write(data)
+    for path in _log_files(directory)[:-max_files]:
+        path.unlink(missing_ok=True)
+
+
+@dataclass(frozen=True, slots=True)
+class PushLogEntry:
+    """One logged push."""
+
+    timestamp: float
+    wall_time: float
+    changes: dict[str, Any]
+
+
+def _decode_value(kind: int, data: bytes) -> Any:
+    """Return the status value of a record."""
+    if kind == KIND_FLOAT:
+        return FLOAT.unpack(data)[0]
+    if kind == KIND_INT:
+        return INT.unpack(data)[0]
+    if kind == KIND_BYTES:
+        return data
+    if kind == KIND_TEXT:
+        return data.decode(errors="replace")
+    return None
+
+
+def iter_log_file(path: Path) -> Iterator[PushLogEntry]:
+    """Yield the pushes of one log file.
+
+    The file is memory-mapped, so reading it costs no more memory than the
+    entries being yielded. A record cut short by a crash ends the file.
+    """
+    with path.open("rb") as file:
+        if path.stat().st_size < HEADER.size:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            magic, version, wall_start, start = HEADER.unpack_from(buffer)
+            if magic != MAGIC or version != VERSION:
+                _LOGGER.warning("%s is not a version %s push log", path, VERSION)
+                return
+
+            fields: dict[int, str] = {}
+            time_ms = 0
+            entry: PushLogEntry | None = None
+            offset = HEADER.size
+            end = len(buffer)
+            while offset + BLOCK <= end:
+                kind, field_id, length, delta_ms, payload = RECORD.unpack_from(
+                    buffer, offset
+                )
+                offset += BLOCK
+                if length > INT.size:
+                    data_end = offset + length
+                    if data_end > end:
+                        break
+                    payload = buffer[offset:data_end]
+                    offset += length + -length % BLOCK
+                else:
+                    payload = payload[:length]
+
+                base_kind = kind & ~PUSH_START
+                if base_kind == KIND_FIELD:
+                    fields[field_id] = payload.decode(errors="replace")
+                    continue
+                if base_kind == KIND_SYNC:
+                    time_ms = INT.unpack(payload)[0]
+                    continue
+
+                time_ms += delta_ms
+                if kind & PUSH_START:
+                    if entry is not None:
+                        yield entry
+                    seconds = time_ms / 1000
+                    entry = PushLogEntry(start + seconds, wall_start + seconds, {})
+                if entry is not None:
+                    entry.changes[fields.get(field_id, f"field_{field_id}")] = (
+                        _decode_value(base_kind, payload)
+                    )
+            if entry is not None:
+                yield entry
+
+
+def iter_push_log(directory: Path) -> Iterator[PushLogEntry]:
+    """Yield every logged push of a device, oldest first."""
+    for path in _log_files(directory):
+        yield from iter_log_file(path)
+
+
+def export_csv(directory: Path, stream: TextIO) -> int:
+    """Write the push log as one CSV row per changed field; return the rows."""
+    writer = csv.writer(stream)
+    writer.writerow(("time", "monotonic", "field", "value"))
+    rows = 0
+    for entry in iter_push_log(directory):
+        wall_time = datetime.fromtimestamp(entry.wall_time, UTC).isoformat()
+        monotonic = f"{entry.timestamp:.3f}"
+        for key, value in entry.changes.items():
+            text = value.hex() if isinstance(value, bytes) else value
+            writer.writerow((wall_time, monotonic, key, text))
+            rows += 1
+    return rows
+
+
+def remove_push_log(directory: Path) -> None:
+    """Delete the push log of a device."""
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class UbersolarPushLog:
+    """Record the pushes of a coordinator to its push log directory.
+
+    Records are buffered in memory and written from the executor every
+    ``PUSH_LOG_FLUSH_INTERVAL`` seconds and on unload.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: UbersolarDataUpdateCoordinator,
+        days: float = DEFAULT_PUSH_LOG_DAYS,
+    ) -> None:
+        """Initialize the push log, keeping about ``days`` of pushes."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self.directory = push_log_path(hass, coordinator.base_unique_id)
+        self.max_files = retained_files(days)
+        self._writer: PushLogWriter | None = None
+        self._lock = asyncio.Lock()
+        self._unsubscribers: list[CALLBACK_TYPE] = []
+
+    async def async_start(self) -> None:
+        """Start recording pushes into a new file."""
+        first_index = await self._hass.async_add_executor_job(
+            next_file_index, self.directory
+        )
+        self._writer = PushLogWriter(first_index)
+        self._unsubscribers = [
+            self._coordinator.async_add_delta_listener(self._async_handle_delta),
+            async_track_time_interval(
+                self._hass,
+                self._async_schedule_flush,
+                timedelta(seconds=PUSH_LOG_FLUSH_INTERVAL),
+                name=f"{DOMAIN} {self._coordinator.address} push log",
+            ),
+        ]
+
+    async def async_stop(self) -> None:
+        """Stop recording and write what is buffered."""
+        while self._unsubscribers:
+            self._unsubscribers.pop()()
+        await self.async_flush()
+
+    @callback
+    def _async_handle_delta(self, timestamp: float, delta: dict[str, Any]) -> None:
+        """Buffer the changed fields of a push."""
+        assert self._writer is not None
+        self._writer.encode(timestamp, time.time(), delta)
+
+    @callback
+    def _async_schedule_flush(self, _now: datetime) -> None:
+        """Write the buffered records in the background."""
+        self._hass.async_create_background_task(
+            self.async_flush(), f"{DOMAIN} {self._coordinator.address} push log flush"
+        )
+
+    async def async_flush(self) -> None:
+        """Write the buffered records."""
+        if self._writer is None:
+            return
+        async with self._lock:
+            if not (chunks := self._writer.take_pending()):
+                return
+            try:
+                await self._hass.async_add_executor_job(
+                    write_chunks, self.directory, chunks, self.max_files
+                )
+            except OSError as err:
+                _LOGGER.warning(
+                    "%s: Could not write the push log to %s: %s",
+                    self._coordinator.device_name,
+                    self.directory,
+                    err,
+                )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the push log state for diagnostics."""
+        return {
+            "directory": str(self.directory),
+            "max_files": self.max_files,
+            **(self._writer.as_dict() if self._writer else {}),
+        }
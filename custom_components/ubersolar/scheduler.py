@@ -0,0 +1,160 @@
+"""Connection scheduler shared by all UberSolar config entries."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_URGENT = 0
+PRIORITY_POLL = 1
+
+# Waits for a slot longer than this, in seconds, are logged.
+SLOW_WAIT_THRESHOLD = 0.1
+
+
+class _AdapterSlots:
+    """Connection slots of one Bluetooth adapter or proxy."""
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the slots."""
+        self.capacity = capacity
+        self.in_use = 0
+        self._waiters: list[tuple[int, int, str, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self.grants = 0
+        self.queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of callers waiting for a slot."""
+        return len({id(future) for *_, future in self._waiters if not future.done()})
+
+    async def acquire(self, priority: int, name: str) -> None:
+        """Wait for a free slot; lower priorities are served first, then FIFO."""
+        if self.in_use < self.capacity and not self.waiting:
+            self.in_use += 1
+            return
+
+        self.queued += 1
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), name, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the caller went away.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Hand the slot to the next waiter or return it to the pool."""
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_use -= 1
+
+    def expedite(self, name: str) -> None:
+        """Move the waiting requests of a device ahead of the polls."""
+        for priority, _, waiter, future in list(self._waiters):
+            if waiter == name and priority > PRIORITY_URGENT and not future.done():
+                # The old entry is skipped once the future is done.
+                heapq.heappush(
+                    self._waiters,
+                    (PRIORITY_URGENT, next(self._sequence), name, future),
+                )
+
+    def record_wait(self, wait: float) -> None:
+        """Record how long a caller waited for its slot."""
+        self.grants += 1
+        self.total_wait += wait
+        self.last_wait = wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the slot state and wait statistics."""
+        return {
+            "capacity": self.capacity,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "grants": self.grants,
+            "queued": self.queued,
+            "mean_wait": round(self.total_wait / self.grants, 3) if self.grants else 0.0,
+            "max_wait": round(self.max_wait, 3),
+            "last_wait": round(self.last_wait, 3),
+        }
+
+
+class SlotLease:
+    """A connection slot held for one device until its link closes."""
+
+    def __init__(self, source: str, adapter: _AdapterSlots) -> None:
+        """Initialize the lease."""
+        self.source = source
+        self._adapter: _AdapterSlots | None = adapter
+
+    @property
+    def released(self) -> bool:
+        """Return if the slot was given back."""
+        return self._adapter is None
+
+    def release(self) -> None:
+        """Give the slot back; releasing twice does nothing."""
+        if self._adapter is not None:
+            self._adapter.release()
+            self._adapter = None
+
+
+class UbersolarConnectionScheduler:
+    """Limit concurrent UberSolar connections per adapter and queue the rest.
+
+    ESPHome proxies and local adapters only have a few connection slots. A
+    device takes a slot of the adapter that will carry it before it connects
+    and gives it back once the link is closed, which the library only does a
+    while after the last operation. Commands are queued ahead of polls, and a
+    poll that holds up a command of its own device is moved up with them;
+    callers of the same priority are served in the order they asked, so one
+    busy device can't starve the others.
+    """
+
+    def __init__(self, slots_per_adapter: int) -> None:
+        """Initialize the scheduler."""
+        self._slots_per_adapter = slots_per_adapter
+        self._adapters: dict[str, _AdapterSlots] = {}
+
+    async def async_acquire(
+        self, source: str, name: str, urgent: bool = False
+    ) -> SlotLease:
+        """Wait for a connection slot of the given adapter."""
+        adapter = self._adapters.get(source)
+        if adapter is None:
+            adapter = self._adapters[source] = _AdapterSlots(self._slots_per_adapter)
+
+        started = time.monotonic()
+        await adapter.acquire(PRIORITY_URGENT if urgent else PRIORITY_POLL, name)
+        wait = time.monotonic() - started
+        adapter.record_wait(wait)
+        if wait > SLOW_WAIT_THRESHOLD:
+            _LOGGER.debug(
+                "%s: Waited %.2fs for a connection slot on %s", name, wait, source
+            )
+        return SlotLease(source, adapter)
+
+    def async_expedite(self, source: str, name: str) -> None:
+        """Serve a device's queued poll like a command, as a command waits on it."""
+        if (adapter := self._adapters.get(source)) is not None:
+            adapter.expedite(name)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of every adapter for diagnostics."""
+        return {source: adapter.as_dict() for source, adapter in self._adapters.items()}
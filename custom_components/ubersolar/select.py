@@ -12,7 +12,7 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_platform
 
-from .const import DOMAIN
+from .const import DOMAIN, SOLENOID_MODES
 from .coordinator import UbersolarDataUpdateCoordinator
 from .entity import UbersolarEntity
 
@@ -22,17 +22,11 @@ PARALLEL_UPDATES = 0
 
 
 @dataclass(frozen=True, kw_only=True)
-class UbersmartSelectEntityDescriptionMixin:
-    """Mixin values for Ubersmart select entities."""
+class UbersmartSelectEntityDescription(SelectEntityDescription):
+    """Describe a Ubersmart select entity.
 
-    method: list[str]
-
-
-@dataclass(frozen=True, kw_only=True)
-class UbersmartSelectEntityDescription(
-    SelectEntityDescription, UbersmartSelectEntityDescriptionMixin
-):
-    """Describe a Ubersmart select entity."""
+    The position of an option in ``options`` is the value sent to the device.
+    """
 
 
 SELECT_TYPE = UbersmartSelectEntityDescription(
@@ -40,8 +34,7 @@ SELECT_TYPE = UbersmartSelectEntityDescription(
     translation_key="solenoid_mode",
     icon="mdi:electric-switch",
     entity_category=EntityCategory.CONFIG,
-    options=["off", "on", "auto"],
-    method=["set_solinoid_off", "set_solinoid_on", "set_solinoid_auto"],
+    options=SOLENOID_MODES,
 )
 
 
@@ -59,15 +52,16 @@ async def async_setup_entry(
 class UbersmartSelect(UbersolarEntity, SelectEntity):
     """Representation of a UberSolar Selector."""
 
+    _attr_current_option: str | None
+
     def __init__(self, coordinator: UbersolarDataUpdateCoordinator) -> None:
         """Initialize the UberSmart device."""
         super().__init__(coordinator)
         self._selector = SELECT_TYPE.key
+        self._status_keys = (SELECT_TYPE.key,)
         self._attr_unique_id = f"{coordinator.base_unique_id}-{SELECT_TYPE.key}"
         self.entity_description = SELECT_TYPE
-        options = cast("list[str]", SELECT_TYPE.options)
-        current_index = cast(int, self.data.get(self._selector, 0))
-        self._attr_current_option = options[current_index]
+        self._async_update_attrs()
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -76,16 +70,18 @@ class UbersmartSelect(UbersolarEntity, SelectEntity):
         )
 
         options = cast("list[str]", SELECT_TYPE.options)
-        switch_method = getattr(self._device, SELECT_TYPE.method[options.index(option)])
-
-        await switch_method()
+        await self.coordinator.commands.async_set_switches(
+            {self._selector: options.index(option)}
+        )
         self._attr_current_option = option
         self.async_write_ha_state()
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+    def _async_update_attrs(self) -> None:
+        """Update the selected option from the current snapshot."""
+        current_index = self.data.get(self._selector)
+        if current_index is None:
+            self._attr_current_option = None
+            return
         options = cast("list[str]", SELECT_TYPE.options)
-        current_index = cast(int, self.data.get(self._selector, 0))
         self._attr_current_option = options[current_index]
-        super()._handle_coordinator_update()
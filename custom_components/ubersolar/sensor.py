@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import cast
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+import time
+from typing import Any, cast
 
-from homeassistant.components.bluetooth import async_last_service_info
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -23,12 +24,36 @@ from homeassistant.const import (
     UnitOfTime,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.typing import StateType
 
-from .const import DOMAIN
+from .const import (
+    AGGREGATE_UPDATE_INTERVAL,
+    AGGREGATE_WINDOW,
+    CONF_CHIP_TEMPERATURE_DEADBAND,
+    CONF_HOURLY_STATISTICS,
+    CONF_LUX_DEADBAND,
+    CONF_PANEL_VOLTAGE_DEADBAND,
+    CONF_RSSI_DEADBAND,
+    CONF_SENSOR_MAX_INTERVAL,
+    CONF_SENSOR_MIN_INTERVAL,
+    COORDINATOR_SENSOR_UPDATE_INTERVAL,
+    DEFAULT_CHIP_TEMPERATURE_DEADBAND,
+    DEFAULT_LUX_DEADBAND,
+    DEFAULT_PANEL_VOLTAGE_DEADBAND,
+    DEFAULT_RSSI_DEADBAND,
+    DEFAULT_SENSOR_MAX_INTERVAL,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    DOMAIN,
+    HISTORY_FIELDS,
+    RSSI_KEY,
+    STATISTICS_FIELDS,
+)
 from .coordinator import UbersolarDataUpdateCoordinator
 from .entity import UbersolarEntity
+from .history import SampleSummary
 
 PARALLEL_UPDATES = 0
 
@@ -37,9 +62,18 @@ ValueFn = Callable[["UbersolarSensor"], float | int | str | None]
 
 @dataclass(frozen=True, kw_only=True)
 class UbersolarSensorEntityDescription(SensorEntityDescription):
-    """Describe a Ubersolar sensor with a value extractor."""
+    """Describe a Ubersolar sensor with a value extractor.
+
+    Sensors with a ``deadband`` only write state when the value moved by at
+    least that much, no sooner than ``min_interval`` seconds after the last
+    write, or when ``max_interval`` seconds passed since the last write.
+    """
 
     value_fn: ValueFn
+    status_keys: tuple[str, ...] = ()
+    deadband: float | None = None
+    min_interval: float | None = None
+    max_interval: float | None = None
 
 
 def _data_getter(key: str) -> ValueFn:
@@ -51,14 +85,10 @@ def _rssi_getter(entity: UbersolarSensor) -> int | None:
     if isinstance(device_rssi, int) and device_rssi != 0:
         return device_rssi
 
-    address = entity.coordinator.address
-    if service_info := async_last_service_info(entity.hass, address, True):
-        return service_info.rssi
+    if (rssi := entity.coordinator.rssi_smoothed) is not None:
+        return round(rssi)
 
-    if device_rssi == 0:
-        return None
-
-    return cast(int | None, device_rssi)
+    return None
 
 
 SENSOR_TYPES: dict[str, UbersolarSensorEntityDescription] = {
@@ -71,6 +101,10 @@ SENSOR_TYPES: dict[str, UbersolarSensorEntityDescription] = {
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=_rssi_getter,
+        status_keys=("wRSSI", RSSI_KEY),
+        deadband=DEFAULT_RSSI_DEADBAND,
+        min_interval=DEFAULT_SENSOR_MIN_INTERVAL,
+        max_interval=DEFAULT_SENSOR_MAX_INTERVAL,
     ),
     "fWaterTemperature": UbersolarSensorEntityDescription(
         key="fWaterTemperature",
@@ -128,6 +162,9 @@ SENSOR_TYPES: dict[str, UbersolarSensorEntityDescription] = {
         device_class=SensorDeviceClass.ILLUMINANCE,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=_data_getter("wLux"),
+        deadband=DEFAULT_LUX_DEADBAND,
+        min_interval=DEFAULT_SENSOR_MIN_INTERVAL,
+        max_interval=DEFAULT_SENSOR_MAX_INTERVAL,
     ),
     "fPanelVoltage": UbersolarSensorEntityDescription(
         key="fPanelVoltage",
@@ -136,6 +173,9 @@ SENSOR_TYPES: dict[str, UbersolarSensorEntityDescription] = {
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=_data_getter("fPanelVoltage"),
+        deadband=DEFAULT_PANEL_VOLTAGE_DEADBAND,
+        min_interval=DEFAULT_SENSOR_MIN_INTERVAL,
+        max_interval=DEFAULT_SENSOR_MAX_INTERVAL,
     ),
     "fChipTemp": UbersolarSensorEntityDescription(
         key="fChipTemp",
@@ -144,6 +184,9 @@ SENSOR_TYPES: dict[str, UbersolarSensorEntityDescription] = {
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=_data_getter("fChipTemp"),
+        deadband=DEFAULT_CHIP_TEMPERATURE_DEADBAND,
+        min_interval=DEFAULT_SENSOR_MIN_INTERVAL,
+        max_interval=DEFAULT_SENSOR_MAX_INTERVAL,
     ),
     "fWaterLevel": UbersolarSensorEntityDescription(
         key="fWaterLevel",
@@ -193,15 +236,195 @@ SENSOR_TYPES: dict[str, UbersolarSensorEntityDescription] = {
 }
 
 
+AGGREGATE_STATISTICS: dict[str, Callable[[SampleSummary], float]] = {
+    "mean": lambda summary: summary.mean,
+    "min": lambda summary: summary.minimum,
+    "max": lambda summary: summary.maximum,
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class UbersolarAggregateSensorEntityDescription(SensorEntityDescription):
+    """Describe a sensor that aggregates recent raw samples of a status field."""
+
+    field: str
+    statistic: str
+
+
+def _aggregate_description(
+    field: str, statistic: str
+) -> UbersolarAggregateSensorEntityDescription:
+    """Build the aggregate description from the description of the raw sensor."""
+    source = SENSOR_TYPES[field]
+    return UbersolarAggregateSensorEntityDescription(
+        key=f"{field}_{statistic}",
+        translation_key=f"{source.translation_key}_{statistic}",
+        native_unit_of_measurement=source.native_unit_of_measurement,
+        device_class=source.device_class,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0 if field == "wLux" else 1,
+        entity_registry_enabled_default=False,
+        field=field,
+        statistic=statistic,
+    )
+
+
+AGGREGATE_SENSOR_TYPES: dict[str, UbersolarAggregateSensorEntityDescription] = {
+    description.key: description
+    for description in (
+        _aggregate_description(field, statistic)
+        for field in HISTORY_FIELDS
+        for statistic in AGGREGATE_STATISTICS
+    )
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class UbersolarCoordinatorSensorEntityDescription(SensorEntityDescription):
+    """Describe a sensor that reports how hard the coordinator is working."""
+
+    value_fn: Callable[[UbersolarDataUpdateCoordinator], StateType]
+
+
+def _latency_mean(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds, 3)
+
+
+COORDINATOR_SENSOR_TYPES: tuple[UbersolarCoordinatorSensorEntityDescription, ...] = (
+    UbersolarCoordinatorSensorEntityDescription(
+        key="pushes_received",
+        translation_key="pushes_received",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.stats.pushes_received,
+    ),
+    UbersolarCoordinatorSensorEntityDescription(
+        key="pushes_skipped",
+        translation_key="pushes_skipped",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.stats.pushes_skipped,
+    ),
+    UbersolarCoordinatorSensorEntityDescription(
+        key="polls",
+        translation_key="polls",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.stats.polls,
+    ),
+    UbersolarCoordinatorSensorEntityDescription(
+        key="polls_skipped",
+        translation_key="polls_skipped",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.stats.polls_skipped,
+    ),
+    UbersolarCoordinatorSensorEntityDescription(
+        key="poll_failures",
+        translation_key="poll_failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.stats.poll_failures,
+    ),
+    UbersolarCoordinatorSensorEntityDescription(
+        key="initial_push_timeouts",
+        translation_key="initial_push_timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: coordinator.stats.initial_push_timeouts,
+    ),
+    UbersolarCoordinatorSensorEntityDescription(
+        key="connect_latency",
+        translation_key="connect_latency",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _latency_mean(
+            coordinator.stats.connect_latency.mean
+        ),
+    ),
+    UbersolarCoordinatorSensorEntityDescription(
+        key="poll_latency",
+        translation_key="poll_latency",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: _latency_mean(coordinator.stats.poll_latency.mean),
+    ),
+    UbersolarCoordinatorSensorEntityDescription(
+        key="poll_interval",
+        translation_key="poll_interval",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda coordinator: (
+            None
+            if coordinator.update_interval is None
+            else coordinator.update_interval.total_seconds()
+        ),
+    ),
+)
+
+
+DEADBAND_OPTIONS: dict[str, str] = {
+    "rssi": CONF_RSSI_DEADBAND,
+    "wLux": CONF_LUX_DEADBAND,
+    "fPanelVoltage": CONF_PANEL_VOLTAGE_DEADBAND,
+    "fChipTemp": CONF_CHIP_TEMPERATURE_DEADBAND,
+}
+
+
+def _apply_filter_options(
+    description: UbersolarSensorEntityDescription, options: Mapping[str, Any]
+) -> UbersolarSensorEntityDescription:
+    """Return the description with the filter settings from the options flow."""
+    if description.deadband is None:
+        return description
+
+    return replace(
+        description,
+        deadband=options.get(DEADBAND_OPTIONS[description.key], description.deadband),
+        min_interval=options.get(CONF_SENSOR_MIN_INTERVAL, description.min_interval),
+        max_interval=options.get(CONF_SENSOR_MAX_INTERVAL, description.max_interval),
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Ubersolar sensors based on a config entry."""
     coordinator: UbersolarDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(
-        [UbersolarSensor(coordinator=coordinator, sensor=key) for key in SENSOR_TYPES],
-        update_before_add=False,
+    entities: list[SensorEntity] = [
+        UbersolarSensor(
+            coordinator=coordinator,
+            sensor=key,
+            description=_apply_filter_options(description, entry.options),
+            hourly_statistics=entry.options.get(CONF_HOURLY_STATISTICS, False),
+        )
+        for key, description in SENSOR_TYPES.items()
+    ]
+    entities.extend(
+        UbersolarAggregateSensor(coordinator, description)
+        for description in AGGREGATE_SENSOR_TYPES.values()
     )
+    entities.extend(
+        UbersolarCoordinatorSensor(coordinator, description)
+        for description in COORDINATOR_SENSOR_TYPES
+    )
+    async_add_entities(entities, update_before_add=False)
 
 
 class UbersolarSensor(UbersolarEntity, SensorEntity):
@@ -213,14 +436,210 @@ class UbersolarSensor(UbersolarEntity, SensorEntity):
         self,
         coordinator: UbersolarDataUpdateCoordinator,
         sensor: str,
+        description: UbersolarSensorEntityDescription | None = None,
+        hourly_statistics: bool = False,
     ) -> None:
         """Initialize the Ubersolar sensor."""
         super().__init__(coordinator)
         self._sensor = sensor
         self._attr_unique_id = f"{coordinator.base_unique_id}-{sensor}"
-        self.entity_description = SENSOR_TYPES[sensor]
+        self.entity_description = description or SENSOR_TYPES[sensor]
+        if hourly_statistics and sensor in STATISTICS_FIELDS:
+            # Imported as hourly statistics; keep the recorder from compiling
+            # a second set for it.
+            self._attr_state_class = None
+        self._status_keys = self.entity_description.status_keys or (sensor,)
+        self._last_written_value: float | int | str | None = None
+        self._last_written_available: bool | None = None
+        self._last_written_at = 0.0
+        self._cancel_deferred_write: CALLBACK_TYPE | None = None
+        self._cancel_heartbeat: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Start the heartbeat that republishes a filtered value."""
+        await super().async_added_to_hass()
+        self._async_schedule_heartbeat()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a deferred state write and the heartbeat."""
+        await super().async_will_remove_from_hass()
+        self._async_cancel_deferred_write()
+        if self._cancel_heartbeat is not None:
+            self._cancel_heartbeat()
+            self._cancel_heartbeat = None
 
     @property
     def native_value(self) -> float | int | str | None:
         """Return the state of the sensor."""
         return self.entity_description.value_fn(self)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state unless the change is filtered out."""
+        self._snapshot = self.coordinator.data
+        if self.entity_description.deadband is None or self._should_write():
+            self._async_write_filtered_state()
+
+    def _should_write(self) -> bool:
+        """Return if the current value passes the deadband and interval filter."""
+        description = self.entity_description
+        value = self.native_value
+        last_value = self._last_written_value
+        if (
+            self.available != self._last_written_available
+            or not isinstance(value, (int, float))
+            or not isinstance(last_value, (int, float))
+        ):
+            return True
+
+        if abs(value - last_value) < cast(float, description.deadband):
+            return False
+
+        elapsed = time.monotonic() - self._last_written_at
+        if description.min_interval and elapsed < description.min_interval:
+            if self._cancel_deferred_write is None:
+                self._cancel_deferred_write = async_call_later(
+                    self.hass,
+                    description.min_interval - elapsed,
+                    self._async_write_deferred_state,
+                )
+            return False
+
+        return True
+
+    @callback
+    def _async_write_deferred_state(self, _now: Any) -> None:
+        """Write a change that was held back by the minimum interval."""
+        self._cancel_deferred_write = None
+        self._async_write_filtered_state()
+
+    @callback
+    def _async_write_filtered_state(self) -> None:
+        """Write state and remember what was written."""
+        self._async_cancel_deferred_write()
+        self._last_written_value = self.native_value
+        self._last_written_available = self.available
+        self._last_written_at = time.monotonic()
+        self.async_write_ha_state()
+        self._async_schedule_heartbeat()
+
+    @callback
+    def _async_schedule_heartbeat(self) -> None:
+        """Publish the current value again after max_interval without a write.
+
+        Runs on a timer rather than on coordinator updates so a value held
+        back by the deadband still reaches the state machine when the device
+        stops pushing.
+        """
+        max_interval = self.entity_description.max_interval
+        if not max_interval:
+            return
+        if self._cancel_heartbeat is not None:
+            self._cancel_heartbeat()
+        self._cancel_heartbeat = async_call_later(
+            self.hass, max_interval, self._async_write_heartbeat
+        )
+
+    @callback
+    def _async_write_heartbeat(self, _now: Any) -> None:
+        """Write the current value once max_interval passed without a write."""
+        self._cancel_heartbeat = None
+        self._async_write_filtered_state()
+
+    @callback
+    def _async_cancel_deferred_write(self) -> None:
+        """Cancel a pending deferred state write."""
+        if self._cancel_deferred_write is not None:
+            self._cancel_deferred_write()
+            self._cancel_deferred_write = None
+
+
+class UbersolarAggregateSensor(UbersolarEntity, SensorEntity):
+    """Aggregate of the raw push samples of a status field over a recent window."""
+
+    entity_description: UbersolarAggregateSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: UbersolarDataUpdateCoordinator,
+        description: UbersolarAggregateSensorEntityDescription,
+    ) -> None:
+        """Initialize the aggregate sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.base_unique_id}-{description.key}"
+        self.entity_description = description
+        self._async_update_attrs()
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the aggregate on a timer instead of on every push."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_update_from_history,
+                timedelta(seconds=AGGREGATE_UPDATE_INTERVAL),
+            )
+        )
+
+    @callback
+    def _async_update_from_history(self, _now: datetime) -> None:
+        """Write state when the aggregate changed."""
+        previous = self._attr_native_value
+        self._async_update_attrs()
+        if self._attr_native_value != previous:
+            self.async_write_ha_state()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Compute the aggregate over the window."""
+        description = self.entity_description
+        now = time.monotonic()
+        summary = self.coordinator.history.summary(
+            description.field, now - AGGREGATE_WINDOW, now
+        )
+        self._attr_native_value = (
+            None
+            if summary is None
+            else round(AGGREGATE_STATISTICS[description.statistic](summary), 2)
+        )
+
+
+class UbersolarCoordinatorSensor(UbersolarEntity, SensorEntity):
+    """Counter or latency of the coordinator, sampled on a timer."""
+
+    entity_description: UbersolarCoordinatorSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: UbersolarDataUpdateCoordinator,
+        description: UbersolarCoordinatorSensorEntityDescription,
+    ) -> None:
+        """Initialize the coordinator sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.base_unique_id}-{description.key}"
+        self.entity_description = description
+        self._async_update_attrs()
+
+    async def async_added_to_hass(self) -> None:
+        """Sample the coordinator on a timer instead of on every push."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_update_from_stats,
+                timedelta(seconds=COORDINATOR_SENSOR_UPDATE_INTERVAL),
+            )
+        )
+
+    @callback
+    def _async_update_from_stats(self, _now: datetime) -> None:
+        """Write state when the value changed."""
+        previous = self._attr_native_value
+        self._async_update_attrs()
+        if self._attr_native_value != previous:
+            self.async_write_ha_state()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Read the value from the coordinator."""
+        self._attr_native_value = self.entity_description.value_fn(self.coordinator)
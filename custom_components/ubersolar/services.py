@@ -0,0 +1,331 @@
+"""Services for the UberSolar integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime, timedelta
+import time
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_ELEMENT,
+    ATTR_HOLIDAY_MODE,
+    ATTR_MAX_PARALLEL,
+    ATTR_PUMP,
+    ATTR_SOLENOID_MODE,
+    ATTR_TIME,
+    ATTR_TIMEOUT,
+    CLOCK_CONFIRM_TOLERANCE,
+    CONFIRM_TIMEOUT,
+    DEFAULT_FLEET_PARALLEL,
+    DEFAULT_FLEET_TIMEOUT,
+    DOMAIN,
+    SERVICE_APPLY_SETTINGS,
+    SERVICE_FLEET_REFRESH,
+    SERVICE_FLEET_SET,
+    SOLENOID_MODES,
+)
+from .models import parse_device_time
+
+if TYPE_CHECKING:
+    from .coordinator import UbersolarDataUpdateCoordinator
+
+# Status field holding the device clock.
+CLOCK_FIELD = "lluTime"
+
+# Service fields that map onto a switch state field of the device.
+SWITCH_SERVICE_FIELDS = {
+    ATTR_ELEMENT: "bElementOn",
+    ATTR_PUMP: "bPumpOn",
+    ATTR_HOLIDAY_MODE: "bHolidayMode",
+}
+
+SETTINGS_FIELDS = {
+    vol.Optional(ATTR_ELEMENT): cv.boolean,
+    vol.Optional(ATTR_PUMP): cv.boolean,
+    vol.Optional(ATTR_HOLIDAY_MODE): cv.boolean,
+    vol.Optional(ATTR_SOLENOID_MODE): vol.In(SOLENOID_MODES),
+    vol.Optional(ATTR_TIME): cv.datetime,
+}
+SETTINGS_REQUIRED = cv.has_at_least_one_key(
+    ATTR_ELEMENT, ATTR_PUMP, ATTR_HOLIDAY_MODE, ATTR_SOLENOID_MODE, ATTR_TIME
+)
+FLEET_FIELDS = {
+    vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_MAX_PARALLEL, default=DEFAULT_FLEET_PARALLEL): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=32)
+    ),
+    vol.Optional(ATTR_TIMEOUT, default=DEFAULT_FLEET_TIMEOUT): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=600)
+    ),
+}
+
+APPLY_SETTINGS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+            **SETTINGS_FIELDS,
+        }
+    ),
+    SETTINGS_REQUIRED,
+)
+FLEET_REFRESH_SCHEMA = vol.Schema(FLEET_FIELDS)
+FLEET_SET_SCHEMA = vol.All(
+    vol.Schema({**FLEET_FIELDS, **SETTINGS_FIELDS}), SETTINGS_REQUIRED
+)
+
+
+@callback
+def async_get_coordinators(
+    hass: HomeAssistant, device_ids: list[str]
+) -> dict[str, UbersolarDataUpdateCoordinator]:
+    """Return the coordinator of each device, keyed by device ID."""
+    registry = dr.async_get(hass)
+    loaded: dict[str, UbersolarDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    coordinators: dict[str, UbersolarDataUpdateCoordinator] = {}
+    for device_id in device_ids:
+        device = registry.async_get(device_id)
+        coordinator = next(
+            (
+                loaded[entry_id]
+                for entry_id in (device.config_entries if device else ())
+                if entry_id in loaded
+            ),
+            None,
+        )
+        if coordinator is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="device_not_loaded",
+                translation_placeholders={"device_id": device_id},
+            )
+        coordinators[device_id] = coordinator
+    return coordinators
+
+
+@callback
+def async_get_all_coordinators(
+    hass: HomeAssistant,
+) -> dict[str, UbersolarDataUpdateCoordinator]:
+    """Return the coordinator of every loaded device, keyed by device ID."""
+    registry = dr.async_get(hass)
+    coordinators: dict[str, UbersolarDataUpdateCoordinator] = {}
+    for entry_id, coordinator in hass.data.get(DOMAIN, {}).items():
+        for device in dr.async_entries_for_config_entry(registry, entry_id):
+            coordinators[device.id] = coordinator
+    return coordinators
+
+
+def _clock_matches(reported: Any, expected: datetime) -> bool:
+    """Return if a reported device clock is close to the expected time."""
+    if (parsed := parse_device_time(reported)) is None:
+        return False
+    return abs((parsed - expected).total_seconds()) <= CLOCK_CONFIRM_TOLERANCE
+
+
+async def async_confirm(
+    coordinator: UbersolarDataUpdateCoordinator,
+    expected: Mapping[str, Any],
+    time_value: datetime | None = None,
+) -> bool:
+    """Wait for a push that reports the expected values; poll if none comes.
+
+    A clock write is confirmed once the device reports a time that matches it,
+    allowing for the time that has passed since.
+    """
+    written_at = time.monotonic()
+    keys = [*expected, CLOCK_FIELD] if time_value is not None else list(expected)
+
+    def matches() -> bool:
+        data = coordinator.data
+        if not all(data.get(key) == value for key, value in expected.items()):
+            return False
+        if time_value is None:
+            return True
+        elapsed = timedelta(seconds=time.monotonic() - written_at)
+        return _clock_matches(data.get(CLOCK_FIELD), time_value + elapsed)
+
+    if matches():
+        return True
+
+    reported = asyncio.Event()
+
+    @callback
+    def check() -> None:
+        if matches():
+            reported.set()
+
+    remove_listener = coordinator.async_add_key_listener(keys, check)
+    try:
+        async with asyncio.timeout(CONFIRM_TIMEOUT):
+            await reported.wait()
+    except TimeoutError:
+        # A requested refresh is skipped while pushes look healthy; poll anyway.
+        try:
+            await coordinator.async_poll_now()
+        except UpdateFailed:
+            return False
+    finally:
+        remove_listener()
+    return matches()
+
+
+def _settings_from_call(
+    data: Mapping[str, Any],
+) -> tuple[dict[str, int], datetime | None]:
+    """Return the switch writes and the clock value a service call asks for."""
+    if data.get(ATTR_ELEMENT) and data.get(ATTR_PUMP):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="element_and_pump"
+        )
+
+    switches = {
+        field: int(data[attr])
+        for attr, field in SWITCH_SERVICE_FIELDS.items()
+        if attr in data
+    }
+    if ATTR_SOLENOID_MODE in data:
+        switches["eSolenoidMode"] = SOLENOID_MODES.index(data[ATTR_SOLENOID_MODE])
+    time_value = dt_util.as_utc(data[ATTR_TIME]) if ATTR_TIME in data else None
+    return switches, time_value
+
+
+async def _async_apply_settings(call: ServiceCall) -> ServiceResponse:
+    """Apply every requested setting to each device in one session."""
+    data = call.data
+    switches, time_value = _settings_from_call(data)
+    coordinators = async_get_coordinators(call.hass, data[ATTR_DEVICE_ID])
+
+    async def async_apply(coordinator: UbersolarDataUpdateCoordinator) -> bool:
+        await coordinator.commands.async_apply(switches, time_value)
+        return await async_confirm(coordinator, switches, time_value)
+
+    results = await asyncio.gather(
+        *(async_apply(coordinator) for coordinator in coordinators.values()),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if len(errors) == len(results):
+        # Nothing was applied, so fail the call like a single device would.
+        raise errors[0]
+    devices: dict[str, Any] = {}
+    for device_id, result in zip(coordinators, results, strict=True):
+        if isinstance(result, BaseException):
+            devices[device_id] = {
+                "confirmed": False,
+                "error": str(result) or type(result).__name__,
+            }
+        else:
+            devices[device_id] = {"confirmed": result}
+    return {"devices": devices}
+
+
+async def _async_run_fleet(
+    call: ServiceCall,
+    action: Callable[[UbersolarDataUpdateCoordinator], Awaitable[dict[str, Any]]],
+) -> ServiceResponse:
+    """Run an action on many devices with bounded parallelism and timeouts.
+
+    A device that fails or times out is reported and never stops the others.
+    The connection scheduler still limits how many of them share an adapter.
+    """
+    data = call.data
+    if ATTR_DEVICE_ID in data:
+        coordinators = async_get_coordinators(call.hass, data[ATTR_DEVICE_ID])
+    else:
+        coordinators = async_get_all_coordinators(call.hass)
+    semaphore = asyncio.Semaphore(data[ATTR_MAX_PARALLEL])
+    timeout: float = data[ATTR_TIMEOUT]
+
+    async def async_run_one(
+        coordinator: UbersolarDataUpdateCoordinator,
+    ) -> dict[str, Any]:
+        async with semaphore:
+            started = time.monotonic()
+            result: dict[str, Any] = {"name": coordinator.device_name}
+            try:
+                async with asyncio.timeout(timeout):
+                    result.update(await action(coordinator))
+            except TimeoutError:
+                result.update(success=False, error="timeout")
+            except Exception as err:
+                result.update(success=False, error=str(err) or type(err).__name__)
+            else:
+                result["success"] = True
+            result["elapsed"] = round(time.monotonic() - started, 2)
+            return result
+
+    results = await asyncio.gather(
+        *(async_run_one(coordinator) for coordinator in coordinators.values())
+    )
+    succeeded = sum(1 for result in results if result["success"])
+    return {
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "devices": dict(zip(coordinators, results, strict=True)),
+    }
+
+
+async def _async_fleet_refresh(call: ServiceCall) -> ServiceResponse:
+    """Poll every selected device."""
+
+    async def async_refresh(
+        coordinator: UbersolarDataUpdateCoordinator,
+    ) -> dict[str, Any]:
+        await coordinator.async_poll_now()
+        return {}
+
+    return await _async_run_fleet(call, async_refresh)
+
+
+async def _async_fleet_set(call: ServiceCall) -> ServiceResponse:
+    """Apply the same settings to every selected device."""
+    switches, time_value = _settings_from_call(call.data)
+
+    async def async_set(coordinator: UbersolarDataUpdateCoordinator) -> dict[str, Any]:
+        await coordinator.commands.async_apply(switches, time_value)
+        return {"confirmed": await async_confirm(coordinator, switches, time_value)}
+
+    return await _async_run_fleet(call, async_set)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the UberSolar services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SETTINGS,
+        _async_apply_settings,
+        schema=APPLY_SETTINGS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FLEET_REFRESH,
+        _async_fleet_refresh,
+        schema=FLEET_REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FLEET_SET,
+        _async_fleet_set,
+        schema=FLEET_SET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,194 @@
+"""Hourly long-term statistics computed from UberSolar pushes.
+
+Only imported when the hourly statistics option is enabled, since it pulls in
+the recorder.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import (
+    LIGHT_LUX,
+    UnitOfElectricPotential,
+    UnitOfTemperature,
+    UnitOfVolume,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STATISTICS_FIELDS
+
+if TYPE_CHECKING:
+    from .coordinator import UbersolarDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = 3600
+
+# Name suffix, unit and unit class of each imported field.
+STATISTICS_UNITS: dict[str, tuple[str, str, str | None]] = {
+    "fWaterTemperature": ("Water Temperature", UnitOfTemperature.CELSIUS, "temperature"),
+    "fStoredWater": ("Stored Water", UnitOfVolume.LITERS, "volume"),
+    "wLux": ("Light", LIGHT_LUX, None),
+    "fPanelVoltage": ("Solar Panel Voltage", UnitOfElectricPotential.VOLT, "voltage"),
+}
+
+
+class HourlyAccumulator:
+    """Time-weighted mean, minimum and maximum of one field within an hour.
+
+    A value counts for as long as it was held, so a reading that stayed put
+    for most of the hour weighs more than a burst of short-lived ones.
+    """
+
+    __slots__ = ("_area", "_duration", "_since", "maximum", "minimum", "value")
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self.value: float | None = None
+        self.minimum: float | None = None
+        self.maximum: float | None = None
+        self._since = 0.0
+        self._area = 0.0
+        self._duration = 0.0
+
+    def _advance(self, timestamp: float) -> None:
+        """Credit the held value with the time until ``timestamp``."""
+        if self.value is not None and timestamp > self._since:
+            elapsed = timestamp - self._since
+            self._area += self.value * elapsed
+            self._duration += elapsed
+        self._since = timestamp
+
+    def add(self, value: float, timestamp: float) -> None:
+        """Record a new value."""
+        self._advance(timestamp)
+        self.value = value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def close(self, end: float) -> tuple[float, float, float] | None:
+        """Return mean, min and max up to ``end`` and start the next hour."""
+        self._advance(end)
+        result = None
+        if self._duration and self.minimum is not None and self.maximum is not None:
+            result = (self._area / self._duration, self.minimum, self.maximum)
+        # The held value carries over into the next hour.
+        self._area = 0.0
+        self._duration = 0.0
+        self.minimum = self.maximum = self.value
+        return result
+
+
+class UbersolarStatisticsImporter:
+    """Accumulate pushes per hour and import them as external statistics.
+
+    Replaces per-state recording of the tracked fields with one statistics
+    row per field and hour.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: UbersolarDataUpdateCoordinator
+    ) -> None:
+        """Initialize the importer."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._accumulators = {field: HourlyAccumulator() for field in STATISTICS_FIELDS}
+        self._hour_start = time.time() // HOUR * HOUR
+        self._metadata = {
+            field: StatisticMetaData(
+                mean_type=StatisticMeanType.ARITHMETIC,
+                has_sum=False,
+                name=f"{coordinator.device_name} {name}",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{coordinator.base_unique_id}_{field.lower()}",
+                unit_class=unit_class,
+                unit_of_measurement=unit,
+            )
+            for field, (name, unit, unit_class) in STATISTICS_UNITS.items()
+        }
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start accumulating; return a callback that stops."""
+        now = time.time()
+        data: Mapping[str, Any] = self._coordinator.data or {}
+        for field, accumulator in self._accumulators.items():
+            if isinstance(value := data.get(field), (int, float)):
+                accumulator.add(float(value), now)
+        remove_listener = self._coordinator.async_add_delta_listener(
+            self._async_handle_delta
+        )
+        remove_timer = async_track_utc_time_change(
+            self._hass, self._async_handle_hour, minute=0, second=5
+        )
+
+        @callback
+        def stop() -> None:
+            """Stop accumulating; the partial hour is dropped."""
+            remove_listener()
+            remove_timer()
+
+        return stop
+
+    @callback
+    def _async_handle_delta(self, _monotonic: float, delta: dict[str, Any]) -> None:
+        """Record the tracked fields of a push."""
+        now = time.time()
+        # Close earlier hours first so the push lands in the hour it arrived in.
+        self._async_close_hours(now)
+        for field, accumulator in self._accumulators.items():
+            if isinstance(value := delta.get(field), (int, float)):
+                accumulator.add(float(value), now)
+
+    @callback
+    def _async_handle_hour(self, _now: datetime) -> None:
+        """Import the hours that ended."""
+        self._async_close_hours(time.time())
+
+    @callback
+    def _async_close_hours(self, now: float) -> None:
+        """Close every hour that ended before ``now`` and import a row per field.
+
+        Each hour is closed at its own end, so an hour that passed without a
+        timer run or a push gets its own row instead of rolling into the next.
+        """
+        start = self._hour_start
+        if start + HOUR > now:
+            return
+        rows: dict[str, list[StatisticData]] = {
+            field: [] for field in self._accumulators
+        }
+        while start + HOUR <= now:
+            start_time = dt_util.utc_from_timestamp(start)
+            for field, accumulator in self._accumulators.items():
+                if (summary := accumulator.close(start + HOUR)) is None:
+                    continue
+                mean, minimum, maximum = summary
+                rows[field].append(
+                    StatisticData(start=start_time, mean=mean, min=minimum, max=maximum)
+                )
+            start += HOUR
+        self._hour_start = start
+        for field, field_rows in rows.items():
+            if field_rows:
+                async_add_external_statistics(
+                    self._hass, self._metadata[field], field_rows
+                )
+        _LOGGER.debug(
+            "%s: Imported hourly statistics up to %s",
+            self._coordinator.device_name,
+            dt_util.utc_from_timestamp(start).isoformat(),
+        )
@@ -0,0 +1,95 @@
+"""Counters and latency histograms for the UberSolar coordinator."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in seconds."""
+
+    __slots__ = ("count", "counts", "last", "maximum", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.last: float | None = None
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean duration, if anything was observed."""
+        return self.total / self.count if self.count else None
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration."""
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+        self.last = seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        labels = [f"<={bound:g}s" for bound in LATENCY_BUCKETS]
+        labels.append(f">{LATENCY_BUCKETS[-1]:g}s")
+        mean = self.mean
+        return {
+            "count": self.count,
+            "mean": None if mean is None else round(mean, 3),
+            "max": round(self.maximum, 3),
+            "last": None if self.last is None else round(self.last, 3),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+@dataclass(slots=True)
+class CoordinatorStats:
+    """Work done by one coordinator since it was set up."""
+
+    pushes_received: int = 0
+    pushes_skipped: int = 0
+    polls: int = 0
+    polls_skipped: int = 0
+    poll_failures: int = 0
+    polls_blocked: int = 0
+    initial_push_timeouts: int = 0
+    push_gaps: int = 0
+    connect_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    connect_latency_by_source: dict[str, LatencyHistogram] = field(
+        default_factory=dict
+    )
+    poll_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def observe_connect(self, source: str, seconds: float) -> None:
+        """Record a connect latency overall and for the adapter that carried it."""
+        self.connect_latency.observe(seconds)
+        histogram = self.connect_latency_by_source.get(source)
+        if histogram is None:
+            histogram = self.connect_latency_by_source[source] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters and histograms for diagnostics."""
+        return {
+            "pushes_received": self.pushes_received,
+            "pushes_skipped": self.pushes_skipped,
+            "polls": self.polls,
+            "polls_skipped": self.polls_skipped,
+            "poll_failures": self.poll_failures,
+            "polls_blocked": self.polls_blocked,
+            "initial_push_timeouts": self.initial_push_timeouts,
+            "push_gaps": self.push_gaps,
+            "connect_latency": self.connect_latency.as_dict(),
+            "connect_latency_by_source": {
+                source: histogram.as_dict()
+                for source, histogram in self.connect_latency_by_source.items()
+            },
+            "poll_latency": self.poll_latency.as_dict(),
+        }
@@ -26,16 +26,7 @@ PARALLEL_UPDATES = 0
 
 
 @dataclass(frozen=True, kw_only=True)
-class UbersmartSwitchEntityDescriptionMixin:
-    """Mixin values for Ubersmart switch entities."""
-
-    method: list[str]
-
-
-@dataclass(frozen=True, kw_only=True)
-class UbersmartSwitchEntityDescription(
-    SwitchEntityDescription, UbersmartSwitchEntityDescriptionMixin
-):
+class UbersmartSwitchEntityDescription(SwitchEntityDescription):
     """Describe a Ubersmart switch entity."""
 
 
@@ -45,21 +36,18 @@ SWITCH_TYPES: dict[str, UbersmartSwitchEntityDescription] = {
         translation_key="element",
         entity_category=EntityCategory.CONFIG,
         device_class=SwitchDeviceClass.SWITCH,
-        method=["turn_on_element", "turn_off_element"],
     ),
     "bPumpOn": UbersmartSwitchEntityDescription(
         key="bPumpOn",
         translation_key="pump",
         entity_category=EntityCategory.CONFIG,
         device_class=SwitchDeviceClass.SWITCH,
-        method=["turn_on_pump", "turn_off_pump"],
     ),
     "bHolidayMode": UbersmartSwitchEntityDescription(
         key="bHolidayMode",
         translation_key="holiday_mode",
         entity_category=EntityCategory.CONFIG,
         device_class=SwitchDeviceClass.SWITCH,
-        method=["turn_on_holiday", "turn_off_holiday"],
     ),
 }
 
@@ -95,26 +83,25 @@ class UbersmartSwitch(UbersolarEntity, SwitchEntity):
         """Initialize the UberSmart device."""
         super().__init__(coordinator)
         self._switch = switch
+        self._status_keys = (switch,)
         self._attr_unique_id = f"{coordinator.base_unique_id}-{switch}"
         self.entity_description = SWITCH_TYPES[switch]
 
     @property
-    def is_on(self) -> bool:
-        """Return if the switch is on."""
-        return bool(self.data.get(self._switch))
+    def is_on(self) -> bool | None:
+        """Return if the switch is on, or None before the device reported it."""
+        if (value := self.data.get(self._switch)) is None:
+            return None
+        return bool(value)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn device on."""
         _LOGGER.debug("Turn %s on for device %s", self._switch, self._address)
 
-        switch_method = getattr(self._device, self.entity_description.method[0])
-
-        await switch_method()
+        await self.coordinator.commands.async_set_switches({self._switch: 1})
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn device off."""
         _LOGGER.debug("Turn %s off for device %s", self._switch, self._address)
 
-        switch_method = getattr(self._device, self.entity_description.method[1])
-
-        await switch_method()
+        await self.coordinator.commands.async_set_switches({self._switch: 0})
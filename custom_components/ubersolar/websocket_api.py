@@ -0,0 +1,151 @@
+"""Websocket API to stream raw UberSolar pushes to the frontend."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+
+from .const import DEFAULT_STREAM_RATE, MAX_STREAM_RATE
+from .services import async_get_coordinators
+
+if TYPE_CHECKING:
+    from .coordinator import UbersolarDataUpdateCoordinator
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the UberSolar websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe_stream)
+
+
+class _StreamSubscription:
+    """Forward filtered push deltas of one device to one websocket client.
+
+    Deltas that arrive faster than the rate cap allows are merged, newest
+    value wins, and sent together once the interval has passed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        fields: frozenset[str] | None,
+        max_rate: float,
+    ) -> None:
+        """Initialize the subscription."""
+        self._hass = hass
+        self._connection = connection
+        self._msg_id = msg_id
+        self._fields = fields
+        self._min_interval = 1 / max_rate
+        self._last_sent = 0.0
+        self._pending: dict[str, Any] = {}
+        self._pending_time = 0.0
+        self._merged = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_handle_delta(self, timestamp: float, delta: dict[str, Any]) -> None:
+        """Queue the subscribed fields of a push and send them when allowed."""
+        if self._fields is not None:
+            delta = {key: value for key, value in delta.items() if key in self._fields}
+            if not delta:
+                return
+        if self._pending:
+            self._merged += 1
+        self._pending.update(delta)
+        self._pending_time = timestamp
+
+        if self._flush_handle is not None:
+            return
+        loop = self._hass.loop
+        send_at = self._last_sent + self._min_interval
+        if loop.time() >= send_at:
+            self._async_flush()
+        else:
+            self._flush_handle = loop.call_at(send_at, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the pending changes."""
+        self._flush_handle = None
+        self._last_sent = self._hass.loop.time()
+        changes = {
+            key: value.hex() if isinstance(value, bytes) else value
+            for key, value in self._pending.items()
+        }
+        self._connection.send_message(
+            websocket_api.event_message(
+                self._msg_id,
+                {
+                    "timestamp": round(self._pending_time, 3),
+                    "changes": changes,
+                    "merged": self._merged,
+                },
+            )
+        )
+        self._pending = {}
+        self._merged = 0
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop anything not sent yet."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "ubersolar/subscribe_stream",
+        vol.Required("device_id"): str,
+        vol.Optional("fields"): [str],
+        vol.Optional("max_rate", default=DEFAULT_STREAM_RATE): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1, max=MAX_STREAM_RATE)
+        ),
+    }
+)
+@callback
+def websocket_subscribe_stream(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream the fields each push of a device changed.
+
+    Events carry the device's monotonic push time and the changed values.
+    Nothing is written to the state machine or the recorder.
+    """
+    try:
+        coordinator: UbersolarDataUpdateCoordinator = async_get_coordinators(
+            hass, [msg["device_id"]]
+        )[msg["device_id"]]
+    except ServiceValidationError:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Device is not a loaded UberSolar"
+        )
+        return
+
+    fields = frozenset(msg["fields"]) if "fields" in msg else None
+    subscription = _StreamSubscription(
+        hass, connection, msg["id"], fields, msg["max_rate"]
+    )
+    remove_listener = coordinator.async_add_delta_listener(
+        subscription.async_handle_delta
+    )
+
+    @callback
+    def unsubscribe() -> None:
+        """Stop streaming."""
+        remove_listener()
+        subscription.async_cancel()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
@@ -0,0 +1 @@
+"""Development scripts for the UberSolar integration."""
@@ -0,0 +1,271 @@
+"""Microbenchmarks for the UbersolarDataUpdateCoordinator push path.
+
+Drives ``_handle_device_push`` and ``_async_update_data`` with a fake
+``UberSmart`` and reports, per operation, the wall time, the peak memory
+allocated (via tracemalloc) and the number of entity state writes the
+coordinator triggered. Exits non-zero when a scenario exceeds its memory or
+write budget, or regresses against a saved baseline. Wall time depends on the
+machine, so it is only checked relative to a baseline.
+
+    python -m script.bench_push
+    python -m script.bench_push --json bench.json
+    python -m script.bench_push --baseline bench.json --tolerance 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+import json
+import logging
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from bleak.backends.device import BLEDevice
+
+from custom_components.ubersolar.const import DEFAULT_CONNECTION_SLOTS, SWITCH_FIELDS
+from custom_components.ubersolar.coordinator import UbersolarDataUpdateCoordinator
+from custom_components.ubersolar.datetime import DATETIME_TYPE
+from custom_components.ubersolar.scheduler import UbersolarConnectionScheduler
+from custom_components.ubersolar.select import SELECT_TYPE
+from custom_components.ubersolar.sensor import SENSOR_TYPES
+from custom_components.ubersolar.switch import SWITCH_TYPES
+from homeassistant.core import HomeAssistant
+
+from .fake_device import ADDRESS, BASE_STATUS, NAME, FakeUberSmart
+
+# The status keys every push-driven entity of a device subscribes to.
+ENTITY_STATUS_KEYS: list[tuple[str, ...]] = [
+    *(description.status_keys or (key,) for key, description in SENSOR_TYPES.items()),
+    *((key,) for key in SWITCH_TYPES),
+    (SELECT_TYPE.key,),
+    (DATETIME_TYPE.key,),
+]
+
+NUMERIC_FIELDS = [
+    key
+    for key, value in BASE_STATUS.items()
+    if isinstance(value, (int, float)) and key not in SWITCH_FIELDS
+]
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Upper limits for one scenario, per operation."""
+
+    peak_bytes: float
+    writes: float
+
+
+@dataclass
+class Result:
+    """Measurements for one scenario, per operation."""
+
+    scenario: str
+    iterations: int
+    wall_us: float
+    peak_bytes: float
+    writes: float
+
+
+BUDGETS: dict[str, Budget] = {
+    "push_identical": Budget(peak_bytes=1024, writes=0),
+    "push_single_field": Budget(peak_bytes=8192, writes=1),
+    "push_all_fields": Budget(peak_bytes=16384, writes=len(ENTITY_STATUS_KEYS)),
+    "update_skip_poll": Budget(peak_bytes=4096, writes=0),
+    "update_poll": Budget(peak_bytes=32768, writes=0),
+}
+
+
+class _WriteCounter:
+    """Stand in for the entities of one device and count their state writes."""
+
+    def __init__(self, coordinator: UbersolarDataUpdateCoordinator) -> None:
+        self.writes = 0
+        for keys in ENTITY_STATUS_KEYS:
+            # Each entity listens for general updates and for its own keys, with
+            # a callback of its own as the coordinator dedups key listeners.
+            write = self._entity_callback()
+            coordinator.async_add_listener(write)
+            coordinator.async_add_key_listener(keys, write)
+
+    def _entity_callback(self) -> Callable[[], None]:
+        def _write() -> None:
+            self.writes += 1
+
+        return _write
+
+
+def _single_field_changes(iterations: int) -> list[dict[str, Any]]:
+    return [{"wLux": 40000 + index % 2} for index in range(iterations)]
+
+
+def _all_field_changes(iterations: int) -> list[dict[str, Any]]:
+    return [
+        {field: BASE_STATUS[field] + (index % 2) + 1 for field in NUMERIC_FIELDS}
+        for index in range(iterations)
+    ]
+
+
+async def _async_measure(
+    scenario: str,
+    iterations: int,
+    operation: Callable[[int], Awaitable[None] | None],
+    counter: _WriteCounter,
+) -> Result:
+    """Run an operation ``iterations`` times for timing, then again for memory."""
+    writes_before = counter.writes
+    started = time.perf_counter()
+    for index in range(iterations):
+        if (pending := operation(index)) is not None:
+            await pending
+    wall = time.perf_counter() - started
+    writes = counter.writes - writes_before
+
+    tracemalloc.start()
+    peak_total = 0
+    for index in range(iterations):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        if (pending := operation(index)) is not None:
+            await pending
+        _, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - baseline
+    tracemalloc.stop()
+
+    return Result(
+        scenario=scenario,
+        iterations=iterations,
+        wall_us=wall / iterations * 1e6,
+        peak_bytes=peak_total / iterations,
+        writes=writes / iterations,
+    )
+
+
+async def _async_run(iterations: int) -> list[Result]:
+    """Run every scenario against a fresh coordinator."""
+    results: list[Result] = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        device = FakeUberSmart()
+        coordinator = UbersolarDataUpdateCoordinator(
+            hass=hass,
+            ble_device=BLEDevice(ADDRESS, NAME, None),
+            device=device,
+            scheduler=UbersolarConnectionScheduler(DEFAULT_CONNECTION_SLOTS),
+            base_unique_id="bench",
+            device_name=NAME,
+        )
+        counter = _WriteCounter(coordinator)
+        # Deliver the initial payload so every scenario measures steady state.
+        device.push()
+
+        results.append(
+            await _async_measure(
+                "push_identical", iterations, lambda _: device.push(), counter
+            )
+        )
+
+        single = _single_field_changes(iterations)
+        results.append(
+            await _async_measure(
+                "push_single_field",
+                iterations,
+                lambda index: device.push(single[index]),
+                counter,
+            )
+        )
+
+        every = _all_field_changes(iterations)
+        results.append(
+            await _async_measure(
+                "push_all_fields",
+                iterations,
+                lambda index: device.push(every[index]),
+                counter,
+            )
+        )
+
+        async def _async_update(_: int) -> None:
+            await coordinator._async_update_data()
+
+        device.poll_is_needed = False
+        results.append(
+            await _async_measure("update_skip_poll", iterations, _async_update, counter)
+        )
+
+        device.poll_is_needed = True
+        results.append(
+            await _async_measure("update_poll", iterations, _async_update, counter)
+        )
+
+        await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+    return results
+
+
+def _check(
+    results: list[Result], baseline: dict[str, Any] | None, tolerance: float
+) -> list[str]:
+    """Return a description of every budget or baseline violation."""
+    failures: list[str] = []
+    for result in results:
+        budget = BUDGETS[result.scenario]
+        limits = asdict(budget)
+        if baseline and result.scenario in baseline:
+            previous = baseline[result.scenario]
+            limits["wall_us"] = previous["wall_us"] * (1 + tolerance)
+            limits["peak_bytes"] = min(
+                limits["peak_bytes"], previous["peak_bytes"] * (1 + tolerance)
+            )
+        for metric, limit in limits.items():
+            value = getattr(result, metric)
+            if value > limit:
+                failures.append(
+                    f"{result.scenario}: {metric} {value:.1f} exceeds {limit:.1f}"
+                )
+    return failures
+
+
+def main() -> int:
+    """Run the benchmarks and report the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    parser.add_argument("--baseline", type=Path, help="compare against saved results")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--no-check", action="store_true", help="report only; never fail"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(_async_run(args.iterations))
+
+    print(f"{'scenario':<20} {'wall us':>10} {'peak B':>10} {'writes':>8}")
+    for result in results:
+        print(
+            f"{result.scenario:<20} {result.wall_us:>10.1f} "
+            f"{result.peak_bytes:>10.0f} {result.writes:>8.2f}"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps({result.scenario: asdict(result) for result in results}, indent=2)
+        )
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    failures = _check(results, baseline, args.tolerance)
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 0 if args.no_check or not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
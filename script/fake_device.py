@@ -0,0 +1,117 @@
+"""In-process stand-in for ``pyubersolar.UberSmart`` used by the dev scripts."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from typing import Any
+
+ADDRESS = "AA:BB:CC:DD:EE:FF"
+NAME = "UberSmart_FAKE"
+# How the library formats ``lluTime``, in the local time of the host.
+DEVICE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+BASE_STATUS: dict[str, Any] = {
+    "fWaterTemperature": 52.5,
+    "fManifoldTemperature": 61.0,
+    "fStoredWater": 140.0,
+    "bElementOn": 0,
+    "bPumpOn": 0,
+    "bHolidayMode": 0,
+    "eSolenoidMode": 2,
+    "fSolenoidState": 0.0,
+    "AllSwitches": bytearray(b"\x06\x00\x00\x00\x02"),
+    "lluTime": "2026-01-01 12:00:00",
+    "fHours": 1234.0,
+    "wLux": 42000,
+    "wRSSI": -67,
+    "fPanelVoltage": 48.2,
+    "fChipTemp": 41.5,
+    "fWaterLevel": 1.0,
+    "fTankSize": 200.0,
+    "bPanelFaultCode": 0,
+    "bElementFaultCode": 0,
+    "bPumpFultCode": 0,
+    "bSolenoidFaultCode": 0,
+}
+
+
+class FakeUberSmart:
+    """Implement the parts of ``UberSmart`` the integration uses, without BLE.
+
+    Tests drive it with ``push()``, which updates the status in place the way
+    the library's notification handler does and then fires the callbacks.
+    """
+
+    def __init__(
+        self,
+        address: str = ADDRESS,
+        name: str = NAME,
+        status: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Initialize the fake device."""
+        self._address = address
+        self.name = f"{name} ({address})"
+        self.status_data: dict[str, dict[str, Any]] = {
+            address: dict(BASE_STATUS if status is None else status)
+        }
+        self._callbacks: list[Callable[[], None]] = []
+        self.poll_is_needed = False
+        self.updates = 0
+        self.commands: list[tuple[str, Any]] = []
+
+    def get_address(self) -> str:
+        """Return the device address."""
+        return self._address
+
+    def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Register a push callback."""
+        self._callbacks.append(callback)
+
+        def _unsub() -> None:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+        return _unsub
+
+    def push(self, changes: Mapping[str, Any] | None = None) -> None:
+        """Apply changes to the status and notify subscribers."""
+        if changes:
+            self.status_data[self._address].update(changes)
+        for callback in self._callbacks:
+            callback()
+
+    def poll_needed(self, seconds_since_last_poll: float | None) -> bool:
+        """Return the configured poll decision."""
+        return self.poll_is_needed
+
+    async def update(self) -> dict[str, dict[str, Any]]:
+        """Pretend to poll; the current status is pushed back."""
+        self.updates += 1
+        self.push()
+        return self.status_data
+
+    async def toggle_switches_all(self, switches: str) -> None:
+        """Record a switch write and apply it."""
+        self.commands.append(("toggle_switches_all", switches))
+        element, pump, holiday, solenoid = bytes.fromhex(switches)
+        self.status_data[self._address].update(
+            bElementOn=element,
+            bPumpOn=pump,
+            bHolidayMode=holiday,
+            eSolenoidMode=solenoid,
+            AllSwitches=bytearray((6, element, pump, holiday, solenoid)),
+        )
+        await self.update()
+
+    async def set_time(self, value: datetime) -> None:
+        """Record a clock write, apply it and read back."""
+        self.commands.append(("set_time", value))
+        # Formatted in host-local time, like the library.
+        self.status_data[self._address]["lluTime"] = value.astimezone().strftime(
+            DEVICE_TIME_FORMAT
+        )
+        await self.update()
+
+    async def async_disconnect(self) -> None:
+        """Nothing to disconnect."""
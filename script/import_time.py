@@ -0,0 +1,132 @@
+"""Measure the cold import time of the integration and each of its platforms.
+
+Each module is imported in a fresh interpreter with ``-X importtime`` after the
+Home Assistant modules it builds on, which are always loaded by the time the
+integration is, so only the integration's own cost is counted. Reports the
+median over several runs; ``tests/test_imports.py`` checks that nothing is
+imported before it is needed.
+
+    python -m script.import_time
+    python -m script.import_time --runs 9 --json import_time.json
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import asdict, dataclass
+import json
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+PACKAGE = "custom_components.ubersolar"
+
+# Loaded before the integration in every run.
+HOME_ASSISTANT_PRELOAD = (
+    "homeassistant.components.bluetooth",
+    "homeassistant.components.websocket_api",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.device_registry",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+)
+
+
+@dataclass(frozen=True)
+class Target:
+    """A module to measure and what to import before it."""
+
+    module: str
+    preload: tuple[str, ...]
+
+
+TARGETS = (
+    Target(PACKAGE, HOME_ASSISTANT_PRELOAD),
+    Target(f"{PACKAGE}.config_flow", (*HOME_ASSISTANT_PRELOAD, "voluptuous", PACKAGE)),
+    *(
+        Target(
+            f"{PACKAGE}.{platform}",
+            (*HOME_ASSISTANT_PRELOAD, f"homeassistant.components.{platform}", PACKAGE),
+        )
+        for platform in ("datetime", "select", "sensor", "switch")
+    ),
+    Target(f"{PACKAGE}.diagnostics", (*HOME_ASSISTANT_PRELOAD, PACKAGE)),
+)
+
+
+@dataclass
+class Result:
+    """Import cost of one module."""
+
+    module: str
+    cumulative_ms: float
+    min_ms: float
+    max_ms: float
+
+
+MARKER = "--- measure ---"
+
+
+def _measure_once(target: Target) -> float:
+    """Import the target once and return its cumulative time."""
+    code = "".join(f"import {module}\n" for module in target.preload)
+    code += f"import sys\nprint({MARKER!r}, file=sys.stderr, flush=True)\n"
+    code += f"import {target.module}\n"
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Everything before the marker belongs to the preloads.
+    _, _, output = process.stderr.partition(MARKER)
+    cumulative_us = 0
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = (part.strip() for part in line[12:].split("|"))
+        if not cumulative.isdigit():
+            continue  # the header line
+        if name == target.module:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000
+
+
+def _measure(target: Target, runs: int) -> Result:
+    """Return the median import time of a target over several runs."""
+    timings = [_measure_once(target) for _ in range(runs)]
+    return Result(
+        module=target.module,
+        cumulative_ms=statistics.median(timings),
+        min_ms=min(timings),
+        max_ms=max(timings),
+    )
+
+
+def main() -> int:
+    """Measure every target and report the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    args = parser.parse_args()
+
+    results = [_measure(target, args.runs) for target in TARGETS]
+
+    print(f"{'module':<40} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+    for result in results:
+        print(
+            f"{result.module:<40} {result.cumulative_ms:>10.1f} "
+            f"{result.min_ms:>8.1f} {result.max_ms:>8.1f}"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps({result.module: asdict(result) for result in results}, indent=2)
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
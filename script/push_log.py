@@ -0,0 +1,63 @@
+"""Read an UberSolar push log: summarize it or export it to CSV.
+
+    python -m script.push_log config/ubersolar/push_log/<address>
+    python -m script.push_log config/ubersolar/push_log/<address> --csv pushes.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from datetime import UTC, datetime
+from pathlib import Path
+import sys
+
+from custom_components.ubersolar.push_log import export_csv, iter_push_log
+
+
+def summarize(directory: Path) -> None:
+    """Print the span of the log and how often each field changed."""
+    files = sorted(directory.glob("*.bin"))
+    size = sum(path.stat().st_size for path in files)
+    pushes = 0
+    changes: Counter[str] = Counter()
+    first = last = None
+    for entry in iter_push_log(directory):
+        pushes += 1
+        changes.update(entry.changes)
+        first = first or entry
+        last = entry
+
+    print(f"{len(files)} files, {size} bytes, {pushes} pushes")
+    if first is None or last is None:
+        return
+    print(
+        f"{datetime.fromtimestamp(first.wall_time, UTC).isoformat()} to "
+        f"{datetime.fromtimestamp(last.wall_time, UTC).isoformat()}, "
+        f"{size / pushes:.1f} bytes per push"
+    )
+    for field, count in changes.most_common():
+        print(f"  {field:<24} {count:>8} changes")
+
+
+def main() -> int:
+    """Summarize or export the push log."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", type=Path, help="push log directory of a device")
+    parser.add_argument("--csv", type=Path, help="write every change to this file")
+    args = parser.parse_args()
+
+    if not args.directory.is_dir():
+        print(f"{args.directory} is not a directory", file=sys.stderr)
+        return 1
+    if args.csv:
+        with args.csv.open("w", newline="", encoding="utf-8") as stream:
+            rows = export_csv(args.directory, stream)
+        print(f"Wrote {rows} changes to {args.csv}")
+        return 0
+    summarize(args.directory)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,440 @@
+"""Record UberSmart status traces and replay them through the integration.
+
+A trace is a JSON lines file: a header, then one line per push with the
+seconds since the recording started and the full ``status_data`` snapshot the
+library held after it. Traces come from a live device or from a push log:
+
+    python -m script.replay record AA:BB:CC:DD:EE:FF trace.jsonl --duration 600
+    python -m script.replay import-log config/ubersolar/push_log/<address> trace.jsonl
+
+Replaying feeds the snapshots through a real coordinator and every platform in
+a test Home Assistant instance (``pytest-homeassistant-custom-component``) and
+reports state writes, the share of pushes deduplicated, CPU time per push and
+whether the entity states match the last snapshot. ``--speed 0`` (the default)
+replays as fast as possible, ``--speed 1`` in real time; sensor time filters
+only behave as they would live at real time.
+
+    python -m script.replay replay trace.jsonl --speed 0 --json report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+import json
+import logging
+from pathlib import Path
+import statistics
+import sys
+import time
+from typing import Any, TextIO
+
+from bleak import BleakScanner
+from bleak.backends.device import BLEDevice
+
+from custom_components.ubersolar import PLATFORMS
+from custom_components.ubersolar.const import (
+    CONF_RETRY_COUNT,
+    DEFAULT_CONNECTION_SLOTS,
+    DEFAULT_RETRY_COUNT,
+    DOMAIN,
+)
+from custom_components.ubersolar.coordinator import UbersolarDataUpdateCoordinator
+from custom_components.ubersolar.datetime import UbersmartDateTime
+from custom_components.ubersolar.push_log import iter_push_log
+from custom_components.ubersolar.scheduler import UbersolarConnectionScheduler
+from custom_components.ubersolar.select import UbersmartSelect
+from custom_components.ubersolar.sensor import UbersolarSensor
+from custom_components.ubersolar.switch import UbersmartSwitch
+from homeassistant.const import (
+    CONF_ADDRESS,
+    CONF_NAME,
+    EVENT_STATE_CHANGED,
+    EVENT_STATE_REPORTED,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers.entity import Entity
+
+from .fake_device import ADDRESS, NAME, FakeUberSmart
+
+_LOGGER = logging.getLogger(__name__)
+
+TRACE_VERSION = 1
+
+# Entities whose state follows the status payload, as opposed to the counter
+# and aggregate sensors that update on a timer.
+PUSH_DRIVEN_ENTITIES = (UbersolarSensor, UbersmartSwitch, UbersmartSelect, UbersmartDateTime)
+
+
+@dataclass
+class Trace:
+    """A recorded sequence of status snapshots."""
+
+    address: str
+    name: str
+    steps: list[tuple[float, dict[str, Any]]]
+
+
+def _encode_step(offset: float, status: Mapping[str, Any]) -> str:
+    """Return the trace line of a snapshot."""
+    line: dict[str, Any] = {
+        "t": round(offset, 3),
+        "status": {
+            key: value.hex() if isinstance(value, (bytes, bytearray)) else value
+            for key, value in status.items()
+        },
+    }
+    if binary := [
+        key for key, value in status.items() if isinstance(value, (bytes, bytearray))
+    ]:
+        line["binary"] = binary
+    return json.dumps(line) + "\n"
+
+
+def _write_header(stream: TextIO, address: str, name: str) -> None:
+    """Write the trace header."""
+    header = {
+        "version": TRACE_VERSION,
+        "address": address,
+        "name": name,
+        "recorded_at": datetime.now(UTC).isoformat(),
+    }
+    stream.write(json.dumps(header) + "\n")
+
+
+def load_trace(path: Path) -> Trace:
+    """Read a trace file."""
+    with path.open(encoding="utf-8") as stream:
+        header = json.loads(stream.readline())
+        if header.get("version") != TRACE_VERSION:
+            raise ValueError(f"{path} is not a version {TRACE_VERSION} trace")
+        steps: list[tuple[float, dict[str, Any]]] = []
+        for line in stream:
+            step = json.loads(line)
+            binary = set(step.get("binary", ()))
+            steps.append(
+                (
+                    step["t"],
+                    {
+                        key: bytearray.fromhex(value) if key in binary else value
+                        for key, value in step["status"].items()
+                    },
+                )
+            )
+    return Trace(header["address"], header["name"], steps)
+
+
+async def async_record(
+    address: str, output: Path, duration: float, poll_interval: float
+) -> int:
+    """Record the snapshots a live device pushes; return how many."""
+    # Only recording talks to a real device.
+    from pyubersolar import UberSmart  # noqa: PLC0415
+
+    ble_device = await BleakScanner.find_device_by_address(address, timeout=30)
+    if ble_device is None:
+        raise SystemExit(f"{address} was not found")
+    device = UberSmart(device=ble_device)
+    started = time.monotonic()
+    pushes = 0
+
+    with output.open("w", encoding="utf-8") as stream:
+        _write_header(stream, device.get_address(), ble_device.name or NAME)
+
+        def on_push() -> None:
+            nonlocal pushes
+            pushes += 1
+            stream.write(
+                _encode_step(
+                    time.monotonic() - started,
+                    device.status_data[device.get_address()],
+                )
+            )
+
+        unsubscribe = device.subscribe(on_push)
+        try:
+            # The device only pushes while connected; polling keeps it connected.
+            while time.monotonic() - started < duration:
+                await device.update()
+                await asyncio.sleep(poll_interval)
+        finally:
+            unsubscribe()
+            await device.async_disconnect()
+    return pushes
+
+
+def import_push_log(directory: Path, output: Path) -> int:
+    """Convert a push log into a trace; return the snapshots written.
+
+    The push log only holds pushes that changed something, so a replay of it
+    shows no deduplicated pushes.
+    """
+    status: dict[str, Any] = {}
+    started: float | None = None
+    steps = 0
+    with output.open("w", encoding="utf-8") as stream:
+        _write_header(stream, directory.name, NAME)
+        for entry in iter_push_log(directory):
+            if started is None:
+                started = entry.timestamp
+            status.update(entry.changes)
+            stream.write(_encode_step(entry.timestamp - started, status))
+            steps += 1
+    return steps
+
+
+@dataclass
+class EndState:
+    """How the entity states compare with the last snapshot."""
+
+    checked: int = 0
+    matched: int = 0
+    filtered: int = 0
+    deferred: int = 0
+    mismatched: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ReplayReport:
+    """Measurements of one replay."""
+
+    pushes: int
+    trace_seconds: float
+    wall_seconds: float
+    state_writes: int
+    writes_per_push: float
+    writes_by_domain: dict[str, int]
+    dedup_rate: float
+    cpu_us_per_push: float
+    cpu_us_p95: float
+    wall_us_per_push: float
+    coordinator_matches: bool
+    end_state: EndState
+
+
+def _expected_state(entity: Entity) -> str:
+    """Return the state an entity would write now."""
+    if not entity.available:
+        return STATE_UNAVAILABLE
+    state = entity.state
+    return STATE_UNKNOWN if state is None else str(state)
+
+
+def _check_end_state(hass: HomeAssistant) -> EndState:
+    """Compare each push-driven entity with the state machine.
+
+    A sensor may lag behind by less than its deadband, or by a write its
+    minimum interval is holding back; those count as filtered or deferred.
+    """
+    result = EndState()
+    for platform in entity_platform.async_get_platforms(hass, DOMAIN):
+        for entity_id, entity in platform.entities.items():
+            if not isinstance(entity, PUSH_DRIVEN_ENTITIES):
+                continue
+            result.checked += 1
+            state = hass.states.get(entity_id)
+            expected = _expected_state(entity)
+            if state is not None and state.state == expected:
+                result.matched += 1
+                continue
+            if isinstance(entity, UbersolarSensor) and (
+                deadband := entity.entity_description.deadband
+            ):
+                if entity._cancel_deferred_write is not None:
+                    result.deferred += 1
+                    continue
+                try:
+                    if state and abs(float(state.state) - float(expected)) < deadband:
+                        result.filtered += 1
+                        continue
+                except ValueError:
+                    pass
+            result.mismatched.append(
+                f"{entity_id}: {state.state if state else None!r} != {expected!r}"
+            )
+    return result
+
+
+def _percentile(samples: list[int], percent: int) -> float:
+    """Return a percentile of the samples."""
+    if len(samples) < 2:
+        return float(samples[0]) if samples else 0.0
+    return statistics.quantiles(samples, n=100)[percent - 1]
+
+
+async def async_replay(trace: Trace, speed: float) -> ReplayReport:
+    """Replay a trace through the coordinator and all platforms."""
+    # The test instance comes from the custom component test harness.
+    from pytest_homeassistant_custom_component.common import (  # noqa: PLC0415
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+
+    from homeassistant import loader  # noqa: PLC0415
+    from homeassistant.config_entries import ConfigEntryState  # noqa: PLC0415
+
+    async with async_test_home_assistant() as hass:
+        # Let the loader find the integration in custom_components.
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+        address = trace.address if ":" in trace.address else ADDRESS
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=trace.name,
+            unique_id=address.replace(":", "").lower(),
+            data={CONF_ADDRESS: address, CONF_NAME: trace.name},
+            options={CONF_RETRY_COUNT: DEFAULT_RETRY_COUNT},
+        )
+        entry.add_to_hass(hass)
+
+        device = FakeUberSmart(address=address, name=trace.name, status={})
+        coordinator = UbersolarDataUpdateCoordinator(
+            hass=hass,
+            ble_device=BLEDevice(address, trace.name, None),
+            device=device,
+            scheduler=UbersolarConnectionScheduler(DEFAULT_CONNECTION_SLOTS),
+            base_unique_id=entry.unique_id,
+            device_name=trace.name,
+        )
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+        # Skip the integration's own setup, which needs a Bluetooth adapter.
+        entry.mock_state(hass, ConfigEntryState.LOADED)
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        await hass.async_block_till_done()
+
+        writes: Counter[str] = Counter()
+
+        @callback
+        def count_write(event: Event) -> None:
+            writes[event.data["entity_id"].partition(".")[0]] += 1
+
+        @callback
+        def any_state(_data: Mapping[str, Any]) -> bool:
+            return True
+
+        remove_changed = hass.bus.async_listen(EVENT_STATE_CHANGED, count_write)
+        remove_reported = hass.bus.async_listen(
+            EVENT_STATE_REPORTED, count_write, event_filter=any_state
+        )
+
+        cpu_samples: list[int] = []
+        wall_samples: list[int] = []
+        started = time.monotonic()
+        for offset, status in trace.steps:
+            if speed and (delay := offset / speed - (time.monotonic() - started)) > 0:
+                await asyncio.sleep(delay)
+            cpu_started = time.process_time_ns()
+            wall_started = time.perf_counter_ns()
+            device.push(status)
+            wall_samples.append(time.perf_counter_ns() - wall_started)
+            cpu_samples.append(time.process_time_ns() - cpu_started)
+            await asyncio.sleep(0)
+        await hass.async_block_till_done()
+        wall_seconds = time.monotonic() - started
+
+        remove_changed()
+        remove_reported()
+        end_state = _check_end_state(hass)
+        final = trace.steps[-1][1] if trace.steps else {}
+        coordinator_matches = dict(coordinator.data) == final
+        stats = coordinator.stats
+
+        await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        await coordinator.async_shutdown()
+
+    pushes = len(trace.steps)
+    state_writes = sum(writes.values())
+    return ReplayReport(
+        pushes=pushes,
+        trace_seconds=trace.steps[-1][0] if trace.steps else 0.0,
+        wall_seconds=round(wall_seconds, 3),
+        state_writes=state_writes,
+        writes_per_push=state_writes / pushes if pushes else 0.0,
+        writes_by_domain=dict(writes),
+        dedup_rate=(
+            stats.pushes_skipped / stats.pushes_received if stats.pushes_received else 0.0
+        ),
+        cpu_us_per_push=sum(cpu_samples) / pushes / 1000 if pushes else 0.0,
+        cpu_us_p95=_percentile(cpu_samples, 95) / 1000,
+        wall_us_per_push=sum(wall_samples) / pushes / 1000 if pushes else 0.0,
+        coordinator_matches=coordinator_matches,
+        end_state=end_state,
+    )
+
+
+def _report_lines(report: ReplayReport) -> Iterator[str]:
+    """Return the report as text."""
+    yield (
+        f"{report.pushes} pushes over {report.trace_seconds:.1f}s of trace, "
+        f"replayed in {report.wall_seconds:.1f}s"
+    )
+    yield (
+        f"state writes {report.state_writes} ({report.writes_per_push:.2f} per push): "
+        + ", ".join(f"{domain} {count}" for domain, count in report.writes_by_domain.items())
+    )
+    yield f"deduplicated {report.dedup_rate:.1%} of pushes"
+    yield (
+        f"cpu {report.cpu_us_per_push:.1f}us per push (p95 {report.cpu_us_p95:.1f}us), "
+        f"wall {report.wall_us_per_push:.1f}us"
+    )
+    end = report.end_state
+    yield (
+        f"end state: {end.matched}/{end.checked} match, {end.filtered} within "
+        f"deadband, {end.deferred} deferred, {len(end.mismatched)} wrong; "
+        f"coordinator {'matches' if report.coordinator_matches else 'DIFFERS'}"
+    )
+    yield from (f"  {mismatch}" for mismatch in end.mismatched)
+
+
+def main() -> int:
+    """Record, convert or replay a trace."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="record a live device")
+    record.add_argument("address")
+    record.add_argument("output", type=Path)
+    record.add_argument("--duration", type=float, default=600)
+    record.add_argument("--poll-interval", type=float, default=5)
+
+    import_log = commands.add_parser("import-log", help="convert a push log")
+    import_log.add_argument("directory", type=Path)
+    import_log.add_argument("output", type=Path)
+
+    replay = commands.add_parser("replay", help="replay a trace")
+    replay.add_argument("trace", type=Path)
+    replay.add_argument(
+        "--speed", type=float, default=0, help="1 for real time, 0 for as fast as possible"
+    )
+    replay.add_argument("--json", type=Path, help="write the report to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.command == "record":
+        pushes = asyncio.run(
+            async_record(args.address, args.output, args.duration, args.poll_interval)
+        )
+        print(f"Recorded {pushes} pushes to {args.output}")
+        return 0
+    if args.command == "import-log":
+        steps = import_push_log(args.directory, args.output)
+        print(f"Wrote {steps} snapshots to {args.output}")
+        return 0
+
+    report = asyncio.run(async_replay(load_trace(args.trace), args.speed))
+    for line in _report_lines(report):
+        print(line)
+    if args.json:
+        args.json.write_text(json.dumps(asdict(report), indent=2))
+    correct = report.coordinator_matches and not report.end_state.mismatched
+    return 0 if correct else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,467 @@
+"""Simulated UberSmart geyser controller for offline load and latency testing.
+
+``SimulatedUberSmart`` implements the ``UberSmart`` interface the integration
+uses, with configurable connect latency, connect failures, push rate,
+notification loss and jitter. Behind it sits a simple thermal model: the
+collector heats up with daylight, the pump moves that heat into the tank, the
+element adds heat and water draws replace hot water with cold inlet water.
+
+Running the module puts a fleet of simulated devices behind real coordinators
+that share one connection scheduler, and reports how they behaved:
+
+    python -m script.simulator --devices 12 --adapters 2 --duration 300 \\
+        --push-rate 2 --packet-loss 0.05 --connect-latency 1.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import logging
+import math
+import random
+import sys
+import tempfile
+import time
+from typing import Any
+
+from bleak.backends.device import BLEDevice
+from bleak.exc import BleakError
+
+from custom_components.ubersolar.const import DEFAULT_CONNECTION_SLOTS
+from custom_components.ubersolar.coordinator import UbersolarDataUpdateCoordinator
+from custom_components.ubersolar.scheduler import UbersolarConnectionScheduler
+from homeassistant.core import HomeAssistant
+from script.fake_device import DEVICE_TIME_FORMAT
+
+_LOGGER = logging.getLogger(__name__)
+
+# Mirrors the library: how long a connection is held after the last operation
+# and how often a full update is needed.
+DISCONNECT_DELAY = 8.5
+POLL_INTERVAL = 60
+STATUS_BLOCKS = 5
+
+WATER_HEAT_CAPACITY = 4186.0  # J/(kg*K), one litre weighs about one kilogram
+ELEMENT_POWER = 3000.0  # W
+COLLECTOR_GAIN = 0.00004  # K/s per lux
+COLLECTOR_LOSS = 0.002  # 1/s towards ambient
+TANK_LOSS = 0.000004  # 1/s towards ambient
+PUMP_TRANSFER = 0.01  # 1/s of the collector/tank difference
+PUMP_START_DELTA = 6.0  # K the collector must be above the tank
+PEAK_LUX = 90000
+
+
+@dataclass
+class SimulationConfig:
+    """Link and device behaviour of a simulated unit."""
+
+    push_rate: float = 1.0  # pushes per second while connected
+    connect_latency: float = 1.0  # seconds
+    connect_failure_rate: float = 0.0  # chance a connect attempt times out
+    packet_loss: float = 0.0  # chance a notification is dropped
+    jitter: float = 0.2  # seconds, uniform +/- on every delay
+    time_scale: float = 1.0  # simulated seconds per real second
+    tank_size: float = 200.0  # litres
+    ambient: float = 18.0  # degrees C
+    inlet: float = 15.0  # degrees C
+    draws_per_hour: float = 1.0  # mean water draws per simulated hour
+    draw_litres: float = 30.0  # litres per draw
+
+
+class LinkCounter:
+    """Count the links open on each adapter, and the most at any one time."""
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.open: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    def connected(self, source: str) -> None:
+        """Count a link that was opened."""
+        self.open[source] = self.open.get(source, 0) + 1
+        self.peak[source] = max(self.peak.get(source, 0), self.open[source])
+
+    def disconnected(self, source: str) -> None:
+        """Count a link that was closed."""
+        self.open[source] -= 1
+
+
+class _SimulatedClient:
+    """Connected client, as the library keeps it in ``_client``."""
+
+    is_connected = True
+
+
+class SimulatedUberSmart:
+    """Stand in for ``pyubersolar.UberSmart`` backed by a thermal model."""
+
+    def __init__(
+        self,
+        address: str,
+        name: str = "UberSmart_SIM",
+        config: SimulationConfig | None = None,
+        start: datetime | None = None,
+        seed: int | None = None,
+        source: str = "proxy0",
+        links: LinkCounter | None = None,
+    ) -> None:
+        """Initialize the simulated device."""
+        self.config = config or SimulationConfig()
+        self.source = source
+        self._links = links or LinkCounter()
+        self._address = address
+        self.name = f"{name} ({address})"
+        self._random = random.Random(seed)
+        self._callbacks: list[Callable[[], None]] = []
+        self._clock = start or datetime.now(UTC)
+        self._last_step = time.monotonic()
+        self._last_full_update: float = -POLL_INTERVAL
+        self._client: _SimulatedClient | None = None
+        self._push_task: asyncio.Task[None] | None = None
+        self._disconnect_handle: asyncio.TimerHandle | None = None
+        self._water = 45.0
+        self._manifold = self.config.ambient
+        self._hours = 1000.0
+        self._switches = {"bElementOn": 0, "bPumpOn": 0, "bHolidayMode": 0}
+        self._solenoid_mode = 2
+        self.status_data: dict[str, dict[str, Any]] = {address: {}}
+        self.connects = 0
+        self.connect_failures = 0
+        self.pushes_sent = 0
+        self.pushes_lost = 0
+
+    def get_address(self) -> str:
+        """Return the device address."""
+        return self._address
+
+    def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Register a push callback."""
+        self._callbacks.append(callback)
+
+        def _unsub() -> None:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+        return _unsub
+
+    def poll_needed(self, seconds_since_last_poll: float | None) -> bool:
+        """Return if a full update is due, like the library does."""
+        if seconds_since_last_poll is not None and seconds_since_last_poll < POLL_INTERVAL:
+            return False
+        return time.monotonic() - self._last_full_update >= POLL_INTERVAL
+
+    async def update(self) -> dict[str, dict[str, Any]]:
+        """Connect if needed and receive a full set of status blocks."""
+        await self._async_ensure_connected()
+        for _ in range(STATUS_BLOCKS):
+            await self._async_sleep(0.05)
+            self._push()
+        self._last_full_update = time.monotonic()
+        return self.status_data
+
+    async def toggle_switches_all(self, switches: str) -> None:
+        """Set element, pump, holiday and solenoid mode at once."""
+        element, pump, holiday, solenoid = bytes.fromhex(switches)
+        await self._async_command(
+            bElementOn=element, bPumpOn=pump, bHolidayMode=holiday, solenoid=solenoid
+        )
+
+    async def turn_on_element(self) -> None:
+        """Turn the element on; the pump goes off."""
+        await self._async_command(bElementOn=1, bPumpOn=0)
+
+    async def turn_off_element(self) -> None:
+        """Turn the element off."""
+        await self._async_command(bElementOn=0)
+
+    async def turn_on_pump(self) -> None:
+        """Turn the pump on; the element goes off."""
+        await self._async_command(bElementOn=0, bPumpOn=1)
+
+    async def turn_off_pump(self) -> None:
+        """Turn the pump off."""
+        await self._async_command(bPumpOn=0)
+
+    async def turn_on_holiday(self) -> None:
+        """Turn holiday mode on."""
+        await self._async_command(bHolidayMode=1)
+
+    async def turn_off_holiday(self) -> None:
+        """Turn holiday mode off."""
+        await self._async_command(bHolidayMode=0)
+
+    async def set_solinoid_off(self) -> None:
+        """Close the solenoid."""
+        await self._async_command(solenoid=0)
+
+    async def set_solinoid_on(self) -> None:
+        """Open the solenoid."""
+        await self._async_command(solenoid=1)
+
+    async def set_solinoid_auto(self) -> None:
+        """Let the controller drive the solenoid."""
+        await self._async_command(solenoid=2)
+
+    async def set_time(self, value: datetime) -> None:
+        """Set the device clock."""
+        await self._async_ensure_connected()
+        self._clock = value.astimezone(UTC)
+        self._last_step = time.monotonic()
+        await self.update()
+
+    async def async_disconnect(self) -> None:
+        """Drop the connection."""
+        self._disconnect()
+
+    def draw(self, litres: float) -> None:
+        """Replace hot water in the tank with inlet water."""
+        size = self.config.tank_size
+        litres = min(litres, size)
+        self._water = (self._water * (size - litres) + self.config.inlet * litres) / size
+
+    async def _async_command(self, solenoid: int | None = None, **switches: int) -> None:
+        """Apply a switch change and confirm it with a full update."""
+        await self._async_ensure_connected()
+        self._advance()
+        self._switches.update(switches)
+        if solenoid is not None:
+            self._solenoid_mode = solenoid
+        await self.update()
+
+    async def _async_sleep(self, delay: float) -> None:
+        """Sleep for a jittered delay."""
+        jitter = self.config.jitter
+        await asyncio.sleep(max(0.0, delay + self._random.uniform(-jitter, jitter)))
+
+    async def _async_ensure_connected(self) -> None:
+        """Connect with the configured latency and failure rate."""
+        if self._client is None:
+            await self._async_sleep(self.config.connect_latency)
+            if self._random.random() < self.config.connect_failure_rate:
+                self.connect_failures += 1
+                raise BleakError(f"{self.name}: simulated connection timeout")
+            self.connects += 1
+            self._client = _SimulatedClient()
+            self._links.connected(self.source)
+            self._push_task = asyncio.get_running_loop().create_task(
+                self._async_push_loop()
+            )
+        self._reset_disconnect_timer()
+
+    def _reset_disconnect_timer(self) -> None:
+        """Disconnect after the connection was idle for a while."""
+        if self._disconnect_handle is not None:
+            self._disconnect_handle.cancel()
+        self._disconnect_handle = asyncio.get_running_loop().call_later(
+            DISCONNECT_DELAY, self._disconnect
+        )
+
+    def _disconnect(self) -> None:
+        """Drop the connection and stop pushing."""
+        if self._disconnect_handle is not None:
+            self._disconnect_handle.cancel()
+            self._disconnect_handle = None
+        if self._push_task is not None:
+            self._push_task.cancel()
+            self._push_task = None
+        if self._client is not None:
+            self._client = None
+            self._links.disconnected(self.source)
+
+    async def _async_push_loop(self) -> None:
+        """Push status at the configured rate while connected."""
+        if self.config.push_rate <= 0:
+            return
+        while True:
+            await self._async_sleep(1 / self.config.push_rate)
+            self._push()
+
+    def _push(self) -> None:
+        """Advance the model and notify subscribers, unless the packet is lost."""
+        self._advance()
+        if self._random.random() < self.config.packet_loss:
+            self.pushes_lost += 1
+            return
+        self.pushes_sent += 1
+        self.status_data[self._address].update(self._status())
+        for callback in self._callbacks:
+            callback()
+
+    def _lux(self) -> int:
+        """Return the light level for the simulated time of day."""
+        hour = self._clock.hour + self._clock.minute / 60
+        daylight = math.sin(math.pi * (hour - 6) / 12)
+        return int(PEAK_LUX * daylight) if daylight > 0 else 0
+
+    def _advance(self) -> None:
+        """Step the thermal model to the current time."""
+        now = time.monotonic()
+        seconds = (now - self._last_step) * self.config.time_scale
+        self._last_step = now
+        if seconds <= 0:
+            return
+        self._clock += timedelta(seconds=seconds)
+        config = self.config
+        mass = config.tank_size
+
+        draw_chance = config.draws_per_hour * seconds / 3600
+        while draw_chance > 0:
+            if self._random.random() < min(draw_chance, 1.0):
+                self.draw(config.draw_litres)
+            draw_chance -= 1
+
+        self._manifold += (
+            COLLECTOR_GAIN * self._lux()
+            - COLLECTOR_LOSS * (self._manifold - config.ambient)
+        ) * seconds
+        if self._solenoid_mode == 2:
+            self._switches["bPumpOn"] = int(
+                self._manifold - self._water > PUMP_START_DELTA
+            )
+        if self._switches["bPumpOn"]:
+            transfer = min(1.0, PUMP_TRANSFER * seconds) * (self._manifold - self._water)
+            self._water += transfer / 4
+            self._manifold -= transfer
+        if self._switches["bElementOn"]:
+            self._water += ELEMENT_POWER * seconds / (mass * WATER_HEAT_CAPACITY)
+        self._water -= TANK_LOSS * (self._water - config.ambient) * seconds
+        self._hours += seconds / 3600
+
+    def _status(self) -> dict[str, Any]:
+        """Return the status payload of the current model state."""
+        config = self.config
+        lux = self._lux()
+        element = self._switches["bElementOn"]
+        pump = self._switches["bPumpOn"]
+        holiday = self._switches["bHolidayMode"]
+        stored = config.tank_size * (self._water - config.inlet) / (40 - config.inlet)
+        return {
+            "fWaterTemperature": round(self._water, 1),
+            "fManifoldTemperature": round(self._manifold, 1),
+            "fStoredWater": round(max(0.0, min(stored, config.tank_size * 2)), 0),
+            "bElementOn": element,
+            "bPumpOn": pump,
+            "bHolidayMode": holiday,
+            "eSolenoidMode": self._solenoid_mode,
+            "fSolenoidState": float(self._solenoid_mode == 1),
+            "AllSwitches": bytearray((6, element, pump, holiday, self._solenoid_mode)),
+            "lluTime": self._clock.astimezone().strftime(DEVICE_TIME_FORMAT),
+            "fHours": round(self._hours, 1),
+            "wLux": lux,
+            "wRSSI": -60 - self._random.randint(0, 20),
+            "fPanelVoltage": round(min(48.0, lux / 1500), 1),
+            "fChipTemp": round(35 + lux / 9000 + self._random.uniform(-0.3, 0.3), 1),
+            "fWaterLevel": 1.0,
+            "fTankSize": config.tank_size,
+            "bPanelFaultCode": 0,
+            "bElementFaultCode": 0,
+            "bPumpFultCode": 0,
+            "bSolenoidFaultCode": 0,
+        }
+
+
+async def _async_run_fleet(args: argparse.Namespace) -> dict[str, Any]:
+    """Run simulated devices behind real coordinators and collect results."""
+    config = SimulationConfig(
+        push_rate=args.push_rate,
+        connect_latency=args.connect_latency,
+        connect_failure_rate=args.connect_failures,
+        packet_loss=args.packet_loss,
+        jitter=args.jitter,
+        time_scale=args.time_scale,
+    )
+    sources = {
+        f"AA:BB:CC:DD:{index // 256:02X}:{index % 256:02X}": f"proxy{index % args.adapters}"
+        for index in range(args.devices)
+    }
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        scheduler = UbersolarConnectionScheduler(DEFAULT_CONNECTION_SLOTS)
+        links = LinkCounter()
+        devices: list[SimulatedUberSmart] = []
+        coordinators: list[UbersolarDataUpdateCoordinator] = []
+        writes = 0
+
+        def _count_write() -> None:
+            nonlocal writes
+            writes += 1
+
+        for index, address in enumerate(sources):
+            device = SimulatedUberSmart(
+                address,
+                config=config,
+                seed=index,
+                source=sources[address],
+                links=links,
+            )
+            coordinator = UbersolarDataUpdateCoordinator(
+                hass=hass,
+                ble_device=BLEDevice(address, device.name, None),
+                device=device,
+                scheduler=scheduler,
+                base_unique_id=address,
+                device_name=device.name,
+            )
+            # Stands in for the advertisements of a unit heard through its proxy.
+            coordinator.advertisement_source = sources[address]
+            coordinator.async_add_listener(_count_write)
+            coordinator.async_add_key_listener(("fWaterTemperature",), _count_write)
+            devices.append(device)
+            coordinators.append(coordinator)
+
+        started = time.monotonic()
+        await asyncio.gather(
+            *(coordinator.async_refresh() for coordinator in coordinators)
+        )
+        await asyncio.sleep(max(0.0, args.duration - (time.monotonic() - started)))
+
+        result = {
+            "devices": args.devices,
+            "duration": round(time.monotonic() - started, 1),
+            "connects": sum(device.connects for device in devices),
+            "connect_failures": sum(device.connect_failures for device in devices),
+            "pushes_sent": sum(device.pushes_sent for device in devices),
+            "pushes_lost": sum(device.pushes_lost for device in devices),
+            "failed_coordinators": sum(
+                not coordinator.last_update_success for coordinator in coordinators
+            ),
+            "breaker_trips": sum(coordinator.breaker.trips for coordinator in coordinators),
+            "listener_calls": writes,
+            "peak_links": links.peak,
+            "scheduler": scheduler.as_dict(),
+        }
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+    return result
+
+
+def main() -> int:
+    """Run a simulated fleet and print what happened."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=6)
+    parser.add_argument("--adapters", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=120.0)
+    parser.add_argument("--push-rate", type=float, default=1.0)
+    parser.add_argument("--connect-latency", type=float, default=1.0)
+    parser.add_argument("--connect-failures", type=float, default=0.0)
+    parser.add_argument("--packet-loss", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.2)
+    parser.add_argument("--time-scale", type=float, default=1.0)
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+    result = asyncio.run(_async_run_fleet(args))
+    for key, value in result.items():
+        print(f"{key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""Fixtures for the UberSolar tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+from bleak.backends.device import BLEDevice
+import pytest
+
+from custom_components.ubersolar.const import DEFAULT_CONNECTION_SLOTS
+from custom_components.ubersolar.coordinator import UbersolarDataUpdateCoordinator
+from custom_components.ubersolar.scheduler import UbersolarConnectionScheduler
+from homeassistant.core import HomeAssistant
+from script.fake_device import ADDRESS, NAME, FakeUberSmart
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Let Home Assistant load the integration from custom_components."""
+
+
+@pytest.fixture
+def device() -> FakeUberSmart:
+    """Return a fake UberSmart with the default status."""
+    return FakeUberSmart()
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, device: FakeUberSmart
+) -> AsyncGenerator[UbersolarDataUpdateCoordinator]:
+    """Return a coordinator that already received the initial push."""
+    coordinator = UbersolarDataUpdateCoordinator(
+        hass=hass,
+        ble_device=BLEDevice(ADDRESS, NAME, None, rssi=-60),
+        device=device,
+        scheduler=UbersolarConnectionScheduler(DEFAULT_CONNECTION_SLOTS),
+        base_unique_id="test",
+        device_name=NAME,
+    )
+    device.push()
+    yield coordinator
+    await coordinator.async_shutdown()
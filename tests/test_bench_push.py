@@ -0,0 +1,33 @@
+"""Tests for the budget checks of the push path benchmarks."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from script.bench_push import BUDGETS, Result, _check
+
+
+def _result(wall_us: float, writes: float = 1) -> Result:
+    return Result(
+        scenario="push_single_field",
+        iterations=10,
+        wall_us=wall_us,
+        peak_bytes=100,
+        writes=writes,
+    )
+
+
+def test_wall_time_is_only_checked_against_a_baseline() -> None:
+    """Slow machines don't fail; a regression against a saved run does."""
+    slow = _result(wall_us=1e6)
+    assert _check([slow], None, 0.25) == []
+
+    baseline = {slow.scenario: asdict(_result(wall_us=100))}
+    assert _check([_result(wall_us=120)], baseline, 0.25) == []
+    assert _check([_result(wall_us=130)], baseline, 0.25)
+
+
+def test_extra_writes_fail() -> None:
+    """Writing more entity states than budgeted fails the run."""
+    budget = BUDGETS["push_single_field"].writes
+    assert _check([_result(wall_us=10, writes=budget + 1)], None, 0.25)
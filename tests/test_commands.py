@@ -0,0 +1,131 @@
+"""Tests for the command queue."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.ubersolar.const import (
+    COMMAND_COALESCE_DELAY,
+    DEFAULT_CONNECTION_SLOTS,
+)
+from custom_components.ubersolar.coordinator import UbersolarDataUpdateCoordinator
+from script.fake_device import DEVICE_TIME_FORMAT, FakeUberSmart
+
+CLOCK = datetime(2026, 3, 1, 8, 30, tzinfo=UTC)
+
+
+async def test_writes_are_merged_into_one_command(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """Writes queued together are sent as one switch state and read back once."""
+    updates = device.updates
+    await asyncio.gather(
+        coordinator.commands.async_set_switches({"bPumpOn": 1}),
+        coordinator.commands.async_set_switches({"bHolidayMode": 1}),
+        coordinator.commands.async_set_switches({"bElementOn": 1}),
+    )
+
+    # Turning the element on turns the pump off again.
+    assert device.commands == [("toggle_switches_all", "01000102")]
+    assert device.updates == updates + 1
+    assert coordinator.data["bElementOn"] == 1
+    assert coordinator.data["bHolidayMode"] == 1
+
+
+async def test_switches_and_clock_share_one_session(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """A batch with a clock write sends both through the public commands."""
+    await coordinator.commands.async_apply({"bPumpOn": 1}, CLOCK)
+
+    assert device.commands == [
+        ("set_time", CLOCK),
+        ("toggle_switches_all", "00010002"),
+    ]
+    assert coordinator.data["lluTime"] == CLOCK.astimezone().strftime(
+        DEVICE_TIME_FORMAT
+    )
+
+
+async def test_clock_only_write(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """A clock write on its own is read back by set_time."""
+    updates = device.updates
+    await coordinator.commands.async_set_time(CLOCK)
+
+    assert device.commands == [("set_time", CLOCK)]
+    assert device.updates == updates + 1
+
+
+async def test_cancelled_caller_does_not_cancel_the_batch(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """Callers sharing a batch still get it sent when one of them gives up."""
+    first = asyncio.create_task(coordinator.commands.async_set_switches({"bPumpOn": 1}))
+    second = asyncio.create_task(
+        coordinator.commands.async_set_switches({"bHolidayMode": 1})
+    )
+    await asyncio.sleep(0)
+    first.cancel()
+
+    results = await asyncio.gather(first, second, return_exceptions=True)
+
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1] is None
+    assert device.commands == [("toggle_switches_all", "00010102")]
+
+
+async def test_failure_reaches_every_caller(
+    coordinator: UbersolarDataUpdateCoordinator,
+    device: FakeUberSmart,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A failed batch fails each caller that waited for it."""
+
+    async def fail(switches: str) -> None:
+        raise RuntimeError("write failed")
+
+    monkeypatch.setattr(device, "toggle_switches_all", fail)
+    results = await asyncio.gather(
+        coordinator.commands.async_set_switches({"bPumpOn": 1}),
+        coordinator.commands.async_set_switches({"bHolidayMode": 1}),
+        return_exceptions=True,
+    )
+
+    assert [str(result) for result in results] == ["write failed", "write failed"]
+    assert not coordinator.commands.busy
+
+
+async def test_command_moves_its_devices_queued_poll_up(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """A command behind its device's queued poll doesn't wait for other polls."""
+    device._client = SimpleNamespace(is_connected=True)  # type: ignore[attr-defined]
+    scheduler = coordinator.scheduler
+    source = coordinator.connection_source
+    held = [
+        await scheduler.async_acquire(source, f"busy {index}")
+        for index in range(DEFAULT_CONNECTION_SLOTS)
+    ]
+    other = asyncio.create_task(scheduler.async_acquire(source, "other poll"))
+    await asyncio.sleep(0)
+    poll = asyncio.create_task(coordinator.async_poll_now())
+    await asyncio.sleep(0)
+    command = asyncio.create_task(
+        coordinator.commands.async_set_switches({"bPumpOn": 1})
+    )
+    await asyncio.sleep(COMMAND_COALESCE_DELAY * 2)
+
+    held[0].release()
+    await asyncio.wait_for(asyncio.gather(poll, command), 1)
+
+    assert not other.done()
+    assert device.commands == [("toggle_switches_all", "00010002")]
+    other.cancel()
+    for lease in held:
+        lease.release()
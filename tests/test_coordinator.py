@@ -0,0 +1,220 @@
+"""Tests for the push handling of the coordinator."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+
+from bleak.backends.device import BLEDevice
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from pyubersolar import UberSmart
+
+from custom_components.ubersolar.const import (
+    DEFAULT_CONNECTION_SLOTS,
+    POLL_REASON_PUSH_GAP,
+    POLL_REASON_PUSH_ONLY,
+    PUSH_CADENCE_MIN_SAMPLES,
+    PUSH_HEALTHY_WINDOW,
+)
+from custom_components.ubersolar.coordinator import UbersolarDataUpdateCoordinator
+from custom_components.ubersolar.scheduler import UbersolarConnectionScheduler
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from script.fake_device import ADDRESS, NAME, FakeUberSmart
+
+
+async def test_identical_push_is_skipped(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """A push without changes neither builds a snapshot nor wakes listeners."""
+    calls: list[str] = []
+    coordinator.async_add_key_listener(("wLux",), lambda: calls.append("wLux"))
+    snapshot = coordinator.data
+
+    device.push()
+
+    assert coordinator.data is snapshot
+    assert coordinator.stats.pushes_skipped == 1
+    assert calls == []
+
+
+async def test_only_listeners_of_changed_keys_are_called(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """Each listener is called once per push, however many of its keys changed."""
+    calls: list[str] = []
+    coordinator.async_add_key_listener(
+        ("wLux", "fPanelVoltage"), lambda: calls.append("panel")
+    )
+    coordinator.async_add_key_listener(("wLux",), lambda: calls.append("lux"))
+    coordinator.async_add_key_listener(
+        ("fWaterTemperature",), lambda: calls.append("water")
+    )
+
+    device.push({"wLux": 50000, "fPanelVoltage": 50.0})
+
+    assert sorted(calls) == ["lux", "panel"]
+    assert coordinator.data["wLux"] == 50000
+
+
+async def test_removed_key_listener_is_not_called(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """Removing a listener unsubscribes it from all of its keys."""
+    calls: list[str] = []
+    remove = coordinator.async_add_key_listener(
+        ("wLux", "fPanelVoltage"), lambda: calls.append("panel")
+    )
+    remove()
+
+    device.push({"wLux": 50000, "fPanelVoltage": 50.0})
+
+    assert calls == []
+
+
+async def test_update_skips_poll_while_pushes_arrive(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """Scheduled updates don't poll when the library says pushes suffice."""
+    updates = device.updates
+
+    await coordinator._async_update_data()
+    assert device.updates == updates
+    assert coordinator.stats.polls_skipped == 1
+
+    device.poll_is_needed = True
+    await coordinator._async_update_data()
+    assert device.updates == updates + 1
+    assert coordinator.stats.polls == 1
+
+
+async def test_delta_and_history_hold_only_changed_fields(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """Delta listeners and the history see the fields a push changed."""
+    deltas: list[dict[str, Any]] = []
+    coordinator.async_add_delta_listener(lambda _now, delta: deltas.append(delta))
+    samples = coordinator.history.as_dict()["samples"]
+
+    device.push({"wLux": 50000})
+
+    assert deltas == [{"wLux": 50000}]
+    history = coordinator.history.as_dict()["samples"]
+    assert history["wLux"] == samples["wLux"] + 1
+    assert history["fWaterTemperature"] == samples["fWaterTemperature"]
+
+
+async def test_poll_notifies_changed_keys_once(
+    coordinator: UbersolarDataUpdateCoordinator,
+    device: FakeUberSmart,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Pushes during a poll wake only the listeners of changed keys, once."""
+    calls: list[str] = []
+    coordinator.async_add_listener(lambda: calls.append("all"))
+    coordinator.async_add_key_listener(("wLux",), lambda: calls.append("lux"))
+    coordinator.async_add_key_listener(
+        ("fWaterTemperature",), lambda: calls.append("water")
+    )
+
+    async def update() -> dict[str, dict[str, Any]]:
+        device.push({"wLux": 50000})
+        device.push({"wLux": 51000})
+        return device.status_data
+
+    monkeypatch.setattr(device, "update", update)
+    device.poll_is_needed = True
+    await coordinator.async_refresh()
+
+    assert calls == ["lux"]
+    assert coordinator.data["wLux"] == 51000
+
+
+async def test_ble_device_reaches_the_library(hass: HomeAssistant) -> None:
+    """The adapter switch relies on the private BLE device attribute of UberSmart."""
+    device = UberSmart(device=BLEDevice(ADDRESS, NAME, None, rssi=-60))
+    assert hasattr(device, "_device"), "pyubersolar no longer stores _device"
+    coordinator = UbersolarDataUpdateCoordinator(
+        hass=hass,
+        ble_device=BLEDevice(ADDRESS, NAME, None, rssi=-60),
+        device=device,
+        scheduler=UbersolarConnectionScheduler(DEFAULT_CONNECTION_SLOTS),
+        base_unique_id="test",
+        device_name=NAME,
+    )
+
+    coordinator.ble_device = BLEDevice(ADDRESS, NAME, "proxy", rssi=-50)
+    coordinator._async_apply_ble_device()
+
+    assert device._device is coordinator.ble_device
+    await coordinator.async_shutdown()
+
+
+def _push_cadence_samples(device: FakeUberSmart) -> None:
+    """Send enough unsolicited pushes to learn the push cadence."""
+    for index in range(PUSH_CADENCE_MIN_SAMPLES + 1):
+        device.push({"wLux": index})
+
+
+def _fire_push_watchdog(
+    hass: HomeAssistant, coordinator: UbersolarDataUpdateCoordinator
+) -> None:
+    """Let the push watchdog run as if no push came in for a while."""
+    last_push = coordinator._last_unsolicited_push_monotonic
+    assert last_push is not None
+    coordinator._last_unsolicited_push_monotonic = last_push - PUSH_HEALTHY_WINDOW
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=PUSH_HEALTHY_WINDOW + 1)
+    )
+
+
+async def test_cadence_is_not_learned_without_an_open_link(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """Pushes seen while the link is down don't enable push-only mode."""
+    _push_cadence_samples(device)
+
+    assert coordinator.push_cadence is None
+    assert coordinator.poll_interval_reason != POLL_REASON_PUSH_ONLY
+
+
+async def test_push_only_ends_quietly_when_the_link_closes(
+    hass: HomeAssistant,
+    coordinator: UbersolarDataUpdateCoordinator,
+    device: FakeUberSmart,
+) -> None:
+    """The silence after the library closed the link is not a push gap."""
+    client = SimpleNamespace(is_connected=True)
+    device._client = client  # type: ignore[attr-defined]
+    _push_cadence_samples(device)
+    assert coordinator.poll_interval_reason == POLL_REASON_PUSH_ONLY
+    assert coordinator.update_interval is None
+
+    client.is_connected = False
+    _fire_push_watchdog(hass, coordinator)
+
+    assert coordinator.stats.push_gaps == 0
+    assert coordinator.poll_interval_reason not in (
+        POLL_REASON_PUSH_ONLY,
+        POLL_REASON_PUSH_GAP,
+    )
+    assert coordinator.update_interval is not None
+
+
+async def test_push_gap_on_an_open_link_polls(
+    hass: HomeAssistant,
+    coordinator: UbersolarDataUpdateCoordinator,
+    device: FakeUberSmart,
+) -> None:
+    """Pushes stopping while the link is still held trip the watchdog."""
+    device._client = SimpleNamespace(is_connected=True)  # type: ignore[attr-defined]
+    _push_cadence_samples(device)
+    updates = device.updates
+
+    _fire_push_watchdog(hass, coordinator)
+    await hass.async_block_till_done()
+
+    assert coordinator.stats.push_gaps == 1
+    assert device.updates == updates + 1
@@ -0,0 +1,45 @@
+"""Tests for the state of the UberSolar switch and select entities."""
+
+from __future__ import annotations
+
+from bleak.backends.device import BLEDevice
+
+from custom_components.ubersolar.const import DEFAULT_CONNECTION_SLOTS
+from custom_components.ubersolar.coordinator import UbersolarDataUpdateCoordinator
+from custom_components.ubersolar.scheduler import UbersolarConnectionScheduler
+from custom_components.ubersolar.select import SELECT_TYPE, UbersmartSelect
+from custom_components.ubersolar.switch import UbersmartSwitch
+from homeassistant.core import HomeAssistant
+from script.fake_device import ADDRESS, NAME, FakeUberSmart
+
+
+async def test_state_is_unknown_before_the_first_push(
+    hass: HomeAssistant, device: FakeUberSmart
+) -> None:
+    """Entities report no state, not off, until the device sent its status."""
+    coordinator = UbersolarDataUpdateCoordinator(
+        hass=hass,
+        ble_device=BLEDevice(ADDRESS, NAME, None, rssi=-60),
+        device=device,
+        scheduler=UbersolarConnectionScheduler(DEFAULT_CONNECTION_SLOTS),
+        base_unique_id="test",
+        device_name=NAME,
+    )
+
+    assert UbersmartSwitch(coordinator, "bPumpOn").is_on is None
+    assert UbersmartSelect(coordinator).current_option is None
+
+    await coordinator.async_shutdown()
+
+
+async def test_state_follows_the_pushed_status(
+    coordinator: UbersolarDataUpdateCoordinator,
+) -> None:
+    """Entities built after the first push report the device status."""
+    switch = UbersmartSwitch(coordinator, "bPumpOn")
+    select = UbersmartSelect(coordinator)
+
+    assert switch.is_on is bool(coordinator.data["bPumpOn"])
+    assert select.current_option == SELECT_TYPE.options[
+        coordinator.data["eSolenoidMode"]
+    ]
@@ -0,0 +1,44 @@
+"""Tests for the raw push history."""
+
+from __future__ import annotations
+
+from custom_components.ubersolar.history import UbersolarHistory
+
+
+def test_mean_is_weighted_by_time_held() -> None:
+    """A value counts for as long as it was held, including into the window."""
+    history = UbersolarHistory(("wLux",), 8)
+    history.record({"wLux": 10, "fPanelVoltage": 1.0}, 0.0)
+    history.record({"wLux": 20}, 90.0)
+
+    summary = history.summary("wLux", 50.0, 100.0)
+
+    assert summary is not None
+    assert summary.count == 1
+    assert (summary.minimum, summary.maximum) == (10.0, 20.0)
+    assert summary.mean == (10 * 40 + 20 * 10) / 50
+
+
+def test_steady_value_is_its_own_summary() -> None:
+    """A window without changes reports the value held throughout."""
+    history = UbersolarHistory(("wLux",), 8)
+    assert history.summary("wLux", 0.0, 10.0) is None
+
+    history.record({"wLux": 10}, 0.0)
+    summary = history.summary("wLux", 50.0, 100.0)
+
+    assert summary is not None
+    assert (summary.count, summary.mean) == (0, 10.0)
+
+
+def test_full_ring_covers_the_retained_span() -> None:
+    """Once the ring wrapped, the summary spans the samples it still holds."""
+    history = UbersolarHistory(("wLux",), 4)
+    for second in range(6):
+        history.record({"wLux": second}, float(second))
+
+    summary = history.summary("wLux", 0.0, 10.0)
+
+    assert summary is not None
+    assert (summary.count, summary.minimum) == (4, 2.0)
+    assert summary.mean == (2 + 3 + 4 + 5 * 5) / 8
@@ -0,0 +1,59 @@
+"""Check that importing the integration doesn't load what it only needs later."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+PACKAGE = "custom_components.ubersolar"
+ROOT = Path(__file__).parent.parent
+
+# Only needed once a device, a service call or an option is set up.
+DEFERRED = (
+    "pyubersolar",
+    f"{PACKAGE}.push_log",
+    f"{PACKAGE}.statistics",
+    "homeassistant.components.recorder",
+)
+
+
+def _imported_modules(module: str) -> set[str]:
+    """Import a module in a fresh interpreter and return every loaded module."""
+    code = f"import json, sys\nimport {module}\nprint(json.dumps(sorted(sys.modules)))\n"
+    process = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    return set(json.loads(process.stdout))
+
+
+def _loaded(modules: set[str], deferred: tuple[str, ...]) -> list[str]:
+    return sorted(
+        module
+        for module in modules
+        if any(module == name or module.startswith(f"{name}.") for name in deferred)
+    )
+
+
+def test_integration_defers_services() -> None:
+    """Loading the integration leaves device, service and option code unloaded."""
+    modules = _imported_modules(PACKAGE)
+    assert not _loaded(
+        modules, (*DEFERRED, f"{PACKAGE}.services", f"{PACKAGE}.websocket_api")
+    )
+
+
+@pytest.mark.parametrize(
+    "platform", ["config_flow", "datetime", "diagnostics", "select", "sensor", "switch"]
+)
+def test_platform_defers_device_library(platform: str) -> None:
+    """Loading a platform doesn't pull in the device library or the recorder."""
+    modules = _imported_modules(f"{PACKAGE}.{platform}")
+    assert not _loaded(modules, DEFERRED)
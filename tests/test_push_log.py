@@ -0,0 +1,61 @@
+"""Tests for the retention of the push log."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from custom_components.ubersolar.const import (
+    DEFAULT_PUSH_LOG_DAYS,
+    PUSH_LOG_BYTES_PER_PUSH,
+    PUSH_LOG_FILE_SIZE,
+    PUSH_LOG_PUSH_RATE,
+)
+from custom_components.ubersolar.push_log import (
+    PushLogWriter,
+    next_file_index,
+    retained_files,
+    write_chunks,
+)
+
+PUSHES = 1000
+
+
+def test_record_size_matches_the_sizing() -> None:
+    """A push changing the clock and one field takes the size retention assumes."""
+    writer = PushLogWriter(0)
+    for index in range(PUSHES):
+        writer.encode(
+            float(index),
+            float(index),
+            {"lluTime": f"2026-01-01 12:00:{index % 60:02d}", "wLux": index},
+        )
+
+    # The file header and field definitions add a little on top.
+    assert writer.as_dict()["bytes_per_push"] == pytest.approx(
+        PUSH_LOG_BYTES_PER_PUSH, abs=1
+    )
+
+
+def test_retained_files_hold_the_window() -> None:
+    """The completed files kept cover the configured number of days."""
+    days = DEFAULT_PUSH_LOG_DAYS
+    needed = days * 86400 * PUSH_LOG_PUSH_RATE * PUSH_LOG_BYTES_PER_PUSH
+
+    assert (retained_files(days) - 1) * PUSH_LOG_FILE_SIZE >= needed
+    assert (retained_files(days) - 2) * PUSH_LOG_FILE_SIZE < needed
+
+
+def test_oldest_files_are_deleted(tmp_path: Path) -> None:
+    """Only the newest files up to the cap are kept."""
+    max_files = retained_files(1)
+    write_chunks(
+        tmp_path,
+        [(index, b"push") for index in range(max_files * 2)],
+        max_files,
+    )
+
+    files = sorted(path.name for path in tmp_path.iterdir())
+    assert len(files) == max_files
+    assert next_file_index(tmp_path) == max_files * 2
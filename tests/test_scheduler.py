@@ -0,0 +1,89 @@
+"""Tests for the connection scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.ubersolar.scheduler import UbersolarConnectionScheduler
+
+SOURCE = "proxy"
+
+
+async def test_slots_are_limited_per_adapter() -> None:
+    """A full adapter makes callers wait; other adapters are unaffected."""
+    scheduler = UbersolarConnectionScheduler(2)
+    first = await scheduler.async_acquire(SOURCE, "first")
+    await scheduler.async_acquire(SOURCE, "second")
+    await scheduler.async_acquire("other", "third")
+
+    waiting = asyncio.create_task(scheduler.async_acquire(SOURCE, "fourth"))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    assert scheduler.as_dict()[SOURCE]["waiting"] == 1
+
+    first.release()
+    lease = await waiting
+    assert lease.source == SOURCE
+    assert scheduler.as_dict()[SOURCE]["in_use"] == 2
+
+
+async def test_urgent_callers_are_served_first() -> None:
+    """Commands jump ahead of polls; equal priorities are served in order."""
+    scheduler = UbersolarConnectionScheduler(1)
+    held = await scheduler.async_acquire(SOURCE, "held")
+    order: list[str] = []
+
+    async def acquire(name: str, urgent: bool) -> None:
+        lease = await scheduler.async_acquire(SOURCE, name, urgent=urgent)
+        order.append(name)
+        lease.release()
+
+    tasks = [
+        asyncio.create_task(acquire("poll 1", False)),
+        asyncio.create_task(acquire("poll 2", False)),
+        asyncio.create_task(acquire("command", True)),
+    ]
+    await asyncio.sleep(0)
+    held.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["command", "poll 1", "poll 2"]
+
+
+async def test_cancelled_waiter_does_not_leak_a_slot() -> None:
+    """A caller that gives up while queued leaves the slot count intact."""
+    scheduler = UbersolarConnectionScheduler(1)
+    held = await scheduler.async_acquire(SOURCE, "held")
+    waiting = asyncio.create_task(scheduler.async_acquire(SOURCE, "gone"))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+
+    held.release()
+    held.release()
+    assert held.released
+    assert scheduler.as_dict()[SOURCE]["in_use"] == 0
+
+    lease = await asyncio.wait_for(scheduler.async_acquire(SOURCE, "next"), 1)
+    assert not lease.released
+
+
+async def test_expedited_poll_is_served_like_a_command() -> None:
+    """A device's queued poll moves ahead of other polls when expedited."""
+    scheduler = UbersolarConnectionScheduler(1)
+    held = await scheduler.async_acquire(SOURCE, "held")
+    order: list[str] = []
+
+    async def acquire(name: str) -> None:
+        lease = await scheduler.async_acquire(SOURCE, name)
+        order.append(name)
+        lease.release()
+
+    tasks = [asyncio.create_task(acquire(name)) for name in ("other", "device")]
+    await asyncio.sleep(0)
+    scheduler.async_expedite(SOURCE, "device")
+    assert scheduler.as_dict()[SOURCE]["waiting"] == 2
+
+    held.release()
+    await asyncio.gather(*tasks)
+    assert order == ["device", "other"]
@@ -0,0 +1,76 @@
+"""Tests for the state filter of the UberSolar sensors."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import (
+    MockEntityPlatform,
+    async_fire_time_changed,
+)
+
+from custom_components.ubersolar.const import (
+    DEFAULT_LUX_DEADBAND,
+    DEFAULT_SENSOR_MAX_INTERVAL,
+)
+from custom_components.ubersolar.coordinator import UbersolarDataUpdateCoordinator
+from custom_components.ubersolar.sensor import (
+    COORDINATOR_SENSOR_TYPES,
+    UbersolarCoordinatorSensor,
+    UbersolarSensor,
+)
+from homeassistant.components.sensor import SensorStateClass
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from script.fake_device import FakeUberSmart
+
+
+async def test_filtered_value_is_published_after_max_interval(
+    hass: HomeAssistant,
+    coordinator: UbersolarDataUpdateCoordinator,
+    device: FakeUberSmart,
+) -> None:
+    """A change inside the deadband is written once max_interval passed."""
+    sensor = UbersolarSensor(coordinator, "wLux")
+    await MockEntityPlatform(hass).async_add_entities([sensor])
+    assert sensor.entity_id is not None
+    lux = coordinator.data["wLux"] + DEFAULT_LUX_DEADBAND
+    device.push({"wLux": lux})
+    await hass.async_block_till_done()
+
+    device.push({"wLux": lux + 1})
+    await hass.async_block_till_done()
+
+    state = hass.states.get(sensor.entity_id)
+    assert state is not None
+    assert state.state == str(lux)
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_SENSOR_MAX_INTERVAL + 1)
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get(sensor.entity_id)
+    assert state is not None
+    assert state.state == str(lux + 1)
+
+    await sensor.async_remove()
+
+
+async def test_initial_push_timeouts_is_a_diagnostic_counter(
+    coordinator: UbersolarDataUpdateCoordinator,
+) -> None:
+    """The initial push timeouts are exposed like the other coordinator counters."""
+    description = next(
+        description
+        for description in COORDINATOR_SENSOR_TYPES
+        if description.key == "initial_push_timeouts"
+    )
+    assert description.entity_category is EntityCategory.DIAGNOSTIC
+    assert description.state_class is SensorStateClass.TOTAL_INCREASING
+
+    coordinator.stats.initial_push_timeouts += 1
+    sensor = UbersolarCoordinatorSensor(coordinator, description)
+
+    assert sensor.native_value == coordinator.stats.initial_push_timeouts
@@ -0,0 +1,72 @@
+"""Tests for the write confirmation of the services."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from datetime import UTC, datetime
+import time
+
+import pytest
+
+from custom_components.ubersolar import services
+from custom_components.ubersolar.coordinator import UbersolarDataUpdateCoordinator
+from custom_components.ubersolar.datetime import UbersmartDateTime
+from script.fake_device import FakeUberSmart
+
+CLOCK = datetime(2026, 3, 1, 8, 30, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def short_confirm_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fall back to polling right away."""
+    monkeypatch.setattr(services, "CONFIRM_TIMEOUT", 0.01)
+
+
+@pytest.fixture
+def host_time_zone(monkeypatch: pytest.MonkeyPatch) -> Generator[None]:
+    """Run the host in a time zone two hours ahead of UTC."""
+    monkeypatch.setenv("TZ", "Africa/Johannesburg")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+async def test_clock_write_is_confirmed(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """A clock-only write is confirmed by the reported time."""
+    await coordinator.commands.async_set_time(CLOCK)
+
+    assert await services.async_confirm(coordinator, {}, CLOCK)
+
+
+async def test_unapplied_clock_write_is_not_confirmed(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """A clock the device didn't take is polled for and reported unconfirmed."""
+    updates = device.updates
+
+    assert not await services.async_confirm(coordinator, {}, CLOCK)
+    assert device.updates == updates + 1
+
+
+async def test_switch_write_is_polled_for(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """A write that no push reported is read back with a poll."""
+    device.status_data[device.get_address()]["bPumpOn"] = 1
+
+    assert await services.async_confirm(coordinator, {"bPumpOn": 1})
+
+
+@pytest.mark.usefixtures("host_time_zone")
+async def test_clock_is_read_in_host_local_time(
+    coordinator: UbersolarDataUpdateCoordinator, device: FakeUberSmart
+) -> None:
+    """The library reports the clock in host-local time, not UTC."""
+    await coordinator.commands.async_set_time(CLOCK)
+
+    assert coordinator.data["lluTime"] == "2026-03-01 10:30:00"
+    assert UbersmartDateTime(coordinator).native_value == CLOCK
+    assert await services.async_confirm(coordinator, {}, CLOCK)
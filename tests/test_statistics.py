@@ -0,0 +1,56 @@
+"""Tests for the hourly statistics import."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.ubersolar import statistics
+from custom_components.ubersolar.coordinator import UbersolarDataUpdateCoordinator
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from script.fake_device import FakeUberSmart
+
+HOUR = statistics.HOUR
+START = 1_780_000_000 // HOUR * HOUR
+
+
+async def test_missed_hour_gets_its_own_row(
+    hass: HomeAssistant,
+    coordinator: UbersolarDataUpdateCoordinator,
+    device: FakeUberSmart,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Every completed hour is imported with its own start, even without pushes."""
+    clock = SimpleNamespace(now=START + HOUR / 6)
+    monkeypatch.setattr(statistics, "time", SimpleNamespace(time=lambda: clock.now))
+    imported: dict[str, list[Any]] = {}
+    monkeypatch.setattr(
+        statistics,
+        "async_add_external_statistics",
+        lambda _hass, metadata, rows: imported.setdefault(
+            metadata["statistic_id"], []
+        ).extend(rows),
+    )
+    importer = statistics.UbersolarStatisticsImporter(hass, coordinator)
+    stop = importer.async_start()
+    lux = coordinator.data["wLux"]
+
+    clock.now = START + HOUR / 2
+    device.push({"wLux": 0})
+    # The next push comes more than an hour after the first one ended.
+    clock.now = START + 2 * HOUR + 60
+    device.push({"wLux": lux})
+    stop()
+
+    rows = imported["ubersolar:test_wlux"]
+    assert [row["start"] for row in rows] == [
+        dt_util.utc_from_timestamp(START),
+        dt_util.utc_from_timestamp(START + HOUR),
+    ]
+    # Held for 20 of the 50 minutes since the start, then zero.
+    assert rows[0]["mean"] == pytest.approx(lux * 2 / 5)
+    assert (rows[0]["min"], rows[0]["max"]) == (0, lux)
+    assert (rows[1]["mean"], rows[1]["min"], rows[1]["max"]) == (0, 0, 0)